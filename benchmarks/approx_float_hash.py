@@ -0,0 +1,59 @@
+"""
+Times building and querying pmfs keyed by ApproxFloats, as the pmfs of
+quotients of random variables are, with bucket hashing versus the constant hash
+ApproxFloat used to have.
+
+    python -m benchmarks.approx_float_hash [--size 100000]
+
+A constant hash makes every insert and lookup compare against every key, so the
+old scheme is timed on smaller pmfs and extrapolated quadratically to --size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from probs.floats import ApproxFloat, approx_get
+
+
+class ConstantHashFloat(ApproxFloat):
+    def __hash__(self) -> int:
+        return 0
+
+
+def build_and_query(keys: list[float], key_type: type[float]) -> float:
+    """Seconds taken to build a pmf with these keys and look each one up."""
+    start = time.perf_counter()
+    pmf = {key_type(key): 1 / len(keys) for key in keys}
+    for key in keys:
+        # Perturbed by less than the tolerance, as rounding would.
+        approx_get(pmf, key * (1 + 1e-12))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    keys = rng.integers(1, 10**4, args.size) / rng.integers(1, 10**4, args.size)
+    unique = list(dict.fromkeys(keys.tolist()))
+
+    bucketed = build_and_query(unique, ApproxFloat)
+    small = min(len(unique), 2000)
+    constant = build_and_query(unique[:small], ConstantHashFloat)
+    extrapolated = constant * (len(unique) / small) ** 2
+
+    print(f"{len(unique)} keys")
+    print(f"bucket hash:   {bucketed:10.3f} s")
+    print(f"constant hash: {extrapolated:10.3f} s (from {constant:.3f} s at {small})")
+    print(f"speedup:       {extrapolated / bucketed:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Times single-point pdf and cdf calls of the scipy-backed distributions, against
+calling `scipy.stats.<dist>.pdf(x, params...)` directly as they used to.
+
+    python -m benchmarks.scipy_fast_paths [--calls 20000]
+
+Each distribution is evaluated at the same few points in turn, and the mean cost
+per call is reported in microseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any
+
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import (
+    Beta,
+    BetaBinomial,
+    Gamma,
+    InverseGamma,
+    NegativeBinomial,
+    StudentsT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from probs import RandomVariable
+
+# Each distribution with the equivalent scipy distribution and its arguments.
+CASES: tuple[tuple[RandomVariable, Any, tuple[Any, ...], tuple[float, ...]], ...] = (
+    (Beta(2, 3), stats.beta, (2, 3), (0.1, 0.4, 0.7)),
+    (Gamma(2, 3), stats.gamma, (2, 0, 1 / 3), (0.1, 0.6, 2.0)),
+    (InverseGamma(3, 2), stats.invgamma, (3, 0, 2), (0.3, 1.0, 4.0)),
+    (StudentsT(4), stats.t, (4,), (-2.0, 0.1, 1.5)),
+    (NegativeBinomial(r=3, p=0.4), stats.nbinom, (3, 0.4), (0, 4, 11)),
+    (BetaBinomial(n=20, alpha=2, beta=3), stats.betabinom, (20, 2, 3), (1, 8, 15)),
+)
+
+
+def per_call(
+    func: Callable[[float], Any], points: tuple[float, ...], calls: int
+) -> float:
+    """Mean microseconds per call of func, cycling through points."""
+    rounds = calls // len(points)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for x in points:
+            func(x)
+    return (time.perf_counter() - start) / (rounds * len(points)) * 1e6
+
+
+def bind(func: Callable[..., Any], params: tuple[Any, ...]) -> Callable[[float], Any]:
+    return lambda x: func(x, *params)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'':20} {'pdf':>8} {'scipy':>8} {'cdf':>8} {'scipy':>8}  (µs/call)")
+    for rv, dist, params, points in CASES:
+        pdf = per_call(rv.pdf, points, args.calls)
+        cdf = per_call(rv.cdf, points, args.calls)
+        pmf = dist.pmf if hasattr(dist, "pmf") else dist.pdf
+        scipy_pdf = per_call(bind(pmf, params), points, args.calls)
+        scipy_cdf = per_call(bind(dist.cdf, params), points, args.calls)
+        name = type(rv).__name__
+        print(f"{name:20} {pdf:8.2f} {scipy_pdf:8.2f} {cdf:8.2f} {scipy_cdf:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
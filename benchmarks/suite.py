@@ -0,0 +1,294 @@
+"""
+Times the hot paths of probs and writes the results as JSON, so that runs on
+different commits can be compared.
+
+    python -m benchmarks.suite [--output results.json] [--baseline FILE]
+        [--threshold 1.5] [--filter SUBSTRING]
+
+Each benchmark reports the fastest of several repeats, in seconds per call.
+With --baseline, every benchmark that got more than --threshold times slower
+than the baseline is flagged, and the exit status is 1 if there are any.
+benchmarks/baseline.json is the stored baseline; regenerate it with
+--output benchmarks/baseline.json when an intended change moves the numbers, on
+the same machine the comparisons will be run on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import operator
+import platform
+import subprocess
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import scipy  # type: ignore[import-untyped]
+
+from probs import (
+    Bernoulli,
+    Beta,
+    BetaBinomial,
+    Binomial,
+    ContinuousRV,
+    DiscreteRV,
+    Exponential,
+    Gamma,
+    Geometric,
+    InverseGamma,
+    Laplace,
+    Lomax,
+    Mixture,
+    NegativeBinomial,
+    Normal,
+    P,
+    Poisson,
+    StudentsT,
+    Uniform,
+    saddlepoint,
+)
+from probs.discrete.dice_roll import DiceRoll
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from probs import RandomVariable
+
+BASELINE = Path(__file__).parent / "baseline.json"
+# Version of the results format, bumped if it changes incompatibly.
+FORMAT = 1
+
+# Each family with a point inside its support and a grid of points for arrays.
+FAMILIES: tuple[tuple[RandomVariable, float, Any], ...] = (
+    (Normal(1, 2), 0.5, np.linspace(-5, 5, 1000)),
+    (Uniform(0, 2), 0.5, np.linspace(-1, 3, 1000)),
+    (Exponential(2), 0.5, np.linspace(0, 5, 1000)),
+    (Laplace(1, 2), 0.5, np.linspace(-5, 5, 1000)),
+    (Lomax(2, 3), 0.5, np.linspace(0, 5, 1000)),
+    (Gamma(2, 3), 0.5, np.linspace(0, 5, 1000)),
+    (InverseGamma(3, 2), 0.5, np.linspace(0, 5, 1000)),
+    (Beta(2, 3), 0.5, np.linspace(0, 1, 1000)),
+    (StudentsT(4), 0.5, np.linspace(-5, 5, 1000)),
+    (
+        Mixture((Normal(10, 2), Lomax(20, 3), Exponential(0.5)), (2, 1, 1)),
+        5,
+        np.linspace(0, 50, 1000),
+    ),
+    (Bernoulli(p=0.3), 1, np.arange(-2, 3, dtype=float).repeat(200)),
+    (Binomial(n=20, p=0.3), 6, np.arange(-5, 25, dtype=float).repeat(33)),
+    (Geometric(p=0.3), 3, np.arange(0, 50, dtype=float).repeat(20)),
+    (Poisson(lambda_=4), 3, np.arange(0, 50, dtype=float).repeat(20)),
+    (NegativeBinomial(r=3, p=0.4), 4, np.arange(0, 50, dtype=float).repeat(20)),
+    (BetaBinomial(n=20, alpha=2, beta=3), 8, np.arange(-5, 25, dtype=float).repeat(33)),
+)
+# Supports of the pmfs combined pairwise by DiscreteRV.combine_pmf.
+COMBINE_SIZES = (10, 100, 300)
+# Supports of the dice summed with +, which convolves their lattices.
+SUM_SIZES = (10, 1000, 100000)
+
+
+def uniform_pmf(size: int) -> dict[float, float]:
+    return dict.fromkeys(range(size), 1 / size)
+
+
+def sum_dice(sides: int) -> dict[float, float]:
+    # New random variables each call, since derived pmfs are cached.
+    return (DiceRoll(sides=sides) + DiceRoll(sides=sides)).pmf
+
+
+def long_sum() -> RandomVariable:
+    # New random variables each call, since derived grids are cached.
+    total: RandomVariable = Normal(0, 1)
+    for scale in np.linspace(0.5, 2, 10):
+        for family in (
+            Uniform(0, scale),
+            Exponential(scale),
+            Gamma(2, 2 * scale),
+            Laplace(0, scale),
+            StudentsT(4 + scale),
+        ):
+            total += family
+    return total
+
+
+def benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    """Every benchmark as its name and a function taking no arguments to time."""
+    for rv, point, grid in FAMILIES:
+        name = type(rv).__name__
+        yield f"{name}.pdf[scalar]", partial(rv.pdf, point)
+        yield f"{name}.cdf[scalar]", partial(rv.cdf, point)
+        yield f"{name}.pdf[array]", partial(rv.pdf, grid)
+        yield f"{name}.cdf[array]", partial(rv.cdf, grid)
+    # Counts large enough that the pmf is computed by a series rather than exactly.
+    yield "Binomial.pdf[scalar, large n]", partial(Binomial(n=10**6, p=0.3).pdf, 3e5)
+    yield "Poisson.pdf[scalar, large k]", partial(Poisson(lambda_=1e4).pdf, 1e4)
+
+    for size in COMBINE_SIZES:
+        pmf = uniform_pmf(size)
+        yield (
+            f"DiscreteRV.combine_pmf[{size}]",
+            partial(DiscreteRV.combine_pmf, pmf, pmf, operator.add),
+        )
+    for size in SUM_SIZES:
+        yield f"DiceRoll.__add__.pmf[{size}]", partial(sum_dice, size)
+
+    # Derived continuous random variables, whose pdf is a numerical integral.
+    added = Uniform(0, 1) + Exponential(1)
+    multiplied = Uniform(0, 1) * Uniform(0, 1)
+    yield "ContinuousRV.__add__.pdf", lambda: added.pdf(0.5)
+    yield "ContinuousRV.__mul__.pdf", lambda: multiplied.pdf(0.5)
+    # Products of positive random variables are tabulated in log space, which is
+    # timed here by building a new product each call.
+    yield (
+        "ContinuousRV.__mul__.pdf[positive]",
+        lambda: (Gamma(2, 3) * Beta(2, 3)).pdf(0.5),
+    )
+    # A long sum of different families, inverted from the product of their
+    # characteristic functions. A new sum is built each call.
+    yield "ContinuousRV.__add__.cdf[long]", lambda: long_sum().cdf(0.5)
+    # The cdf of a distribution without a closed form, by quad over its pdf.
+    normal = Normal(0, 1)
+    yield "ContinuousRV.cdf[quad]", lambda: ContinuousRV.cdf(normal, 0.5)
+
+    # Tails of a sum of 10^4 copies at 1000 thresholds.
+    thresholds = np.linspace(3e4, 3.3e4, 1000)
+    yield (
+        "saddlepoint.sf[array]",
+        partial(saddlepoint.sf, Poisson(lambda_=3), thresholds, n=10**4),
+    )
+
+    yield "P(X < Y)[discrete]", lambda: P(DiceRoll(sides=20) < DiceRoll(sides=12))
+    yield "P(X < Y)[continuous]", lambda: P(Normal(0, 1) < Uniform(0, 1))
+
+
+def time_call(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """The fastest of repeat runs of func, in seconds per call."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat, number)) / number
+
+
+def time_import(repeat: int) -> float:
+    """The fastest `import probs` in a fresh interpreter, in seconds."""
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import probs\n"
+        "print(time.perf_counter() - start)"
+    )
+    return min(
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "format": FORMAT,
+        "commit": commit,
+        "date": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> dict[str, float]:
+    """The benchmarks more than threshold times slower than baseline, by ratio."""
+    ratios = {
+        name: seconds / baseline[name]
+        for name, seconds in results.items()
+        if baseline.get(name)
+    }
+    return {name: ratio for name, ratio in ratios.items() if ratio > threshold}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, help="Where to write the results.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE if BASELINE.exists() else None,
+        help="Results to compare with, benchmarks/baseline.json by default.",
+    )
+    parser.add_argument("--threshold", type=float, default=1.5)
+    parser.add_argument("--filter", default="", help="Only run matching names.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline: dict[str, float] = {}
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    timers: dict[str, Callable[[], float]] = {
+        name: partial(time_call, func, args.repeat, args.min_time)
+        for name, func in benchmarks()
+        if args.filter in name
+    }
+    if args.filter in "import probs":
+        timers["import probs"] = partial(time_import, args.repeat)
+
+    results: dict[str, float] = {}
+    for name, timer in timers.items():
+        results[name] = timer()
+        report(name, results[name], baseline.get(name))
+
+    slower = regressions(results, baseline, args.threshold)
+    if slower:
+        # Timings are noisy, so a benchmark only counts as slower if it is slower
+        # again when timed a second time.
+        print(f"\nTiming {len(slower)} slower benchmarks again:")
+        for name in slower:
+            results[name] = min(results[name], timers[name]())
+            report(name, results[name], baseline.get(name))
+        slower = regressions(results, baseline, args.threshold)
+
+    if args.output is not None:
+        document = {"metadata": metadata(), "results": results}
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+
+    if slower:
+        print(f"\n{len(slower)} regressions over {args.threshold}x the baseline:")
+        for name, ratio in slower.items():
+            print(f"  {name}: {ratio:.2f}x")
+        sys.exit(1)
+
+
+def report(name: str, seconds: float, baseline: float | None) -> None:
+    line = f"{name:36} {seconds * 1e6:12.2f} us"
+    if baseline:
+        line += f" {seconds / baseline:8.2f}x"
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,33 @@
-from .continuous.beta import Beta
-from .continuous.exponential import Exponential
-from .continuous.gamma import Gamma
-from .continuous.inv_gamma import InverseGamma
-from .continuous.laplace import Laplace
-from .continuous.lomax import Lomax
-from .continuous.normal import Normal
-from .continuous.rv import ContinuousRV
-from .continuous.students_t import StudentsT
-from .continuous.uniform import Uniform
-from .discrete.bernoulli import Bernoulli
-from .discrete.beta_binomial import BetaBinomial
-from .discrete.binomial import Binomial
-from .discrete.geometric import Geometric
-from .discrete.negative_binomial import NegativeBinomial
-from .discrete.poisson import Poisson
-from .discrete.rv import DiscreteRV
-from .operations import E, P, Var
-from .rv import Event, RandomVariable
+"""
+Public names are imported on first access (PEP 562), so that `import probs`
+does not load numpy or scipy until a distribution that needs them is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .continuous.beta import Beta
+    from .continuous.exponential import Exponential
+    from .continuous.gamma import Gamma
+    from .continuous.grid import GridRV, LogGridRV
+    from .continuous.inv_gamma import InverseGamma
+    from .continuous.laplace import Laplace
+    from .continuous.lomax import Lomax
+    from .continuous.mixture import Mixture
+    from .continuous.normal import Normal
+    from .continuous.rv import ContinuousRV
+    from .continuous.students_t import StudentsT
+    from .continuous.uniform import Uniform
+    from .discrete.bernoulli import Bernoulli
+    from .discrete.beta_binomial import BetaBinomial
+    from .discrete.binomial import Binomial
+    from .discrete.geometric import Geometric
+    from .discrete.negative_binomial import NegativeBinomial
+    from .discrete.poisson import Poisson
+    from .discrete.rv import DiscreteRV
+    from .operations import E, P, Var
+    from .rv import Event, RandomVariable
 
 __all__ = (
     "Bernoulli",
@@ -30,9 +41,12 @@ __all__ = (
     "Exponential",
     "Gamma",
     "Geometric",
+    "GridRV",
     "InverseGamma",
     "Laplace",
+    "LogGridRV",
     "Lomax",
+    "Mixture",
     "NegativeBinomial",
     "Normal",
     "P",
@@ -42,3 +56,45 @@ __all__ = (
     "Uniform",
     "Var",
 )
+
+# The module defining each public name.
+_MODULES = {
+    "Beta": ".continuous.beta",
+    "Exponential": ".continuous.exponential",
+    "Gamma": ".continuous.gamma",
+    "GridRV": ".continuous.grid",
+    "LogGridRV": ".continuous.grid",
+    "InverseGamma": ".continuous.inv_gamma",
+    "Laplace": ".continuous.laplace",
+    "Lomax": ".continuous.lomax",
+    "Mixture": ".continuous.mixture",
+    "Normal": ".continuous.normal",
+    "ContinuousRV": ".continuous.rv",
+    "StudentsT": ".continuous.students_t",
+    "Uniform": ".continuous.uniform",
+    "Bernoulli": ".discrete.bernoulli",
+    "BetaBinomial": ".discrete.beta_binomial",
+    "Binomial": ".discrete.binomial",
+    "Geometric": ".discrete.geometric",
+    "NegativeBinomial": ".discrete.negative_binomial",
+    "Poisson": ".discrete.poisson",
+    "DiscreteRV": ".discrete.rv",
+    "E": ".operations",
+    "P": ".operations",
+    "Var": ".operations",
+    "Event": ".rv",
+    "RandomVariable": ".rv",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    # Later lookups find the name directly instead of calling this again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from probs.rv import RandomVariable
+
+    Rule = Callable[[Any, Any], RandomVariable | None]
+
+RuleT = TypeVar("RuleT", bound="Rule")
+
+_rules: dict[tuple[type, Callable[[Any, Any], Any], type], Rule] = {}
+# The rules matching a pair of types, most specific first.
+_resolved: dict[tuple[type, Callable[[Any, Any], Any], type], tuple[Rule, ...]] = {}
+
+
+def register(
+    left: type, op: Callable[[Any, Any], Any], right: type
+) -> Callable[[RuleT], RuleT]:
+    """
+    Registers an exact result for `op(X, Y)` where X is a `left` and Y is a `right`,
+    e.g. `@register(Poisson, operator.add, Poisson)`. Use `float` as `right` for
+    arithmetic with constants. Subclasses of either side also match, unless a rule
+    for the subclass itself is registered.
+
+    The rule may return None to decline, e.g. for Binomials with different p, in
+    which case the operator falls back to numerical convolution or integration.
+    Subtraction and division by a constant are rewritten as addition and
+    multiplication, so only those need rules for constants.
+    """
+
+    def decorator(rule: RuleT) -> RuleT:
+        _rules[left, op, right] = rule
+        _resolved.clear()
+        return rule
+
+    return decorator
+
+
+def closed_form(
+    left: RandomVariable, op: Callable[[Any, Any], Any], right: object
+) -> RandomVariable | None:
+    """Applies the most specific rule for `op(left, right)` that does not decline."""
+    if _is_derived(left) or _is_derived(right):
+        return None
+    right_type = float if isinstance(right, int | float) else type(right)
+    for rule in _resolve(type(left), op, right_type):
+        result = rule(left, right)
+        if result is not None:
+            return result
+    return None
+
+
+def _resolve(
+    left: type, op: Callable[[Any, Any], Any], right: type
+) -> tuple[Rule, ...]:
+    rules = _resolved.get((left, op, right))
+    if rules is None:
+        rules = tuple(
+            _rules[key]
+            for left_type in left.__mro__
+            for right_type in right.__mro__
+            if (key := (left_type, op, right_type)) in _rules
+        )
+        _resolved[left, op, right] = rules
+    return rules
+
+
+def _is_derived(rv: object) -> bool:
+    """
+    Derived random variables (e.g. `X + Y`) reuse an operand's class as a carrier
+    for their expression node, so their parameters do not describe them.
+    """
+    return getattr(rv, "_node", None) is not None
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple, Protocol
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from probs.rv import ArrayOrFloat
+
+_tokens = itertools.count()
+
+
+class PointFunction(Protocol):
+    def __call__(self, x: ArrayOrFloat, /) -> ArrayOrFloat: ...
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _PointCache:
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, str, float], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[int, str, float]) -> float | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[int, str, float], value: float) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+_cache: _PointCache | None = None
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """
+    Turns on memoization of derived pdf/cdf evaluations, keeping at most `maxsize`
+    points. If the cache is already enabled, it is resized instead of cleared.
+
+    Derived random variables (e.g. `X + Y`) evaluate their operands on every call,
+    so without the cache an expression re-runs every inner integral even for points
+    it has already computed. A single cache is shared by the whole expression tree,
+    so inner nodes also reuse each other's work.
+    """
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        _cache = _PointCache(maxsize)
+    else:
+        _cache.resize(maxsize)
+
+
+def disable_cache() -> None:
+    """Turns off memoization and releases every cached point."""
+    global _cache  # noqa: PLW0603
+    _cache = None
+
+
+def cache_clear() -> None:
+    """Releases every cached point and resets the statistics."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Reports hits, misses, maxsize and the current size of the cache."""
+    if _cache is None:
+        return CacheInfo(0, 0, 0, 0)
+    return _cache.info()
+
+
+@contextmanager
+def memoize(maxsize: int = 4096) -> Iterator[None]:
+    """Enables the cache for the duration of a block, restoring the prior state."""
+    global _cache  # noqa: PLW0603
+    previous = _cache
+    _cache = _PointCache(maxsize)
+    try:
+        yield
+    finally:
+        _cache = previous
+
+
+def cached(name: str, func: PointFunction) -> PointFunction:
+    """
+    Wraps one pdf/cdf closure of a derived random variable. Each wrapped closure
+    gets its own token, so entries never collide across nodes of the expression.
+    Arrays are passed straight through; pointwise closures (see `vectorize`)
+    still cache every element individually.
+
+    :param name: The method being wrapped, e.g. "pdf".
+    """
+    token = next(_tokens)
+
+    def wrapper(x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return func(x)
+        cache = _cache
+        if cache is None:
+            return func(x)
+        key = (token, name, float(x))
+        value = cache.get(key)
+        if value is None:
+            value = func(x)
+            cache.put(key, value)
+        return value
+
+    return wrapper
@@ -1,8 +1,26 @@
+import math
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from scipy.stats import beta  # type: ignore[import-untyped]
+import numpy as np
+from scipy.special import (  # type: ignore[import-untyped]
+    betainc,
+    betaln,
+    hyp1f1,
+    xlog1py,
+    xlogy,
+)
 
 from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -29,6 +47,8 @@ class Beta(ContinuousRV):
     def __post_init__(self) -> None:
         if self.alpha < 0 or self.beta < 0:
             raise ValueError("α and β must be greater than 0.")
+        # The log of the beta function of the parameters, which normalizes the pdf.
+        self._log_beta = float(betaln(self.alpha, self.beta))
 
     def __str__(self) -> str:
         return f"Beta(α={self.alpha}, β={self.beta})"
@@ -57,5 +77,74 @@ class Beta(ContinuousRV):
             ((self.alpha + self.beta) ** 2) * (self.alpha + self.beta + 1)
         )
 
-    def pdf(self, x: float) -> float:
-        return float(beta.pdf(x, self.alpha, self.beta))
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        # Kummer's confluent hypergeometric function 1F1(alpha; alpha + beta; it).
+        value = hyp1f1(self.alpha, self.alpha + self.beta, 1j * np.asarray(t))
+        return match_complex(t, value)
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        value = hyp1f1(self.alpha, self.alpha + self.beta, np.asarray(t, dtype=float))
+        return match_input(t, np.log(value))
+
+    def support(self) -> tuple[float, float]:
+        return 0, 1
+
+    def moment(self, s: float) -> float:
+        if self.alpha + s <= 0:
+            return math.inf
+        return math.exp(float(betaln(self.alpha + s, self.beta)) - self._log_beta)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Evaluated directly rather than through scipy.stats, whose argument
+        # checking costs far more than the formula for a single point.
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
+        if 0 < x < 1:
+            return math.exp(
+                (self.alpha - 1) * math.log(x)
+                + (self.beta - 1) * math.log1p(-x)
+                - self._log_beta
+            )
+        return math.exp(self.logpdf(x))
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return match_input(x, betainc(self.alpha, self.beta, np.clip(x, 0, 1)))
+        if x <= 0:
+            return 0.0
+        if x >= 1:
+            return 1.0
+        return float(betainc(self.alpha, self.beta, x))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        x_arr = np.asarray(x, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_density = (
+                xlogy(self.alpha - 1, x_arr)
+                + xlog1py(self.beta - 1, -x_arr)
+                - self._log_beta
+            )
+        inside = (x_arr >= 0) & (x_arr <= 1)
+        return match_input(x, np.where(inside, log_density, -np.inf))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(x))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(x))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.ppf(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.isf(q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, for the less frequently called methods."""
+        from scipy.stats import beta  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return beta(self.alpha, self.beta)
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return np.random.default_rng(rng).beta(self.alpha, self.beta, n)
@@ -1,7 +1,20 @@
 import math
+import operator
 from dataclasses import dataclass
 
+import numpy as np
+
+from probs.algebra import register
+from probs.continuous.gamma import Gamma
 from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -40,8 +53,92 @@ class Exponential(ContinuousRV):
     def variance(self) -> float:
         return 1 / self.lambda_**2
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        return match_complex(t, self.lambda_ / (self.lambda_ - 1j * np.asarray(t)))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = -np.log1p(-t_arr / self.lambda_)
+        return match_input(t, np.where(t_arr < self.lambda_, value, np.inf))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        t_arr = np.asarray(t, dtype=float)
+        with np.errstate(divide="ignore"):
+            mean = np.where(t_arr < self.lambda_, 1 / (self.lambda_ - t_arr), np.inf)
+        return match_input(t, mean), match_input(t, mean**2)
+
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
+
+    def moment(self, s: float) -> float:
+        if s <= -1:
+            return math.inf
+        return math.exp(math.lgamma(1 + s) - s * math.log(self.lambda_))
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            density = self.lambda_ * np.exp(-self.lambda_ * np.maximum(x, 0))
+            return np.where(x < 0, 0.0, density)
+        if x < 0:
+            return 0
         return self.lambda_ * math.exp(-self.lambda_ * x)
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return -np.expm1(-self.lambda_ * np.maximum(x, 0))
+        if x < 0:
+            return 0
         return 1 - math.exp(-self.lambda_ * x)
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        log_density = math.log(self.lambda_) - self.lambda_ * np.asarray(x)
+        return match_input(x, np.where(np.asarray(x) < 0, -np.inf, log_density))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log(-np.expm1(-self.lambda_ * np.maximum(x, 0))))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, -self.lambda_ * np.maximum(x, 0))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = -np.log1p(-q_arr) / self.lambda_
+        return match_input(q, np.where((q_arr >= 0) & (q_arr <= 1), value, np.nan))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = -np.log(q_arr) / self.lambda_
+        return match_input(q, np.where((q_arr >= 0) & (q_arr <= 1), value, np.nan))
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return np.random.default_rng(rng).exponential(1 / self.lambda_, n)
+
+
+@register(Exponential, operator.add, Exponential)
+def _add_exponentials(x: Exponential, y: Exponential) -> Gamma | None:
+    if x.lambda_ != y.lambda_:
+        return None
+    return Gamma(2, x.lambda_)
+
+
+@register(Exponential, operator.add, Gamma)
+def _add_exponential_gamma(x: Exponential, y: Gamma) -> Gamma | None:
+    if x.lambda_ != y.beta:
+        return None
+    return Gamma(y.alpha + 1, y.beta)
+
+
+@register(Gamma, operator.add, Exponential)
+def _add_gamma_exponential(x: Gamma, y: Exponential) -> Gamma | None:
+    return _add_exponential_gamma(y, x)
+
+
+@register(Exponential, operator.mul, float)
+def _scale_exponential(x: Exponential, c: float) -> Exponential | None:
+    if c <= 0:
+        return None
+    return Exponential(x.lambda_ / c)
@@ -0,0 +1,808 @@
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from probs import instrument
+from probs.continuous.rv import ContinuousRV
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy.typing as npt
+
+    from probs.rv import ArrayOrFloat, ComplexArray, FloatArray, RandomVariable
+
+
+@dataclass(eq=False)
+class GridRV(ContinuousRV):
+    """
+    A continuous random variable backed by a table of its density sampled on an
+    evenly spaced grid. The pdf and cdf are linearly interpolated from the table;
+    outside of the grid the pdf is 0 and the cdf is 0 or 1.
+
+    These are usually produced by the numerical engines (e.g. `convolve`) rather
+    than constructed by hand.
+
+    :param grid: Evenly spaced points at which the density was evaluated.
+    :param density: The density at each grid point.
+    :param error_bound: Estimated bound on the absolute error of the cdf.
+    """
+
+    grid: FloatArray = field(default_factory=lambda: np.zeros(0), repr=False)
+    density: FloatArray = field(default_factory=lambda: np.zeros(0), repr=False)
+    error_bound: float = 0
+
+    def __post_init__(self) -> None:
+        if self.grid.shape != self.density.shape:
+            raise ValueError("grid and density must have the same shape.")
+        # Discretization error can push the running total slightly past 1.
+        self._cumulative = np.minimum(
+            _cumulative_trapezoid(self.density, self.step), 1.0
+        )
+
+    def __str__(self) -> str:
+        if len(self.grid) == 0:
+            return "GridRV()"
+        return f"GridRV([{self.grid[0]:.4g}, {self.grid[-1]:.4g}], n={len(self.grid)})"
+
+    @property
+    def step(self) -> float:
+        return float(self.grid[1] - self.grid[0]) if len(self.grid) > 1 else 0.0
+
+    def median(self) -> float:
+        return float(np.interp(0.5, self._cumulative, self.grid))
+
+    def mode(self) -> float:
+        return float(self.grid[np.argmax(self.density)])
+
+    def expectation(self) -> float:
+        return float(np.trapezoid(self.grid * self.density, self.grid))
+
+    def variance(self) -> float:
+        mean = self.expectation()
+        return float(np.trapezoid((self.grid - mean) ** 2 * self.density, self.grid))
+
+    def support(self) -> tuple[float, float]:
+        if len(self.grid) == 0:
+            return super().support()
+        return float(self.grid[0]), float(self.grid[-1])
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.interp(x, self.grid, self.density, left=0.0, right=0.0)
+        return float(np.interp(x, self.grid, self.density, left=0.0, right=0.0))
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.interp(x, self.grid, self._cumulative, left=0.0, right=1.0)
+        return float(np.interp(x, self.grid, self._cumulative, left=0.0, right=1.0))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(q, np.ndarray):
+            return np.interp(q, self._cumulative, self.grid)
+        return float(np.interp(q, self._cumulative, self.grid))
+
+
+@dataclass(eq=False)
+class LogGridRV(ContinuousRV):
+    """
+    A positive continuous random variable tabulated through its logarithm, whose
+    distribution is the `GridRV` `log`. The grid is therefore geometric in x, which
+    resolves both the region near 0 and a heavy right tail, and the pdf is
+    `log.pdf(log(x)) / x`, which stays finite in log space even where the pdf is
+    singular at 0.
+
+    These are produced by `log_convolve` rather than constructed by hand.
+
+    :param log: The distribution of log(X).
+    """
+
+    log: GridRV = field(default_factory=GridRV, repr=False)
+
+    def __str__(self) -> str:
+        if len(self.log.grid) == 0:
+            return "LogGridRV()"
+        lower, upper = self.support()
+        return f"LogGridRV([{lower:.4g}, {upper:.4g}], n={len(self.log.grid)})"
+
+    @property
+    def error_bound(self) -> float:
+        """Estimated bound on the absolute error of the cdf."""
+        return self.log.error_bound
+
+    def median(self) -> float:
+        return math.exp(self.log.median())
+
+    def mode(self) -> float:
+        # The density of X is that of log(X) divided by x.
+        return float(
+            np.exp(self.log.grid[np.argmax(self.log.density / np.exp(self.log.grid))])
+        )
+
+    def moment(self, s: float) -> float:
+        return float(
+            np.trapezoid(np.exp(s * self.log.grid) * self.log.density, self.log.grid)
+        )
+
+    def expectation(self) -> float:
+        return self.moment(1)
+
+    def variance(self) -> float:
+        return self.moment(2) - self.moment(1) ** 2
+
+    def support(self) -> tuple[float, float]:
+        if len(self.log.grid) == 0:
+            return super().support()
+        return math.exp(self.log.grid[0]), math.exp(self.log.grid[-1])
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            positive = x > 0
+            safe = np.where(positive, x, 1.0)
+            return np.where(positive, self.log.pdf(np.log(safe)) / safe, 0.0)
+        if x <= 0:
+            return 0.0
+        return self.log.pdf(math.log(x)) / x
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            positive = x > 0
+            safe = np.where(positive, x, 1.0)
+            return np.where(positive, self.log.cdf(np.log(safe)), 0.0)
+        if x <= 0:
+            return 0.0
+        return self.log.cdf(math.log(x))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(q, np.ndarray):
+            return np.exp(self.log.ppf(q))
+        return math.exp(self.log.ppf(q))
+
+
+class CDFTable:
+    """
+    A monotone table of a cdf, built once by adaptively integrating the pdf.
+    Nodes are placed by adaptive Simpson quadrature, so they cluster where the
+    density changes quickly, and the cdf between two nodes is a cubic Hermite
+    interpolant that uses the pdf at the nodes as its slope. The interpolant is
+    clamped between the neighbouring node values, so the table stays monotone.
+
+    `cdf` and `ppf` are then interpolations costing microseconds, rather than a
+    quad integral (or a root search over quad integrals) per query.
+
+    :param rv: The random variable whose pdf is integrated.
+    :param lower: Left end of the table. The cdf is 0 to the left of it.
+    :param upper: Right end of the table. The cdf is 1 to the right of it.
+    :param tol: Target absolute error of the cdf anywhere in the table.
+    :param max_nodes: Refinement stops once the table has this many nodes.
+    """
+
+    def __init__(
+        self,
+        rv: ContinuousRV,
+        lower: float,
+        upper: float,
+        *,
+        tol: float = 1e-10,
+        max_nodes: int = 2**16,
+    ) -> None:
+        if not lower < upper:
+            raise ValueError("lower must be less than upper.")
+        nodes, masses = _adaptive_simpson(rv, lower, upper, tol, max_nodes)
+        cumulative = np.concatenate(([0.0], np.cumsum(masses)))
+        # Normalizing pushes any mass outside [lower, upper] into the table.
+        self.mass = float(cumulative[-1])
+        self.nodes = nodes
+        self.cumulative = cumulative / self.mass
+        self.slopes = np.nan_to_num(rv.pdf(nodes), posinf=0.0) / self.mass
+        self._nodes: list[float] = nodes.tolist()
+        self._cumulative: list[float] = self.cumulative.tolist()
+        self._slopes: list[float] = self.slopes.tolist()
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            i = np.clip(np.searchsorted(self.nodes, x, side="right") - 1, 0, None)
+            i = np.minimum(i, len(self.nodes) - 2)
+            segment = self._segments(i)
+            low, high, *_, width = segment
+            t = np.clip((x - self.nodes[i]) / width, 0, 1)
+            value = _hermite(t, segment)
+            value = np.clip(value, low, high)
+            return np.where(
+                x < self.nodes[0], 0.0, np.where(x >= self.nodes[-1], 1.0, value)
+            )
+        # A scalar fast path: a binary search and a few float operations.
+        k = bisect.bisect_right(self._nodes, x) - 1
+        if k < 0:
+            return 0.0
+        if k >= len(self._nodes) - 1:
+            return 1.0
+        segment = self._segment(k)
+        low, high, *_, width = segment
+        t = (x - self._nodes[k]) / width
+        value = _hermite(t, segment)
+        return min(max(value, low), high)
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        Inverts the table: each quantile starts from linear inverse interpolation
+        between the two bracketing nodes, and is then polished with Newton steps on
+        the Hermite interpolant that are clamped to stay between those nodes.
+        """
+        if isinstance(q, np.ndarray):
+            if np.any((q < 0) | (q > 1)):
+                raise ValueError("Quantiles must be between 0 and 1.")
+            i = np.searchsorted(self.cumulative, q, side="right") - 1
+            i = np.clip(i, 0, len(self.nodes) - 2)
+            segment = self._segments(i)
+            low, high, *_, width = segment
+            t = np.clip((q - low) / np.where(high > low, high - low, 1.0), 0, 1)
+            for _ in range(_NEWTON_STEPS):
+                slope = _hermite_slope(t, segment)
+                error = _hermite(t, segment) - q
+                step = np.divide(error, slope, out=np.zeros_like(t), where=slope > 0)
+                t = np.clip(t - step, 0, 1)
+            return self.nodes[i] + t * width
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1.")
+        k = bisect.bisect_right(self._cumulative, q) - 1
+        k = min(max(k, 0), len(self._nodes) - 2)
+        segment = self._segment(k)
+        low, high, *_, width = segment
+        t_scalar = (q - low) / (high - low) if high > low else 0.0
+        for _ in range(_NEWTON_STEPS):
+            slope = _hermite_slope(t_scalar, segment)
+            if slope <= 0:
+                break
+            error = _hermite(t_scalar, segment) - q
+            t_scalar = min(max(t_scalar - error / slope, 0.0), 1.0)
+        return self._nodes[k] + t_scalar * width
+
+    def _segment(self, k: int) -> tuple[float, float, float, float, float]:
+        return (
+            self._cumulative[k],
+            self._cumulative[k + 1],
+            self._slopes[k],
+            self._slopes[k + 1],
+            self._nodes[k + 1] - self._nodes[k],
+        )
+
+    def _segments(
+        self, i: npt.NDArray[np.intp]
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray, FloatArray]:
+        return (
+            self.cumulative[i],
+            self.cumulative[i + 1],
+            self.slopes[i],
+            self.slopes[i + 1],
+            self.nodes[i + 1] - self.nodes[i],
+        )
+
+
+_NEWTON_STEPS = 4
+
+
+def _hermite(
+    t: ArrayOrFloat,
+    segment: tuple[
+        ArrayOrFloat, ArrayOrFloat, ArrayOrFloat, ArrayOrFloat, ArrayOrFloat
+    ],
+) -> ArrayOrFloat:
+    """The cubic through (0, low) and (1, high) whose slopes in x are as given."""
+    low, high, slope_low, slope_high, width = segment
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (2 * t3 - 3 * t2 + 1) * low
+        + (t3 - 2 * t2 + t) * width * slope_low
+        + (-2 * t3 + 3 * t2) * high
+        + (t3 - t2) * width * slope_high
+    )
+
+
+def _hermite_slope(
+    t: ArrayOrFloat,
+    segment: tuple[
+        ArrayOrFloat, ArrayOrFloat, ArrayOrFloat, ArrayOrFloat, ArrayOrFloat
+    ],
+) -> ArrayOrFloat:
+    """The derivative of `_hermite` with respect to t."""
+    low, high, slope_low, slope_high, width = segment
+    t2 = t * t
+    return (
+        (6 * t2 - 6 * t) * low
+        + (3 * t2 - 4 * t + 1) * width * slope_low
+        + (-6 * t2 + 6 * t) * high
+        + (3 * t2 - 2 * t) * width * slope_high
+    )
+
+
+def _adaptive_simpson(
+    rv: ContinuousRV, lower: float, upper: float, tol: float, max_nodes: int
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Splits [lower, upper] into intervals on which Simpson's rule has converged,
+    refining every unconverged interval of a level with one vectorized pdf call.
+    Returns the sorted interval edges and the mass of each interval.
+    """
+
+    def pdf(x: FloatArray) -> FloatArray:
+        # Integrable singularities (e.g. Beta(0.5, 0.5) at 0) are skipped over.
+        return np.nan_to_num(rv.pdf(x), posinf=0.0)
+
+    left = np.linspace(lower, upper, 65)[:-1]
+    right = left + (upper - lower) / 64
+    done_left: list[FloatArray] = []
+    done_mass: list[FloatArray] = []
+    done_count = 0
+    while len(left):
+        mid = (left + right) / 2
+        f_left, f_mid, f_right = pdf(left), pdf(mid), pdf(right)
+        f_quarter, f_three_quarter = pdf((left + mid) / 2), pdf((mid + right) / 2)
+        width = right - left
+        whole = width / 6 * (f_left + 4 * f_mid + f_right)
+        halves = (
+            width
+            / 12
+            * (f_left + 4 * f_quarter + 2 * f_mid + 4 * f_three_quarter + f_right)
+        )
+        # Simpson's error on the interval's mass accumulates along the table,
+        # whereas the Hermite interpolation error at the midpoint does not.
+        mass_error = np.abs(halves - whole) / 15
+        left_half = width / 12 * (f_left + 4 * f_quarter + f_mid)
+        hermite_midpoint = halves / 2 + width * (f_left - f_right) / 8
+        converged = (mass_error <= tol * width / (upper - lower)) & (
+            np.abs(left_half - hermite_midpoint) <= tol
+        )
+        # Stop splitting once the midpoint can no longer be told apart.
+        converged |= (mid <= left) | (mid >= right)
+        if done_count + 2 * len(left) >= max_nodes:
+            converged[:] = True
+        done_count += int(np.count_nonzero(converged))
+        # Richardson extrapolation of the two Simpson estimates.
+        done_left.append(left[converged])
+        done_mass.append((halves + (halves - whole) / 15)[converged])
+        left, mid, right = left[~converged], mid[~converged], right[~converged]
+        left, right = np.concatenate((left, mid)), np.concatenate((mid, right))
+
+    edges = np.concatenate(done_left)
+    order = np.argsort(edges)
+    masses = np.maximum(np.concatenate(done_mass)[order], 0)
+    return np.append(edges[order], upper), masses
+
+
+def convolve(
+    first: ContinuousRV,
+    second: ContinuousRV,
+    *,
+    subtract: bool = False,
+    size: int = 2**12,
+    width: float = 12,
+) -> GridRV:
+    """
+    Computes the distribution of `first + second` (or `first - second`) for
+    independent operands. Both densities are evaluated exactly once on grids with
+    a shared spacing and then convolved with an FFT, so the cost is
+    O(size log size) rather than one quad integral per evaluated point.
+    Results can be fed back in, e.g. `convolve(convolve(x, y), z)`.
+
+    The returned `error_bound` adds up the mass that falls outside of the
+    operands' grids, the discretization error (estimated by repeating the
+    convolution at twice the spacing) and the error bounds of any tabulated
+    operands.
+
+    :param subtract: Compute `first - second` instead of `first + second`.
+    :param size: Number of grid points used for the wider of the two operands.
+    :param width: For operands that are not already tabulated, the number of
+        standard deviations on either side of the mean to tabulate.
+    """
+    if size < 4:
+        raise ValueError("size must be at least 4.")
+    first_bounds = bounds(first, width)
+    second_bounds = bounds(second, width)
+    step = max(
+        first_bounds[1] - first_bounds[0], second_bounds[1] - second_bounds[0]
+    ) / (size - 1)
+
+    first_table = _tabulate(first, *first_bounds, step)
+    second_table = _tabulate(second, *second_bounds, step)
+    grid, density, discretization = _convolve_tables(
+        first_table, second_table, step, subtract=subtract
+    )
+    result = GridRV(
+        grid,
+        density,
+        error_bound=(
+            _truncated_mass(first, *first_table)
+            + _truncated_mass(second, *second_table)
+            + discretization
+        ),
+    )
+    sign = -1 if subtract else 1
+    result.expectation = lambda: first.expectation() + sign * second.expectation()  # type: ignore[method-assign]
+    # Variances are added regardless of addition/subtraction.
+    result.variance = lambda: first.variance() + second.variance()  # type: ignore[method-assign]
+    return result
+
+
+def convolve_all(
+    terms: Sequence[ContinuousRV], *, size: int = 2**12, width: float = 12
+) -> GridRV:
+    """
+    Computes the distribution of the sum of two or more independent `terms` with a
+    single FFT. This is both faster and more accurate than folding `convolve` over
+    them, since every term is tabulated once with the same fine spacing, and the
+    FFT only spans `width` standard deviations around the mean of the sum (mass
+    beyond that is assumed negligible, as it is for the terms). Terms with a
+    closed-form cdf are tabulated by their average density over each cell.
+
+    The returned `error_bound` is the mass truncated from the terms plus the change
+    in the cdf when the step is doubled.
+
+    :param size: Number of grid points used for the widest term.
+    :param width: The number of standard deviations on either side of the mean to
+        tabulate, for each term that is not already tabulated and for the result.
+    """
+    if size < 4:
+        raise ValueError("size must be at least 4.")
+    if len(terms) < 2:
+        raise ValueError("At least two terms are needed.")
+    term_bounds = [bounds(term, width) for term in terms]
+    step = max(upper - lower for lower, upper in term_bounds) / (size - 1)
+    mean = math.fsum(term.expectation() for term in terms)
+    std = math.sqrt(math.fsum(term.variance() for term in terms))
+
+    def convolve_cells(
+        step: float,
+    ) -> tuple[list[tuple[FloatArray, FloatArray]], FloatArray, FloatArray]:
+        tables = [
+            _tabulate_cells(term, lower, upper, step)
+            for term, (lower, upper) in zip(terms, term_bounds, strict=True)
+        ]
+        grid, density = _circular_convolve(
+            [density for _, density in tables],
+            math.fsum(float(grid[0]) for grid, _ in tables),
+            step,
+            mean,
+            width * std,
+        )
+        return tables, grid, density
+
+    # Repeating the convolution at twice the step estimates the discretization
+    # error from how much the cdf moves.
+    tables, grid, density = convolve_cells(step)
+    _, coarse_grid, coarse = convolve_cells(2 * step)
+    discretization = float(
+        np.max(
+            np.abs(
+                _cumulative_trapezoid(density, step)
+                - np.interp(grid, coarse_grid, _cumulative_trapezoid(coarse, 2 * step))
+            )
+        )
+    )
+    result = GridRV(
+        grid,
+        density,
+        error_bound=math.fsum(
+            _truncated_mass(term, *table)
+            for term, table in zip(terms, tables, strict=True)
+        )
+        + discretization,
+    )
+    result.expectation = lambda: mean  # type: ignore[method-assign]
+    result.variance = lambda: std**2  # type: ignore[method-assign]
+    return result
+
+
+def log_convolve(
+    first: ContinuousRV,
+    second: ContinuousRV,
+    *,
+    divide: bool = False,
+    size: int = 2**12,
+    tail: float = 1e-12,
+) -> LogGridRV:
+    """
+    Computes the distribution of `first * second` (or `first / second`) for
+    independent, positive operands. Since log(XY) = log(X) + log(Y), the densities
+    of the logarithms are tabulated once and convolved with an FFT as in
+    `convolve`, rather than integrating `pdf(x) * other.pdf(z / x) / x` for every
+    evaluated point, which is singular at x = 0. Results can be fed back in.
+
+    The returned `error_bound` adds up the tails cut off from the operands, the
+    discretization error and the error bounds of any tabulated operands.
+
+    :param divide: Compute `first / second` instead of `first * second`.
+    :param size: Number of grid points used for the wider of the two logarithms.
+    :param tail: For operands that are not already tabulated, the probability cut
+        off below and above the tabulated range, found from their `ppf` and `isf`.
+    """
+    if size < 4:
+        raise ValueError("size must be at least 4.")
+    first_bounds = log_bounds(first, tail)
+    second_bounds = log_bounds(second, tail)
+    step = max(
+        first_bounds[1] - first_bounds[0], second_bounds[1] - second_bounds[0]
+    ) / (size - 1)
+
+    first_table = _tabulate_log(first, *first_bounds, step)
+    second_table = _tabulate_log(second, *second_bounds, step)
+    grid, density, discretization = _convolve_tables(
+        first_table, second_table, step, subtract=divide, cells=True
+    )
+    return LogGridRV(
+        log=GridRV(
+            grid,
+            density,
+            error_bound=(
+                _truncated_cells(first, first_table[1], step)
+                + _truncated_cells(second, second_table[1], step)
+                + discretization
+            ),
+        )
+    )
+
+
+def invert(
+    terms: Sequence[RandomVariable], *, size: int = 2**14, width: float = 12
+) -> GridRV:
+    """
+    Computes the distribution of the sum of independent `terms`, each of which has
+    a characteristic function, by inverting the product of their characteristic
+    functions with an FFT. Unlike `convolve_all`, no term is tabulated, so the
+    cost is one evaluation of each characteristic function on a shared array of
+    frequencies, and terms much narrower than the sum lose no accuracy. The
+    density is recovered on `size` points spanning `width` standard deviations on
+    either side of the mean of the sum, so mass beyond that range is assumed
+    negligible (it wraps around onto the grid).
+
+    The returned `error_bound` is the change in the cdf when only the lower half of
+    the frequencies is inverted, i.e. when the spacing of the grid is doubled.
+
+    :param size: Number of grid points, which should be even.
+    :param width: The number of standard deviations on either side of the mean.
+    """
+    if size < 4:
+        raise ValueError("size must be at least 4.")
+    mean = math.fsum(term.expectation() for term in terms)
+    std = math.sqrt(math.fsum(term.variance() for term in terms))
+    if not math.isfinite(mean) or not math.isfinite(std) or std == 0:
+        raise ValueError("The terms need a finite mean and a positive variance.")
+    lower = mean - width * std
+    length = 2 * width * std
+    frequencies = 2 * np.pi / length * np.arange(size // 2 + 1, dtype=np.float64)
+    spectrum = np.ones(len(frequencies), dtype=complex)
+    for term in terms:
+        spectrum *= term.cf(frequencies)
+
+    grid, density = _density(spectrum, lower, length, size)
+    coarse_grid, coarse = _density(spectrum[: size // 4 + 1], lower, length, size // 2)
+    step = length / size
+    discretization = float(
+        np.max(
+            np.abs(
+                _cumulative_trapezoid(density, step)
+                - np.interp(grid, coarse_grid, _cumulative_trapezoid(coarse, 2 * step))
+            )
+        )
+    )
+    result = GridRV(grid, density, error_bound=discretization)
+    result.expectation = lambda: mean  # type: ignore[method-assign]
+    result.variance = lambda: std**2  # type: ignore[method-assign]
+    return result
+
+
+def gil_pelaez(
+    cf: Callable[[FloatArray], complex | ComplexArray], x: float, scale: float
+) -> float:
+    """
+    The cdf at x of the distribution with characteristic function `cf`, by the
+    Gil-Pelaez formula F(x) = 1/2 - 1/pi * integral of Im(exp(-itx) cf(t)) / t over
+    t > 0. The integral is taken over u = scale * t, so `scale` should be about the
+    standard deviation.
+    """
+
+    def integrand(u: float) -> float:
+        t = u / scale
+        value = complex(cf(np.asarray(t)))
+        return (complex(math.cos(t * x), -math.sin(t * x)) * value).imag / u
+
+    integral = float(instrument.quad(integrand, 0, math.inf, limit=200)[0])
+    return min(max(0.5 - integral / math.pi, 0.0), 1.0)
+
+
+def bounds(rv: ContinuousRV, width: float) -> tuple[float, float]:
+    """
+    A finite range that holds nearly all of the mass of `rv`: its grid if it is
+    already tabulated, or else `width` standard deviations around the mean.
+    """
+    if isinstance(rv, GridRV):
+        return float(rv.grid[0]), float(rv.grid[-1])
+    mean, std = rv.expectation(), math.sqrt(rv.variance())
+    if not math.isfinite(mean) or not math.isfinite(std):
+        raise ValueError(f"{rv} needs a finite mean and variance to choose a grid.")
+    return mean - width * std, mean + width * std
+
+
+def log_bounds(rv: ContinuousRV, tail: float) -> tuple[float, float]:
+    """
+    A finite range of log(x) that holds nearly all of the mass of a positive `rv`:
+    its grid if it is already tabulated, or else the logarithms of the quantiles
+    at `tail` and `1 - tail`.
+    """
+    if isinstance(rv, LogGridRV):
+        return float(rv.log.grid[0]), float(rv.log.grid[-1])
+    # A quantile can underflow to 0 for e.g. Beta(0.01, 1).
+    tiny = float(np.finfo(float).tiny)
+    return math.log(max(rv.ppf(tail), tiny)), math.log(max(rv.isf(tail), tiny))
+
+
+def _tabulate(
+    rv: ContinuousRV, lower: float, upper: float, step: float
+) -> tuple[FloatArray, FloatArray]:
+    grid: FloatArray = lower + step * np.arange(
+        math.ceil((upper - lower) / step) + 1, dtype=np.float64
+    )
+    return grid, rv.pdf(grid)
+
+
+def _tabulate_cells(
+    rv: ContinuousRV, lower: float, upper: float, step: float
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Like `_tabulate`, but uses the average density over each cell where the cdf
+    has a closed form. This is exact even where the pdf jumps, e.g. at the ends of
+    a Uniform, which otherwise dominates the error of long sums.
+    """
+    grid, density = _tabulate(rv, lower, upper, step)
+    if rv._node is None and type(rv).cdf is not ContinuousRV.cdf:  # noqa: SLF001
+        edges = rv.cdf(np.append(grid - step / 2, grid[-1] + step / 2))
+        density = np.diff(edges) / step
+    return grid, density
+
+
+def _tabulate_log(
+    rv: ContinuousRV, lower: float, upper: float, step: float
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Tabulates the density of log(rv), which is `rv.pdf(x) * x` at x = e^u, on
+    [lower, upper]. As in `_tabulate_cells`, the average density over each cell is
+    used where the cdf has a closed form.
+    """
+    grid: FloatArray = lower + step * np.arange(
+        math.ceil((upper - lower) / step) + 1, dtype=np.float64
+    )
+    if rv._node is None and type(rv).cdf is not ContinuousRV.cdf:  # noqa: SLF001
+        edges = rv.cdf(np.exp(np.append(grid - step / 2, grid[-1] + step / 2)))
+        return grid, np.diff(edges) / step
+    values = np.exp(grid)
+    return grid, np.nan_to_num(rv.pdf(values) * values, posinf=0.0)
+
+
+def _truncated_mass(rv: ContinuousRV, grid: FloatArray, density: FloatArray) -> float:
+    if isinstance(rv, GridRV | LogGridRV):
+        return rv.error_bound
+    return abs(1 - float(np.trapezoid(density, grid)))
+
+
+def _truncated_cells(rv: ContinuousRV, density: FloatArray, step: float) -> float:
+    """Like `_truncated_mass`, for a table of average densities over cells."""
+    if isinstance(rv, GridRV | LogGridRV):
+        return rv.error_bound
+    return abs(1 - math.fsum(density) * step)
+
+
+def _merge_cells(density: FloatArray) -> FloatArray:
+    """
+    Average densities over cells of twice the width, centred on every other grid
+    point, so each cell's mass is split evenly between the merged cells it spans.
+    """
+    # An odd length keeps a merged cell for the last point to spill into.
+    padded = np.concatenate(([0.0], density, [0.0] * (2 - len(density) % 2)))
+    return (padded[0:-2:2] / 2 + padded[1:-1:2] + padded[2::2] / 2) / 2
+
+
+def _convolve_tables(
+    first: tuple[FloatArray, FloatArray],
+    second: tuple[FloatArray, FloatArray],
+    step: float,
+    *,
+    subtract: bool,
+    cells: bool = False,
+) -> tuple[FloatArray, FloatArray, float]:
+    """
+    Convolves two (grid, density) tables with a shared `step`, returning the grid
+    and density of the sum (or difference) and an estimate of the discretization
+    error of its cdf, from repeating the convolution at twice the step.
+
+    :param cells: Whether the tables hold average densities over cells, which are
+        merged for the coarser convolution rather than subsampled, so that a cell
+        holding a spike of mass (e.g. next to a singularity) is not dropped.
+    """
+    first_grid, first_density = first
+    second_grid, second_density = second
+    if subtract:
+        second_grid, second_density = -second_grid[::-1], second_density[::-1]
+
+    density = _fft_convolve(first_density, second_density) * step
+    grid = first_grid[0] + second_grid[0] + step * np.arange(len(density))
+
+    coarsen = _merge_cells if cells else lambda density: density[::2]
+    coarse = _fft_convolve(coarsen(first_density), coarsen(second_density)) * 2 * step
+    fine_cdf = _cumulative_trapezoid(density, step)[::2]
+    coarse_cdf = _cumulative_trapezoid(coarse, 2 * step)
+    overlap = min(len(fine_cdf), len(coarse_cdf))
+    discretization = float(np.max(np.abs(fine_cdf[:overlap] - coarse_cdf[:overlap])))
+    return grid, density, discretization
+
+
+def _circular_convolve(
+    densities: Sequence[FloatArray],
+    origin: float,
+    step: float,
+    center: float,
+    half_width: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Convolves densities tabulated with a shared `step`, where the sum of their first
+    grid points is `origin`, keeping only [center - half_width, center + half_width].
+    The FFT wraps around outside of that window, so it only needs to be as long as
+    the window rather than as all of the densities together.
+    """
+    length = sum(len(density) for density in densities) - len(densities) + 1
+    first = max(0, math.ceil((center - half_width - origin) / step))
+    last = min(length - 1, math.floor((center + half_width - origin) / step))
+    fft_size = 1 << (min(length, last - first + 1) - 1).bit_length()
+    # Convolving masses rather than densities keeps the spectra bounded by 1.
+    spectrum = np.ones(fft_size // 2 + 1, dtype=complex)
+    for density in densities:
+        masses = density * step
+        if len(masses) > fft_size:
+            # Fold the density onto the period of the FFT.
+            masses = np.bincount(
+                np.arange(len(masses)) % fft_size, weights=masses, minlength=fft_size
+            ).astype(np.float64)
+        spectrum *= np.fft.rfft(masses, fft_size)
+    result = np.fft.irfft(spectrum, fft_size)
+    result[result < np.finfo(float).eps * fft_size * result.max()] = 0
+    indices = np.arange(first, last + 1)
+    grid = origin + step * indices.astype(np.float64)
+    return grid, result[indices % fft_size] / step
+
+
+def _density(
+    spectrum: ComplexArray, lower: float, length: float, size: int
+) -> tuple[FloatArray, FloatArray]:
+    """
+    The density on `size` points from `lower` with the characteristic function
+    `spectrum` at the frequencies 2 pi k / length, k = 0, 1, ...
+    """
+    frequencies = 2 * np.pi / length * np.arange(len(spectrum))
+    # Only the conjugate is needed: the density is real, and irfft takes the
+    # positive frequencies of a Hermitian spectrum.
+    shifted = np.conj(spectrum) * np.exp(1j * frequencies * lower)
+    density = np.fft.irfft(shifted, size) * (size / length)
+    grid = lower + length / size * np.arange(size, dtype=np.float64)
+    return grid, np.maximum(density, 0.0).astype(np.float64)
+
+
+def _cumulative_trapezoid(density: FloatArray, step: float) -> FloatArray:
+    areas = (density[1:] + density[:-1]) * (step / 2)
+    return np.concatenate(([0.0], np.cumsum(areas)))[: len(density)]
+
+
+def _fft_convolve(*densities: FloatArray) -> FloatArray:
+    length = sum(len(density) for density in densities) - len(densities) + 1
+    fft_size = 1 << (length - 1).bit_length()
+    spectrum = np.fft.rfft(densities[0], fft_size)
+    for density in densities[1:]:
+        spectrum *= np.fft.rfft(density, fft_size)
+    result = np.fft.irfft(spectrum, fft_size)[:length]
+    # Zero out round-off noise, which would otherwise leak mass outside the support.
+    result[result < np.finfo(float).eps * fft_size * result.max()] = 0
+    return result
@@ -1,8 +1,27 @@
+import math
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from scipy.stats import invgamma  # type: ignore[import-untyped]
+import numpy as np
+from scipy.special import (  # type: ignore[import-untyped]
+    gammaincc,
+    gammainccinv,
+    gammaincinv,
+    gammaln,
+    kve,
+    xlogy,
+)
 
 from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -28,13 +47,12 @@ class InverseGamma(ContinuousRV):
     def __post_init__(self) -> None:
         if self.alpha < 0 or self.beta < 0:
             raise ValueError("α and β must be greater than 0.")
+        # The log of the normalizing constant of the pdf.
+        self._log_norm = float(xlogy(self.alpha, self.beta) - gammaln(self.alpha))
 
     def __str__(self) -> str:
         return f"InverseGamma(α={self.alpha}, β={self.beta})"
 
-    def median(self) -> float:
-        raise NotImplementedError
-
     def mode(self) -> float:
         return self.beta / (self.alpha + 1)
 
@@ -44,10 +62,92 @@ class InverseGamma(ContinuousRV):
     def variance(self) -> float:
         return self.beta**2 / ((self.alpha - 1) ** 2 * (self.alpha - 2))
 
-    def pdf(self, x: float) -> float:
-        # TODO: where is self.beta
-        return float(invgamma.pdf(x, self.alpha))
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        return match_complex(t, self._laplace(-1j * np.asarray(t, dtype=float)))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        # The right tail is too heavy for E[exp(tX)] to exist for any t > 0.
+        t_arr = np.asarray(t, dtype=float)
+        with np.errstate(divide="ignore"):
+            value = np.log(self._laplace(-np.minimum(t_arr, 0).astype(complex)).real)
+        return match_input(t, np.where(t_arr <= 0, value, np.inf))
+
+    def _laplace(self, s: ComplexArray) -> ComplexArray:
+        """
+        E[exp(-sX)] for Re(s) >= 0, which is 2 (βs)^(α/2) K_α(2 sqrt(βs)) / Γ(α),
+        evaluated in log space so that it neither over- nor underflows.
+        """
+        root = np.sqrt(self.beta * s)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = 2 * np.exp(
+                self.alpha * np.log(root)
+                + np.log(kve(self.alpha, 2 * root))
+                - 2 * root
+                - math.lgamma(self.alpha)
+            )
+        return np.where(s == 0, 1.0, value)
+
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
+
+    def moment(self, s: float) -> float:
+        if s >= self.alpha:
+            return math.inf
+        return math.exp(
+            s * math.log(self.beta)
+            + math.lgamma(self.alpha - s)
+            - math.lgamma(self.alpha)
+        )
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Evaluated directly rather than through scipy.stats, whose argument
+        # checking costs far more than the formula for a single point.
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
+        if x > 0:
+            return math.exp(
+                self._log_norm - (self.alpha + 1) * math.log(x) - self.beta / x
+            )
+        return 0.0
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            with np.errstate(divide="ignore"):
+                return match_input(
+                    x, np.where(x > 0, gammaincc(self.alpha, self.beta / x), 0.0)
+                )
+        if x <= 0:
+            return 0.0
+        return float(gammaincc(self.alpha, self.beta / x))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        x_arr = np.asarray(x, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_density = (
+                self._log_norm - (self.alpha + 1) * np.log(x_arr) - self.beta / x_arr
+            )
+        return match_input(x, np.where(x_arr > 0, log_density, -np.inf))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(x))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(x))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            return match_input(q, self.beta / gammainccinv(self.alpha, q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            return match_input(q, self.beta / gammaincinv(self.alpha, q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, for the less frequently called methods."""
+        from scipy.stats import invgamma  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return invgamma(self.alpha, scale=self.beta)
 
-    def cdf(self, x: float) -> float:
-        # TODO: where is self.beta
-        return float(invgamma.cdf(x, self.alpha))
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return self.beta / np.random.default_rng(rng).gamma(self.alpha, 1, n)
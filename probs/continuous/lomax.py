@@ -2,7 +2,10 @@ import math
 from dataclasses import dataclass
 from typing import cast
 
+import numpy as np
+
 from probs.continuous.rv import ContinuousRV
+from probs.rv import ArrayOrFloat, FloatArray, Seed, match_input
 
 
 @dataclass(eq=False)
@@ -48,10 +51,64 @@ class Lomax(ContinuousRV):
             return math.inf
         raise RuntimeError("Undefined for α <= 1")
 
-    def pdf(self, x: float) -> float:
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
+
+    def moment(self, s: float) -> float:
+        if not -1 < s < self.alpha:
+            return math.inf
+        return math.exp(
+            s * math.log(self.lambda_)
+            + math.lgamma(1 + s)
+            + math.lgamma(self.alpha - s)
+            - math.lgamma(self.alpha)
+        )
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            x_pos = np.maximum(x, 0)
+            density = (self.alpha / self.lambda_) * (1 + x_pos / self.lambda_) ** -(
+                self.alpha + 1
+            )
+            return np.where(x < 0, 0.0, density)
+        if x < 0:
+            return 0
         y = (self.alpha / self.lambda_) * (1 + x / self.lambda_) ** -(self.alpha + 1)
         return cast("float", y)
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return 1 - (1 + np.maximum(x, 0) / self.lambda_) ** -self.alpha
+        if x < 0:
+            return 0
         y = 1 - (1 + x / self.lambda_) ** -self.alpha
         return cast("float", y)
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        log_density = math.log(self.alpha / self.lambda_) - (self.alpha + 1) * np.log1p(
+            np.maximum(x, 0) / self.lambda_
+        )
+        return match_input(x, np.where(np.asarray(x) < 0, -np.inf, log_density))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log(-np.expm1(self.logsf(np.asarray(x, float)))))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, -self.alpha * np.log1p(np.maximum(x, 0) / self.lambda_))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = self.lambda_ * np.expm1(-np.log1p(-q_arr) / self.alpha)
+        return match_input(q, np.where((q_arr >= 0) & (q_arr <= 1), value, np.nan))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = self.lambda_ * np.expm1(-np.log(q_arr) / self.alpha)
+        return match_input(q, np.where((q_arr >= 0) & (q_arr <= 1), value, np.nan))
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        # numpy's "pareto" is the Lomax distribution with λ = 1.
+        return self.lambda_ * np.random.default_rng(rng).pareto(self.alpha, n)
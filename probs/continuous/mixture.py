@@ -0,0 +1,139 @@
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import logsumexp  # type: ignore[import-untyped]
+
+from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
+
+
+@dataclass(eq=False)
+class Mixture(ContinuousRV):
+    """
+    A finite mixture: with probability weights[k], a sample of components[k]. It
+    models e.g. multimodal latencies, where each mode comes from a different
+    cause. The weights are normalized to sum to 1.
+
+    Every component is evaluated once on the whole array of points, and the
+    results are combined along a stacked axis, in log space for the log functions.
+
+    https://en.wikipedia.org/wiki/Mixture_distribution
+
+    :param components: Continuous random variables, e.g. Normal and Lomax.
+    :param weights: Non-negative weight of each component.
+    """
+
+    components: Sequence[ContinuousRV] = ()
+    weights: Sequence[float] = ()
+
+    def __post_init__(self) -> None:
+        self.components = tuple(self.components)
+        if len(self.components) != len(self.weights):
+            raise ValueError("components and weights must have the same length.")
+        if not all(isinstance(c, ContinuousRV) for c in self.components):
+            raise ValueError("components must be continuous random variables.")
+        weights = np.asarray(self.weights, dtype=float)
+        if self.components and (np.any(weights < 0) or not weights.sum() > 0):
+            raise ValueError("weights must be non-negative with a positive sum.")
+        if self.components:
+            weights /= weights.sum()
+        self.weights = tuple(weights.tolist())
+        self._weights = weights
+        with np.errstate(divide="ignore"):
+            self._log_weights = np.log(weights)
+
+    def __str__(self) -> str:
+        terms = ", ".join(
+            f"{w:.4g} {c}" for c, w in zip(self.components, self.weights, strict=True)
+        )
+        return f"Mixture({terms})"
+
+    def expectation(self) -> float:
+        return math.fsum(
+            w * c.expectation()
+            for c, w in zip(self.components, self.weights, strict=True)
+        )
+
+    def variance(self) -> float:
+        # The law of total variance: the mean of the variances plus the variance
+        # of the means.
+        mean = self.expectation()
+        return math.fsum(
+            w * (c.variance() + (c.expectation() - mean) ** 2)
+            for c, w in zip(self.components, self.weights, strict=True)
+        )
+
+    def support(self) -> tuple[float, float]:
+        supports = [c.support() for c in self.components]
+        return min(lower for lower, _ in supports), max(upper for _, upper in supports)
+
+    def moment(self, s: float) -> float:
+        return math.fsum(
+            w * c.moment(s) for c, w in zip(self.components, self.weights, strict=True)
+        )
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        t_arr = np.asarray(t, dtype=float)
+        stacked = np.stack([np.asarray(c.cf(t_arr)) for c in self.components])
+        return match_complex(t, np.tensordot(self._weights, stacked, axes=1))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine_logs(lambda c: c.cgf, t)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine(lambda c: c.pdf, x)
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine(lambda c: c.cdf, x)
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine_logs(lambda c: c.logpdf, x)
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine_logs(lambda c: c.logcdf, x)
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._combine_logs(lambda c: c.logsf, x)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        generator = np.random.default_rng(rng)
+        chosen = generator.choice(len(self.components), n, p=self._weights)
+        samples = np.empty(n)
+        for k, component in enumerate(self.components):
+            indices = np.flatnonzero(chosen == k)
+            if len(indices):
+                samples[indices] = component.sample(len(indices), generator)
+        return samples
+
+    def _stack(
+        self, method: Callable[[ContinuousRV], Callable[..., Any]], x: ArrayOrFloat
+    ) -> FloatArray:
+        """One row per component of method evaluated at every point of x."""
+        points = np.atleast_1d(np.asarray(x, dtype=float))
+        return np.stack([np.asarray(method(c)(points)) for c in self.components])
+
+    def _combine(
+        self, method: Callable[[ContinuousRV], Callable[..., Any]], x: ArrayOrFloat
+    ) -> ArrayOrFloat:
+        """The weighted sum of the components' values."""
+        total = self._weights @ self._stack(method, x)
+        return match_input(x, total if isinstance(x, np.ndarray) else total[0])
+
+    def _combine_logs(
+        self, method: Callable[[ContinuousRV], Callable[..., Any]], x: ArrayOrFloat
+    ) -> ArrayOrFloat:
+        """The log of the weighted sum of exp of the components' values."""
+        terms = self._log_weights[:, np.newaxis] + self._stack(method, x)
+        total = logsumexp(terms, axis=0)
+        return match_input(x, total if isinstance(x, np.ndarray) else total[0])
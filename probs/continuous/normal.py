@@ -2,8 +2,19 @@ import math
 from dataclasses import dataclass
 from typing import cast
 
+import numpy as np
+from scipy.special import log_ndtr, ndtr, ndtri  # type: ignore[import-untyped]
+
 from probs.continuous.rv import ContinuousRV
-from probs.rv import RandomVariable
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    RandomVariable,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -71,12 +82,52 @@ class Normal(ContinuousRV):
     def variance(self) -> float:
         return self._sigma_sq
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        t_arr = np.asarray(t, dtype=float)
+        return match_complex(
+            t, np.exp(1j * self.mu * t_arr - self._sigma_sq * t_arr**2 / 2)
+        )
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        return match_input(t, self.mu * t_arr + self._sigma_sq * t_arr**2 / 2)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return (
+                1
+                / math.sqrt(2 * math.pi * self._sigma_sq)
+                * np.exp(-((x - self.mu) ** 2) / (2 * self._sigma_sq))
+            )
         return (
             1
             / math.sqrt(2 * math.pi * self._sigma_sq)
             * math.exp(-((x - self.mu) ** 2) / (2 * self._sigma_sq))
         )
 
-    def cdf(self, x: float) -> float:
-        return (1 + math.erf(x / math.sqrt(2))) / 2
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return cast("FloatArray", ndtr((x - self.mu) / math.sqrt(self._sigma_sq)))
+        return (1 + math.erf((x - self.mu) / math.sqrt(2 * self._sigma_sq))) / 2
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(
+            x,
+            -((x - self.mu) ** 2) / (2 * self._sigma_sq)
+            - math.log(2 * math.pi * self._sigma_sq) / 2,
+        )
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, log_ndtr((x - self.mu) / math.sqrt(self._sigma_sq)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, log_ndtr((self.mu - x) / math.sqrt(self._sigma_sq)))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self.mu + math.sqrt(self._sigma_sq) * ndtri(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self.mu - math.sqrt(self._sigma_sq) * ndtri(q))
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return np.random.default_rng(rng).normal(self.mu, math.sqrt(self._sigma_sq), n)
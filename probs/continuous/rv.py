@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-# import math
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 
 # from typing import Any, Iterable, Sequence
-from typing import cast, no_type_check
+from typing import Any, Self, cast, no_type_check
 
 import numpy as np
+import numpy.typing as npt
 
 # from matplotlib.axes import Axes
 # from mpl_format.axes import AxesFormatter
 # from pandas import Series
-from scipy.integrate import quad  # type: ignore[import-untyped]
-
-from probs.rv import RandomVariable
+from probs import expression
+from probs.quantile import QuantileSolver
+from probs.rv import ArrayOrFloat, RandomVariable, Seed, vectorize
 
 
 @dataclass(eq=False)
@@ -22,86 +23,44 @@ class ContinuousRV(RandomVariable):
     We currently use @no_type_check because there currently isn't any valuable type-info
     for these methods. We will eventually use # type: ignore once there is something
     important to typecheck.
+
+    Arithmetic is lazy: it builds a node of an expression graph (see
+    `probs.expression`), which is only evaluated when e.g. the pdf is requested.
     """
 
+    # Brackets kept by the general quantile function (see `ppf`).
+    _quantiles: QuantileSolver | None = field(default=None, init=False, repr=False)
+
     @no_type_check
     def __add__(self, other: object) -> ContinuousRV:
         if isinstance(other, ContinuousRV):
-            other_var = other
-            result = type(self)()
-            result.pdf = lambda z: quad(
-                lambda x: self.pdf(x) * other_var.pdf(z - x),
-                -np.inf,
-                np.inf,
-                full_output=True,
-            )[0]
-            result.expectation = lambda: self.expectation() + other_var.expectation()
-            # Assumes Independence of X and Y, else add (+ 2 * Cov(X, Y)) term
-            result.variance = lambda: self.variance() + other_var.variance()
-            result.median = lambda: self.median() + other_var.median()
-            return result
+            return expression.add(self, other)
         return cast("ContinuousRV", super().__add__(other))
 
     @no_type_check
     def __sub__(self, other: object) -> ContinuousRV:
         if isinstance(other, ContinuousRV):
-            result = type(self)()
-            result.pdf = lambda z: quad(
-                lambda x: self.pdf(x) * other.pdf(z + x),
-                -np.inf,
-                np.inf,
-                full_output=True,
-            )[0]
-            result.expectation = lambda: self.expectation() - other.expectation()
-            # Variances are added regardless of addition/subtraction.
-            result.variance = lambda: self.variance() + other.variance()
-            result.median = lambda: self.median() - other.median()
-            return result
+            return expression.subtract(self, other)
         return cast("ContinuousRV", super().__sub__(other))
 
     @no_type_check
     def __mul__(self, other: object) -> ContinuousRV:
         if isinstance(other, ContinuousRV):
-            result = type(self)()
-            result.pdf = lambda z: quad(
-                lambda x: (self.pdf(x) * other.pdf(z / x)) / abs(x),
-                -np.inf,
-                np.inf,
-                full_output=True,
-            )[0]
-            # Assumes Independence of X and Y
-            result.expectation = lambda: self.expectation() * other.expectation()
-            result.variance = lambda: (
-                (self.variance() ** 2 + self.expectation() ** 2)
-                + (other.variance() ** 2 + other.expectation() ** 2)
-                - (self.expectation() * other.expectation()) ** 2
-            )
-            result.median = lambda: self.median() * other.median()
-            return result
+            return expression.multiply(self, other)
         return cast("ContinuousRV", super().__mul__(other))
 
     @no_type_check
     def __truediv__(self, other: object) -> ContinuousRV:
         if isinstance(other, ContinuousRV):
-            result = type(self)()
-            result.pdf = lambda z: quad(
-                lambda x: (self.pdf(x) * other.pdf(z * x)) / abs(x),
-                -np.inf,
-                np.inf,
-                full_output=True,
-            )[0]
-            result.expectation = lambda: (_ for _ in ()).throw(
-                NotImplementedError("Expectation cannot be implemented for division.")
-            )
-            result.variance = lambda: (_ for _ in ()).throw(
-                NotImplementedError("Variance cannot be implemented for division.")
-            )
-            result.median = lambda: self.median() / other.median()
-            return result
+            return expression.divide(self, other)
         return cast("ContinuousRV", super().__truediv__(other))
 
     def median(self) -> float:
-        raise NotImplementedError
+        """
+        General implementation of the median as ppf(0.5), which may be overridden
+        in child classes.
+        """
+        return self.ppf(0.5)
 
     def mode(self) -> float:
         raise NotImplementedError
@@ -112,15 +71,92 @@ class ContinuousRV(RandomVariable):
     def variance(self) -> float:
         raise NotImplementedError
 
-    def pdf(self, x: float) -> float:
+    def support(self) -> tuple[float, float]:
+        """
+        The interval outside of which the pdf is 0, to which numerical integrals
+        are restricted. Child classes with bounded or half-bounded support narrow
+        it from the whole real line.
+        """
+        return -math.inf, math.inf
+
+    def moment(self, s: float) -> float:
+        """
+        E[X^s] for any real s, i.e. the Mellin transform of the pdf at s + 1, for
+        random variables that are never negative. It is infinite where the moment
+        does not exist. Since E[(XY)^s] = E[X^s] E[Y^s] for independent X and Y,
+        products and quotients of such random variables have exact moments, and
+        their distribution is tabulated in log space (see `log_convolve`).
+        """
+        raise NotImplementedError
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
         raise NotImplementedError
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
         """
         General implementation of the cdf function, which may be overridden
         in child classes to provide a clearer/more efficient implementation.
+
+        Arrays are integrated pointwise, since each point needs its own quad call.
+        """
+        return vectorize(
+            lambda v: expression.integrate_cdf(self.pdf, self.support(), v)
+        )(x)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        """
+        General implementation of sampling by inverting the cdf, which is fastest
+        with a closed form `ppf` or after `tabulate()`. Child classes override this
+        with a direct sampler.
+        """
+        return self.ppf(np.random.default_rng(rng).random(n))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
         """
-        return float(quad(self.pdf, -np.inf, x, full_output=True)[0])
+        The quantile function, i.e. the inverse of the cdf. The general
+        implementation solves cdf(x) = q for all of q at once (see
+        `probs.quantile`), keeping brackets for later calls. Child classes override
+        it with a closed form, and `tabulate()` replaces it with interpolation.
+        """
+        if self._quantiles is None:
+            self._quantiles = QuantileSolver.of(self)
+        return self._quantiles.ppf(q)
+
+    def tabulate(
+        self,
+        lower: float | None = None,
+        upper: float | None = None,
+        *,
+        tol: float = 1e-10,
+        width: float = 12,
+    ) -> Self:
+        """
+        Replaces `cdf` and `ppf` with interpolation in a precomputed, monotone table
+        of the cdf (see `CDFTable`). The table is built once, by adaptively
+        integrating the pdf over [lower, upper], and later calls are no-ops.
+        This is most useful for distributions without a closed form cdf, such as
+        Beta or derived random variables, where each cdf call is otherwise a quad.
+
+        :param lower: Left end of the table. Defaults to `width` standard deviations
+            below the mean.
+        :param upper: Right end of the table. Defaults to `width` standard
+            deviations above the mean.
+        :param tol: Target absolute error of the tabulated cdf.
+        :param width: Number of standard deviations used for the default bounds.
+        """
+        if "_cdf_table" in self.__dict__:
+            return self
+        from probs.continuous.grid import CDFTable, bounds  # noqa: PLC0415
+
+        if lower is None or upper is None:
+            default_lower, default_upper = bounds(self, width)
+            lower = default_lower if lower is None else lower
+            upper = default_upper if upper is None else upper
+        table = CDFTable(self, lower, upper, tol=tol)
+        self._cdf_table = table
+        self.cdf = table.cdf  # type: ignore[method-assign]
+        self.ppf = table.ppf  # type: ignore[method-assign]
+        return self
 
     # def plot(      #     self,
     #     x: Iterable[Any] | None = None,
@@ -1,9 +1,20 @@
 import math
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from scipy.stats import t  # type: ignore[import-untyped]
+import numpy as np
+from scipy.special import kve, stdtr, stdtrit  # type: ignore[import-untyped]
 
 from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -24,6 +35,12 @@ class StudentsT(ContinuousRV):
     def __post_init__(self) -> None:
         if self.nu <= 0:
             raise ValueError("nu must be greater than 0.")
+        # The log of the normalizing constant of the pdf.
+        self._log_norm = (
+            math.lgamma((self.nu + 1) / 2)
+            - math.lgamma(self.nu / 2)
+            - math.log(self.nu * math.pi) / 2
+        )
 
     def median(self) -> float:
         return 0
@@ -43,8 +60,61 @@ class StudentsT(ContinuousRV):
             return math.inf
         raise RuntimeError("Undefined for nu <= 1")
 
-    def pdf(self, x: float) -> float:
-        return float(t.pdf(x, self.nu))
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        # Real, as the distribution is symmetric: a modified Bessel function of y,
+        # K_h(y) y^h / (Gamma(h) 2^(h - 1)) for h = nu / 2, evaluated in log space.
+        half = self.nu / 2
+        y = math.sqrt(self.nu) * np.abs(np.asarray(t, dtype=float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_value = (
+                np.log(kve(half, y))
+                - y
+                + half * np.log(y)
+                - math.lgamma(half)
+                - (half - 1) * math.log(2)
+            )
+        return match_complex(t, np.where(y > 0, np.exp(log_value), 1.0))
 
-    def cdf(self, x: float) -> float:
-        return float(t.cdf(x, self.nu))
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        # The tails are too heavy for E[exp(tX)] to exist at any t other than 0.
+        return match_input(t, np.where(np.asarray(t) == 0, 0.0, np.inf))
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Evaluated directly rather than through scipy.stats, whose argument
+        # checking costs far more than the formula for a single point.
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
+        return math.exp(
+            self._log_norm - (self.nu + 1) / 2 * math.log1p(x * x / self.nu)
+        )
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, stdtr(self.nu, x))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        x_arr = np.asarray(x, dtype=float)
+        return match_input(
+            x, self._log_norm - (self.nu + 1) / 2 * np.log1p(x_arr**2 / self.nu)
+        )
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(x))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(x))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, stdtrit(self.nu, q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, -stdtrit(self.nu, q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, for the less frequently called methods."""
+        from scipy.stats import t  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return t(self.nu)
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return np.random.default_rng(rng).standard_t(self.nu, n)
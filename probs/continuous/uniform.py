@@ -1,6 +1,18 @@
+import operator
 from dataclasses import dataclass
 
+import numpy as np
+
+from probs.algebra import register
 from probs.continuous.rv import ContinuousRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -21,14 +33,60 @@ class Uniform(ContinuousRV):
     def variance(self) -> float:
         return ((self.b - self.a) ** 2) / 12
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        # sin(y) / y for y = t times the half width, turned by the midpoint.
+        t_arr = np.asarray(t, dtype=float)
+        sinc = np.sinc(t_arr * (self.b - self.a) / (2 * np.pi))
+        return match_complex(t, np.exp(0.5j * (self.a + self.b) * t_arr) * sinc)
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        y = np.abs(t_arr) * (self.b - self.a) / 2
+        # log(sinh(y) / y), rearranged so that it neither overflows nor cancels.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_sinhc = y + np.log(-np.expm1(-2 * y)) - np.log(2 * y)
+        return match_input(
+            t, 0.5 * (self.a + self.b) * t_arr + np.where(y > 0, log_sinhc, 0.0)
+        )
+
+    def support(self) -> tuple[float, float]:
+        return self.a, self.b
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.where((self.a <= x) & (x <= self.b), 1 / (self.b - self.a), 0.0)
         if self.a <= x <= self.b:
             return 1 / (self.b - self.a)
         return 0
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.clip((x - self.a) / (self.b - self.a), 0.0, 1.0)
         if x < self.a:
             return 0
         if x > self.b:
             return 1
         return (x - self.a) / (self.b - self.a)
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        value = self.a + np.asarray(q) * (self.b - self.a)
+        return match_input(q, np.where((q >= 0) & (q <= 1), value, np.nan))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        value = self.b - np.asarray(q) * (self.b - self.a)
+        return match_input(q, np.where((q >= 0) & (q <= 1), value, np.nan))
+
+    def sample(self, n: int, rng: Seed = None) -> FloatArray:
+        return np.random.default_rng(rng).uniform(self.a, self.b, n)
+
+
+@register(Uniform, operator.add, float)
+def _shift_uniform(x: Uniform, c: float) -> Uniform:
+    return Uniform(x.a + c, x.b + c)
+
+
+@register(Uniform, operator.mul, float)
+def _scale_uniform(x: Uniform, c: float) -> Uniform | None:
+    if c == 0:
+        return None
+    return Uniform(*sorted((x.a * c, x.b * c)))
@@ -22,3 +22,81 @@ def nPr(n: int, r: int) -> int:
     math.factorial(n) // math.factorial(n - r)
     """
     return math.perm(n, r)
+
+
+# Below these, the pmfs are computed directly, which is exact or loses only a few
+# ulps, and is faster than the series.
+_EXACT_BINOMIAL = 100
+_EXACT_POISSON = 15
+
+
+def log_binomial_pmf(k: int, n: int, p: float) -> float:
+    """
+    log P(X = k) for X ~ Binomial(n, p), in constant time. Written in terms of the
+    Stirling error and the deviance (Loader, 2000), which, unlike differences of
+    log-gammas, keep their relative precision for large n.
+    """
+    if not 0 <= k <= n or (k > 0 and p == 0) or (k < n and p == 1):
+        return -math.inf
+    if k == 0:
+        return n * math.log1p(-p) if n else 0.0
+    if k == n:
+        return n * math.log(p)
+    if n <= _EXACT_BINOMIAL:
+        return math.log(math.comb(n, k)) + k * math.log(p) + (n - k) * math.log1p(-p)
+    log_coefficient = (
+        _stirling_error(n)
+        - _stirling_error(k)
+        - _stirling_error(n - k)
+        - _deviance(k, n * p)
+        - _deviance(n - k, n * (1 - p))
+    )
+    return log_coefficient - 0.5 * (
+        math.log(2 * math.pi) + math.log(k) + math.log1p(-k / n)
+    )
+
+
+def log_poisson_pmf(k: int, lambda_: float) -> float:
+    """log P(X = k) for X ~ Poisson(lambda_), like `log_binomial_pmf`."""
+    if k < 0 or (k > 0 and lambda_ == 0):
+        return -math.inf
+    if k == 0:
+        return -lambda_
+    if k <= _EXACT_POISSON:
+        return k * math.log(lambda_) - lambda_ - math.lgamma(k + 1)
+    return -_stirling_error(k) - _deviance(k, lambda_) - 0.5 * math.log(2 * math.pi * k)
+
+
+# Coefficients of the asymptotic series of the Stirling error.
+_STIRLING = (1 / 12, 1 / 360, 1 / 1260, 1 / 1680, 1 / 1188)
+
+
+def _stirling_error(n: float) -> float:
+    """log(n!) - log(sqrt(2 pi n) (n / e)^n)."""
+    if n <= 15:
+        return (
+            math.lgamma(n + 1)
+            - (n + 0.5) * math.log(n)
+            + n
+            - 0.5 * math.log(2 * math.pi)
+        )
+    inverse = 1 / (n * n)
+    s0, s1, s2, s3, s4 = _STIRLING
+    return (s0 - (s1 - (s2 - (s3 - s4 * inverse) * inverse) * inverse) * inverse) / n
+
+
+def _deviance(x: float, mean: float) -> float:
+    """x log(x / mean) + mean - x, without cancellation when x is close to mean."""
+    if abs(x - mean) >= 0.1 * (x + mean):
+        return x * math.log(x / mean) + mean - x
+    ratio = (x - mean) / (x + mean)
+    total = (x - mean) * ratio
+    term = 2 * x * ratio
+    j = 1
+    while True:
+        term *= ratio * ratio
+        updated = total + term / (2 * j + 1)
+        if updated == total:
+            return total
+        total = updated
+        j += 1
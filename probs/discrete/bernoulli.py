@@ -1,6 +1,23 @@
+import operator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
+
+from probs.algebra import register
 from probs.discrete.rv import DiscreteRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
+
+if TYPE_CHECKING:
+    from probs.discrete.binomial import Binomial
 
 
 @dataclass(eq=False)
@@ -27,14 +44,53 @@ class Bernoulli(DiscreteRV):
     def variance(self) -> float:
         return self.p * (1 - self.p)
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        return match_complex(t, 1 - self.p + self.p * np.exp(1j * np.asarray(t)))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            value = np.logaddexp(np.log1p(-self.p), np.log(self.p) + np.asarray(t))
+        return match_input(t, value)
+
+    def support(self) -> tuple[float, float]:
+        return 0, 1
+
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return (1 - k) * self.p / ((k + 1) * (1 - self.p))
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.where(np.trunc(x) == 1, self.p, 1 - self.p)
         k = int(x)
         return self.p if k == 1 else 1 - self.p
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            k_arr = np.trunc(x)
+            return np.where(k_arr < 0, 0.0, np.where(k_arr >= 1, 1.0, 1 - self.p))
         k = int(x)
         if k < 0:
             return 0
         if k >= 1:
             return 1
         return 1 - self.p
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        value = np.where(np.asarray(q) <= 1 - self.p, 0.0, 1.0)
+        return match_input(q, np.where((q >= 0) & (q <= 1), value, np.nan))
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).binomial(1, self.p, n)
+
+
+@register(Bernoulli, operator.add, Bernoulli)
+def _add_bernoullis(x: Bernoulli, y: Bernoulli) -> "Binomial | None":
+    """
+    Registered here rather than with the other rules in `probs.discrete.binomial`,
+    which imports this module, so that it applies before Binomial has been used.
+    """
+    from probs.discrete.binomial import Binomial  # noqa: PLC0415
+
+    if x.p != y.p:
+        return None
+    return Binomial(n=2, p=x.p)
@@ -1,8 +1,14 @@
+import math
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from scipy.stats import betabinom  # type: ignore[import-untyped]
+import numpy as np
+import numpy.typing as npt
+from scipy.special import betaln, gammaln  # type: ignore[import-untyped]
 
 from probs.discrete.rv import DiscreteRV
+from probs.rv import ArrayOrFloat, FloatArray, Seed, match_input
 
 
 @dataclass(eq=False)
@@ -39,12 +45,8 @@ class BetaBinomial(DiscreteRV):
     def __post_init__(self) -> None:
         if self.alpha < 0 or self.beta < 0:
             raise ValueError("α and β must be greater than 0.")
-
-    def median(self) -> float:
-        raise NotImplementedError
-
-    def mode(self) -> float:
-        raise NotImplementedError
+        # The terms of the log pmf that do not depend on k.
+        self._log_norm = float(gammaln(self.n + 1) - betaln(self.alpha, self.beta))
 
     def expectation(self) -> float:
         return self.n * self.alpha / (self.alpha + self.beta)
@@ -58,10 +60,78 @@ class BetaBinomial(DiscreteRV):
             / ((self.alpha + self.beta) ** 2 * (self.alpha + self.beta + 1))
         )
 
-    def pdf(self, x: float) -> float:
-        k = int(x)
-        return float(betabinom.pmf(k, self.n, self.alpha, self.beta))
+    def support(self) -> tuple[float, float]:
+        return 0, self.n
 
-    def cdf(self, x: float) -> float:
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return (
+            (self.n - k) * (k + self.alpha) / ((k + 1) * (self.n - k - 1 + self.beta))
+        )
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Evaluated directly rather than through scipy.stats, whose argument
+        # checking costs far more than the formula for a single point.
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
         k = int(x)
-        return float(betabinom.cdf(k, self.n, self.alpha, self.beta))
+        if not 0 <= k <= self.n:
+            return 0.0
+        return math.exp(
+            self._log_norm
+            - math.lgamma(k + 1)
+            - math.lgamma(self.n - k + 1)
+            + float(betaln(k + self.alpha, self.n - k + self.beta))
+        )
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # There is no special function for it, so it is looked up in the
+        # cumulative sums of the tabulated pmf (see `DiscreteRV.lattice`).
+        offset, cumulative = self._cumulative
+        if isinstance(x, np.ndarray):
+            k = np.trunc(x) - offset
+            index = np.clip(np.nan_to_num(k), 0, len(cumulative) - 1).astype(np.int64)
+            return np.where(k < 0, 0.0, cumulative[index])
+        k = int(x) - offset
+        if k < 0:
+            return 0.0
+        return float(cumulative[min(k, len(cumulative) - 1)])
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        k = np.trunc(x)
+        with np.errstate(invalid="ignore"):
+            log_pmf = (
+                self._log_norm
+                - gammaln(k + 1)
+                - gammaln(self.n - k + 1)
+                + betaln(k + self.alpha, self.n - k + self.beta)
+            )
+        return match_input(x, np.where((k >= 0) & (k <= self.n), log_pmf, -np.inf))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(np.trunc(x)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(np.trunc(x)))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.ppf(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.isf(q))
+
+    @cached_property
+    def _cumulative(self) -> tuple[int, FloatArray]:
+        lattice = self.lattice()
+        assert lattice is not None
+        return lattice.offset, np.minimum(np.cumsum(lattice.probs), 1.0)
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, for the less frequently called methods."""
+        from scipy.stats import betabinom  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return betabinom(self.n, self.alpha, self.beta)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        generator = np.random.default_rng(rng)
+        return generator.binomial(int(self.n), generator.beta(self.alpha, self.beta, n))
@@ -1,8 +1,24 @@
 import math
+import operator
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from probs.counting import nCr
+import numpy as np
+import numpy.typing as npt
+
+from probs.algebra import register
+from probs.counting import log_binomial_pmf
+from probs.discrete.bernoulli import Bernoulli
 from probs.discrete.rv import DiscreteRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -31,7 +47,7 @@ class Binomial(DiscreteRV):
         return math.floor(self.n * self.p)
 
     def mode(self) -> float:
-        return math.floor((self.n + 1) * self.p)
+        return min(math.floor((self.n + 1) * self.p), self.n)
 
     def expectation(self) -> float:
         return self.n * self.p
@@ -39,10 +55,94 @@ class Binomial(DiscreteRV):
     def variance(self) -> float:
         return self.n * self.p * (1 - self.p)
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        trial = 1 - self.p + self.p * np.exp(1j * np.asarray(t))
+        return match_complex(t, trial**self.n)
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            trial = np.logaddexp(np.log1p(-self.p), np.log(self.p) + np.asarray(t))
+        return match_input(t, self.n * trial)
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        # The probability of success of the tilted trials, p e^t / (1 - p + p e^t).
+        with np.errstate(divide="ignore", over="ignore"):
+            odds = np.log(self.p) - np.log1p(-self.p) + np.asarray(t, dtype=float)
+            success = 1 / (1 + np.exp(-odds))
+        return (
+            match_input(t, self.n * success),
+            match_input(t, self.n * success * (1 - success)),
+        )
+
+    def support(self) -> tuple[float, float]:
+        return 0, self.n
+
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return (self.n - k) * self.p / ((k + 1) * (1 - self.p))
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Scalars are evaluated in constant time in n and k with the math module,
+        # rather than through scipy.stats, whose overhead dominates a single point.
+        if isinstance(x, np.ndarray):
+            return match_input(x, self._frozen.pmf(np.trunc(x)))
+        return math.exp(log_binomial_pmf(int(x), self.n, self.p))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return match_input(x, self._frozen.logpmf(np.trunc(x)))
+        return log_binomial_pmf(int(x), self.n, self.p)
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # P(X <= k) is the regularized incomplete beta function, as bdtr(k, n, p).
+        from scipy.special import bdtr  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        if isinstance(x, np.ndarray):
+            k = np.minimum(np.trunc(x), self.n)
+            return np.where(k >= 0, bdtr(np.maximum(k, 0), self.n, self.p), 0.0)
         k = int(x)
-        result = nCr(self.n, k) * (self.p**k)
-        # Cannot raise 0 to the negative power
-        if self.p == 1:
-            return result
-        return result * ((1 - self.p) ** (self.n - k))
+        if k < 0:
+            return 0.0
+        if k >= self.n:
+            return 1.0
+        return float(bdtr(k, self.n, self.p))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(np.trunc(x)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(np.trunc(x)))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.ppf(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.isf(q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, imported on first use."""
+        from scipy.stats import binom  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return binom(self.n, self.p)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).binomial(self.n, self.p, n)
+
+
+@register(Binomial, operator.add, Binomial)
+def _add_binomials(x: Binomial, y: Binomial) -> Binomial | None:
+    if x.p != y.p:
+        return None
+    return Binomial(n=x.n + y.n, p=x.p)
+
+
+@register(Binomial, operator.add, Bernoulli)
+def _add_binomial_bernoulli(x: Binomial, y: Bernoulli) -> Binomial | None:
+    if x.p != y.p:
+        return None
+    return Binomial(n=x.n + 1, p=x.p)
+
+
+@register(Bernoulli, operator.add, Binomial)
+def _add_bernoulli_binomial(x: Bernoulli, y: Binomial) -> Binomial | None:
+    return _add_binomial_bernoulli(y, x)
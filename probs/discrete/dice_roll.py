@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
 from probs.discrete.rv import DiscreteRV
+from probs.rv import Seed
 
 
 @dataclass(eq=False)
@@ -23,3 +27,6 @@ class DiceRoll(DiscreteRV):
             sum((i - self.expectation()) ** 2 for i in range(1, self.sides + 1))
             / self.sides
         )
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).integers(1, self.sides + 1, n)
@@ -1,7 +1,23 @@
 import math
+import operator
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+from scipy.special import xlog1py  # type: ignore[import-untyped]
+
+from probs.algebra import register
+from probs.discrete.negative_binomial import NegativeBinomial
 from probs.discrete.rv import DiscreteRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    RandomVariable,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -32,10 +48,83 @@ class Geometric(DiscreteRV):
     def variance(self) -> float:
         return (1 - self.p) / self.p**2
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        phase = np.exp(1j * np.asarray(t))
+        return match_complex(t, self.p * phase / (1 - (1 - self.p) * phase))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            failure = (1 - self.p) * np.exp(t_arr)
+            value = math.log(self.p) + t_arr - np.log1p(-failure)
+        return match_input(t, np.where(failure < 1, value, np.inf))
+
+    def support(self) -> tuple[float, float]:
+        return 1, math.inf
+
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return np.full(k.shape, 1 - self.p)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            k_arr = np.trunc(x)
+            return np.where(k_arr >= 1, self.p * (1 - self.p) ** (k_arr - 1), 0.0)
         k = int(x)
+        if k < 1:
+            return 0
         return self.p * (1 - self.p) ** (k - 1)
 
-    def cdf(self, x: float) -> float:
-        k = int(x)
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return 1 - (1 - self.p) ** np.maximum(np.trunc(x), 0)
+        k = max(int(x), 0)
         return 1 - (1 - self.p) ** k
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        k = np.trunc(x)
+        log_pmf = math.log(self.p) + xlog1py(k - 1, -self.p)
+        return match_input(x, np.where(k >= 1, log_pmf, -np.inf))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log(-np.expm1(self.logsf(np.trunc(x)))))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        k = np.maximum(np.trunc(x), 0)
+        return match_input(x, xlog1py(k, -self.p))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        # The smallest k with 1 - (1 - p)^k >= q.
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = np.maximum(np.ceil(np.log1p(-q_arr) / math.log1p(-self.p)), 1)
+            # Rounding in the ratio of logs can overshoot by one.
+            k = np.where((k > 1) & (self.cdf(k - 1) >= q_arr), k - 1, k)
+        return match_input(q, self._within(q_arr, k))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        # The smallest k with (1 - p)^k <= q.
+        q_arr = np.asarray(q, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = np.maximum(np.ceil(np.log(q_arr) / math.log1p(-self.p)), 1)
+            k = np.where((k > 1) & ((1 - self.p) ** (k - 1) <= q_arr), k - 1, k)
+        return match_input(q, self._within(q_arr, k))
+
+    def _within(self, q: FloatArray, k: FloatArray) -> FloatArray:
+        if self.p == 1:
+            k = np.ones_like(q)
+        return np.where((q >= 0) & (q <= 1), k, np.nan)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).geometric(self.p, n)
+
+
+@register(Geometric, operator.add, Geometric)
+def _add_geometrics(x: Geometric, y: Geometric) -> RandomVariable | None:
+    """
+    Geometric counts trials, including the success, whereas NegativeBinomial
+    counts failures, so the sum is shifted by the two successes.
+    """
+    if x.p != y.p:
+        return None
+    return NegativeBinomial(r=2, p=x.p) + 2
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from probs import instrument
+from probs.floats import ApproxFloat
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from probs.rv import ArrayOrFloat, FloatArray
+
+# Supports are stored densely, so a pmf is only treated as a lattice if its span
+# is not much larger than the number of values it has.
+_MAX_SPARSITY = 64
+_MIN_SPAN = 1024
+
+# Parametric pmfs are tabulated until their probabilities fall below this fraction
+# of the largest one.
+TAIL_TOLERANCE = 1e-16
+# Ratios are multiplied out this many at a time at first, doubling each block.
+_FIRST_BLOCK = 64
+# Convolutions with at most this many products are computed directly by numpy,
+# which is as fast as an FFT at this size and avoids importing scipy.signal.
+_DIRECT_PRODUCTS = 2**16
+
+
+@dataclass(eq=False)
+class Lattice:
+    """
+    A pmf over consecutive integers, stored as the probabilities of offset,
+    offset + 1, ... in one array. Sums and differences of independent lattice
+    random variables are convolutions of these arrays, which numpy (or an FFT,
+    for long arrays) computes far faster than combining pmf dicts pair by pair.
+
+    :param offset: The smallest value in the support.
+    :param probs: Probabilities of consecutive values starting at offset.
+    """
+
+    offset: int
+    probs: FloatArray
+
+    def __len__(self) -> int:
+        return len(self.probs)
+
+    @classmethod
+    def from_pmf(cls, pmf: dict[Any, float]) -> Lattice | None:
+        """
+        The lattice form of `pmf`, or None if it is empty, has non-integer values
+        or is too sparse to store densely.
+        """
+        if not pmf or not all(
+            isinstance(k, int | np.integer) and not isinstance(k, bool) for k in pmf
+        ):
+            return None
+        keys = np.fromiter(pmf, dtype=np.int64, count=len(pmf))
+        offset = int(keys.min())
+        span = int(keys.max()) - offset + 1
+        if span > max(_MAX_SPARSITY * len(pmf), _MIN_SPAN):
+            return None
+        probs = np.zeros(span)
+        np.add.at(
+            probs,
+            keys - offset,
+            np.fromiter(pmf.values(), dtype=float, count=len(pmf)),
+        )
+        return cls(offset, probs)
+
+    def to_pmf(self) -> dict[Any, float]:
+        """The dict view of the pmf, leaving out values with probability 0."""
+        (indices,) = np.nonzero(self.probs)
+        return {
+            self.offset + int(i): ApproxFloat(p)
+            for i, p in zip(indices.tolist(), self.probs[indices].tolist(), strict=True)
+        }
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            indices = x - self.offset
+            valid = (indices >= 0) & (indices < len(self)) & (x == np.trunc(x))
+            result = np.zeros(x.shape)
+            result[valid] = self.probs[indices[valid].astype(np.int64)]
+            return cast("FloatArray", result)
+        index = x - self.offset
+        if index != int(index) or not 0 <= index < len(self):
+            return 0
+        return float(self.probs[int(index)])
+
+    def add(self, other: Lattice) -> Lattice:
+        """The lattice of the sum of independent random variables."""
+        stats = instrument.current()
+        if stats is not None:
+            stats.convolution_products += len(self) * len(other)
+        if len(self) * len(other) <= _DIRECT_PRODUCTS:
+            probs = np.convolve(self.probs, other.probs)
+            return Lattice(self.offset + other.offset, probs)
+        from scipy import signal  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        method = signal.choose_conv_method(self.probs, other.probs)
+        probs = signal.convolve(self.probs, other.probs, method=method)
+        if method == "fft":
+            # FFTs leave round-off noise where the result should be 0.
+            probs[probs < np.finfo(float).eps * len(probs) * probs.max()] = 0
+        return Lattice(self.offset + other.offset, probs)
+
+    def scale(self, factor: int) -> Lattice:
+        """The lattice of factor * X, for a nonzero integer factor."""
+        if factor < 0:
+            flipped = Lattice(-(self.offset + len(self) - 1), self.probs[::-1])
+            return flipped.scale(-factor)
+        probs = np.zeros((len(self) - 1) * factor + 1)
+        probs[::factor] = self.probs
+        return Lattice(self.offset * factor, probs)
+
+    def shift(self, amount: int) -> Lattice:
+        return Lattice(self.offset + amount, self.probs)
+
+    def mode(self) -> int:
+        return self.offset + int(np.argmax(self.probs))
+
+
+def tabulate(
+    ratio: Callable[[FloatArray], FloatArray],
+    start: int,
+    start_prob: float,
+    support: tuple[float, float],
+    tolerance: float = TAIL_TOLERANCE,
+) -> Lattice:
+    """
+    Tabulates a unimodal pmf from the ratios p(k + 1) / p(k) of consecutive
+    probabilities, walking out from p(start) in both directions until the
+    probabilities fall below tolerance times the largest one, or the support ends.
+    The ratios are computed and multiplied out a block at a time, so the table
+    takes O(support) array operations rather than a special function per value.
+
+    :param ratio: p(k + 1) / p(k), for an array of k.
+    :param support: The smallest and largest values, which may be infinite.
+    """
+    if not start_prob > 0:
+        raise ValueError("The pmf must be positive where tabulating starts.")
+    lower, upper = support
+    above = _walk(
+        lambda ks: ratio(start + ks),
+        upper - start,
+        start_prob,
+        tolerance,
+    )
+    below = _walk(
+        lambda ks: 1 / ratio(start - 1 - ks),
+        start - lower,
+        start_prob,
+        tolerance,
+    )
+    probs = np.concatenate((below[::-1], [start_prob], above))
+    return Lattice(start - len(below), probs)
+
+
+def _walk(
+    factors: Callable[[FloatArray], FloatArray],
+    count: float,
+    prob: float,
+    tolerance: float,
+) -> FloatArray:
+    """
+    The next `count` probabilities after prob, each the previous one times
+    factors(i), stopping early at the first one below tolerance times the peak.
+    """
+    blocks = []
+    peak = prob
+    done = 0
+    size = _FIRST_BLOCK
+    while done < count:
+        steps = int(min(size, count - done))
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            probs = prob * np.cumprod(
+                factors(np.arange(done, done + steps, dtype=float))
+            )
+        peaks = np.maximum(peak, np.maximum.accumulate(np.nan_to_num(probs)))
+        # Also stops at nan, from 0 / 0 past the end of a degenerate support.
+        (small,) = np.nonzero(~(probs >= tolerance * peaks))
+        if len(small):
+            blocks.append(probs[: small[0]])
+            break
+        blocks.append(probs)
+        prob, peak = float(probs[-1]), float(peaks[-1])
+        done += steps
+        size *= 2
+    return np.concatenate(blocks) if blocks else np.zeros(0)
@@ -1,8 +1,23 @@
+import math
+import operator
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
-from scipy.stats import nbinom  # type: ignore[import-untyped]
+import numpy as np
+import numpy.typing as npt
+from scipy.special import betainc, gammaln, xlog1py, xlogy  # type: ignore[import-untyped]
 
+from probs.algebra import register
 from probs.discrete.rv import DiscreteRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -21,34 +36,108 @@ class NegativeBinomial(DiscreteRV):
     https://en.wikipedia.org/wiki/Negative_binomial_distribution
 
     :param r: Number of successes we want.
-    :param p: Probability of a failure.
+    :param p: Probability of a success.
     """
 
-    r: float = 0
+    r: float = 1
     p: float = 1
 
     def __post_init__(self) -> None:
         if self.r <= 0:
             raise ValueError("r must be greater than 0.")
-
-    def median(self) -> float:
-        raise NotImplementedError
+        # The terms of the log pmf that do not depend on k.
+        self._log_norm = float(xlogy(self.r, self.p) - gammaln(self.r))
 
     def mode(self) -> float:
         if self.r <= 1:
             return 0
-        return self.p * (self.r - 1) / (1 - self.p)
+        return math.floor((1 - self.p) * (self.r - 1) / self.p)
 
     def expectation(self) -> float:
-        return self.p * self.r / (1 - self.p)
+        return (1 - self.p) * self.r / self.p
 
     def variance(self) -> float:
-        return self.p * self.r / (1 - self.p) ** 2
+        return (1 - self.p) * self.r / self.p**2
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        # 1 - (1 - p)e^{it} has a positive real part, so the principal branch of
+        # the power is the continuous one.
+        failure = 1 - (1 - self.p) * np.exp(1j * np.asarray(t))
+        return match_complex(t, (self.p / failure) ** self.r)
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            failure = (1 - self.p) * np.exp(np.asarray(t, dtype=float))
+            value = self.r * (math.log(self.p) - np.log1p(-failure))
+        return match_input(t, np.where(failure < 1, value, np.inf))
+
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
 
-    def pdf(self, x: float) -> float:
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return (k + self.r) * (1 - self.p) / (k + 1)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # Evaluated directly rather than through scipy.stats, whose argument
+        # checking costs far more than the formula for a single point.
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
         k = int(x)
-        return float(nbinom.pmf(k, self.r, self.p))
+        if k < 0 or (k > 0 and self.p == 1):
+            return 0.0
+        failures = k * math.log1p(-self.p) if k else 0.0
+        return math.exp(
+            self._log_norm + math.lgamma(k + self.r) - math.lgamma(k + 1) + failures
+        )
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # P(X <= k) is the regularized incomplete beta function I_p(r, k + 1).
+        if isinstance(x, np.ndarray):
+            k = np.trunc(x)
+            return np.where(k >= 0, betainc(self.r, np.maximum(k, 0) + 1, self.p), 0.0)
         k = int(x)
-        return float(nbinom.cdf(k, self.r, self.p))
+        if k < 0:
+            return 0.0
+        return float(betainc(self.r, k + 1, self.p))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        k = np.trunc(x)
+        with np.errstate(invalid="ignore"):
+            log_pmf = (
+                self._log_norm
+                + gammaln(k + self.r)
+                - gammaln(k + 1)
+                + xlog1py(k, -self.p)
+            )
+        return match_input(x, np.where(k >= 0, log_pmf, -np.inf))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(np.trunc(x)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(np.trunc(x)))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.ppf(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.isf(q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, for the less frequently called methods."""
+        from scipy.stats import nbinom  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return nbinom(self.r, self.p)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).negative_binomial(self.r, self.p, n)
+
+
+@register(NegativeBinomial, operator.add, NegativeBinomial)
+def _add_negative_binomials(
+    x: NegativeBinomial, y: NegativeBinomial
+) -> NegativeBinomial | None:
+    if x.p != y.p:
+        return None
+    return NegativeBinomial(r=x.r + y.r, p=x.p)
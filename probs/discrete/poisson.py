@@ -1,7 +1,24 @@
 import math
+import operator
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+from scipy.special import gammaln, pdtr, xlogy  # type: ignore[import-untyped]
+
+from probs.algebra import register
+from probs.counting import log_poisson_pmf
 from probs.discrete.rv import DiscreteRV
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    FloatArray,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 
 @dataclass(eq=False)
@@ -21,9 +38,6 @@ class Poisson(DiscreteRV):
 
     lambda_: float = 0
 
-    def median(self) -> float:
-        raise NotImplementedError
-
     def mode(self) -> float:
         return math.floor(self.lambda_)
 
@@ -33,6 +47,70 @@ class Poisson(DiscreteRV):
     def variance(self) -> float:
         return self.lambda_
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        return match_complex(t, np.exp(self.lambda_ * np.expm1(1j * np.asarray(t))))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        with np.errstate(over="ignore"):
+            return match_input(t, self.lambda_ * np.expm1(t))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        with np.errstate(over="ignore"):
+            mean = match_input(t, self.lambda_ * np.exp(t))
+        return mean, mean
+
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
+
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        return self.lambda_ / (k + 1)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.exp(self.logpdf(x))
+        return math.exp(log_poisson_pmf(int(x), self.lambda_))
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if not isinstance(x, np.ndarray):
+            return log_poisson_pmf(int(x), self.lambda_)
+        # Evaluated via log-gamma so that large k neither overflows k! nor is slow.
+        k = np.trunc(x)
+        log_pmf = xlogy(k, self.lambda_) - self.lambda_ - gammaln(k + 1)
+        return np.where(k >= 0, log_pmf, -np.inf)
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        # P(X <= k) is the regularized upper incomplete gamma function, as pdtr.
+        if isinstance(x, np.ndarray):
+            k = np.trunc(x)
+            return np.where(k >= 0, pdtr(np.maximum(k, 0), self.lambda_), 0.0)
         k = int(x)
-        return self.lambda_**k * math.exp(-self.lambda_) / math.factorial(k)
+        if k < 0:
+            return 0.0
+        return float(pdtr(k, self.lambda_))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logcdf(np.trunc(x)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(x, self._frozen.logsf(np.trunc(x)))
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.ppf(q))
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return match_input(q, self._frozen.isf(q))
+
+    @cached_property
+    def _frozen(self) -> Any:
+        """The scipy distribution, imported on first use."""
+        from scipy.stats import poisson  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        return poisson(self.lambda_)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[np.int64]:
+        return np.random.default_rng(rng).poisson(self.lambda_, n)
+
+
+@register(Poisson, operator.add, Poisson)
+def _add_poissons(x: Poisson, y: Poisson) -> Poisson:
+    return Poisson(lambda_=x.lambda_ + y.lambda_)
@@ -1,88 +1,262 @@
 from __future__ import annotations
 
+import math
 import operator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+import numpy as np
+import numpy.typing as npt
+
+from probs import expression, instrument, montecarlo
+from probs.discrete.lattice import Lattice, tabulate
 from probs.floats import ApproxFloat
-from probs.rv import Event, RandomVariable
+from probs.rv import (
+    ArrayOrFloat,
+    ComplexArray,
+    Event,
+    FloatArray,
+    RandomVariable,
+    Seed,
+    match_complex,
+    match_input,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 T = TypeVar("T")
 
+# Slack allowed when matching a quantile against cumulative probabilities, so that
+# e.g. the median of a fair die is 3 despite rounding in the cumulative sums.
+_QUANTILE_TOL = 1e-12
+
 
 @dataclass(eq=False)
 class DiscreteRV(RandomVariable):
     pmf: dict[Any, float] = field(default_factory=dict)
+    # The pmf it was built from, its size then, and the lattice (see `lattice`).
+    _lattice: tuple[dict[Any, float], int, Lattice | None] | None = field(
+        default=None, init=False, repr=False
+    )
+    # The pmf it was built from, its size then, its sorted values and the cumulative
+    # probabilities before each of them (see `cdf`).
+    _cdf_index: tuple[dict[Any, float], int, npt.NDArray[Any], FloatArray] | None = (
+        field(default=None, init=False, repr=False)
+    )
+    # The tabulated lattice of a parametric family and its dict view (see
+    # `pmf_table`).
+    _table: tuple[Lattice, dict[Any, float]] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def __add__(self, other: object) -> DiscreteRV:
         if isinstance(other, DiscreteRV):
-            result = type(self)()
-            result.pmf = self.combine_pmf(self.pmf, other.pmf, operator.add)
-            result.expectation = lambda: self.expectation() + other.expectation()  # type: ignore[attr-defined,method-assign,unused-ignore]
-            # Assumes Independence of X and Y, else add (+ 2 * Cov(X, Y)) term
-            result.variance = lambda: self.variance() + other.variance()  # type: ignore[attr-defined,method-assign,unused-ignore]
-            return result
+            return cast("DiscreteRV", expression.add(self, other))
         return cast("DiscreteRV", super().__add__(other))
 
     def __sub__(self, other: object) -> DiscreteRV:
         if isinstance(other, DiscreteRV):
-            result = type(self)()
-            result.pmf = self.combine_pmf(self.pmf, other.pmf, operator.sub)
-            result.expectation = lambda: self.expectation() - other.expectation()  # type: ignore[attr-defined,method-assign,unused-ignore]
-            result.variance = lambda: self.variance() - other.variance()  # type: ignore[attr-defined,method-assign,unused-ignore]
-            return result
+            return cast("DiscreteRV", expression.subtract(self, other))
         return cast("DiscreteRV", super().__sub__(other))
 
     def __mul__(self, other: object) -> DiscreteRV:
         if isinstance(other, DiscreteRV):
-            result = type(self)()
-            result.pmf = self.combine_pmf(self.pmf, other.pmf, operator.mul)
-            # Assumes Independence of X and Y
-            result.expectation = lambda: self.expectation() * other.expectation()  # type: ignore[attr-defined,method-assign,unused-ignore]
-            result.variance = (  # type: ignore[method-assign]
-                lambda: (
-                    (self.variance() ** 2 + self.expectation() ** 2)
-                    + (other.variance() ** 2 + other.expectation() ** 2)
-                    - (self.expectation() * other.expectation()) ** 2
-                )
-            )
-            return result
+            return cast("DiscreteRV", expression.multiply(self, other))
         return cast("DiscreteRV", super().__mul__(other))
 
     def __truediv__(self, other: object) -> DiscreteRV:
         if isinstance(other, DiscreteRV):
-            result = type(self)()
-            result.pmf = self.combine_pmf(self.pmf, other.pmf, operator.truediv)
-            result.expectation = lambda: (_ for _ in ()).throw(  # type: ignore[method-assign]
-                NotImplementedError("Expectation cannot be implemented for division.")
-            )
-            result.variance = lambda: (_ for _ in ()).throw(  # type: ignore[method-assign]
-                NotImplementedError("Variance cannot be implemented for division.")
-            )
-            return result
+            return cast("DiscreteRV", expression.divide(self, other))
         return cast("DiscreteRV", super().__truediv__(other))
 
+    def sum_iid(self, n: int) -> DiscreteRV:
+        """
+        The sum of n independent copies of this random variable, i.e.
+        X_1 + ... + X_n, in O(log n) convolutions. Note that `n * X` scales X
+        instead, which is a different random variable.
+        """
+        return cast("DiscreteRV", expression.sum_iid(self, n))
+
     def __eq__(self, other: object) -> Event:  # type: ignore[override]
         """
         Discrete Variables can be compare using equality operators to form Events,
         e.g. P(A == B) or P(A == 1).
         """
         if isinstance(other, int | float):
-            return Event(self.pdf(other))
+            return Event(0 if self._off_support(other) else self.pdf(other))
         if isinstance(other, RandomVariable):
             return Event((self - other).pdf(0))
         return NotImplemented
 
+    def _off_support(self, x: float) -> bool:
+        """
+        Whether x certainly has no probability, which the pdf of the parametric
+        families does not check: they truncate non-integers, and some give
+        nonzero values outside their support.
+        """
+        try:
+            lower, upper = self.support()
+        except NotImplementedError:
+            pass
+        else:
+            if not lower <= x <= upper:
+                return True
+        return not float(x).is_integer() and self.lattice() is not None
+
     def __hash__(self) -> int:
         return hash(self.pmf)
 
+    def __lt__(self, other: object) -> Event:
+        """
+        P(A < B) or P(A < x), which unlike the cdf excludes x itself. It is looked
+        up from the cdf alone, since the pdf of the parametric families truncates
+        non-integers.
+        """
+        if montecarlo.is_enabled():
+            return super().__lt__(other)
+        if isinstance(other, RandomVariable):
+            return self - other < 0
+        if isinstance(other, int | float):
+            return Event(self._cdf_below(other))
+        return NotImplemented
+
+    def __ge__(self, other: object) -> Event:
+        if montecarlo.is_enabled():
+            return super().__ge__(other)
+        if isinstance(other, RandomVariable):
+            return self - other >= 0
+        if isinstance(other, int | float):
+            return Event(1 - self._cdf_below(other))
+        return NotImplemented
+
+    def __le__(self, other: object) -> Event:
+        if montecarlo.is_enabled():
+            return super().__le__(other)
+        if isinstance(other, RandomVariable):
+            return self - other <= 0
+        if isinstance(other, int | float):
+            return Event(self.cdf(other))
+        return NotImplemented
+
+    def __gt__(self, other: object) -> Event:
+        if montecarlo.is_enabled():
+            return super().__gt__(other)
+        if isinstance(other, RandomVariable):
+            return self - other > 0
+        if isinstance(other, int | float):
+            return Event(1 - self.cdf(other))
+        return NotImplemented
+
+    def _cdf_below(self, x: float) -> float:
+        """P(X < x): the cdf at the previous integer if the support is integral."""
+        if math.isfinite(x) and self.lattice() is not None:
+            return float(self.cdf(math.ceil(x) - 1))
+        keys, cumulative = self._sorted_cdf()
+        if not len(keys):
+            return float(self.cdf(x))
+        return float(cumulative[np.searchsorted(keys, x, side="left")])
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Only called for missing attributes. Derived random variables compute their
+        pmf from their expression node on first access, rather than when built.
+        """
+        if name == "pmf" and self._node is not None:
+            self.pmf = self._node.pmf
+            return self.pmf
+        raise AttributeError(name)
+
+    def lattice(self) -> Lattice | None:
+        """
+        The pmf as an array over consecutive integers, or None if its support is not
+        integral (or too sparse). It is built on first use and rebuilt if the pmf is
+        replaced or resized; derived random variables get it from their node, which
+        convolves the lattices of their terms without building any pmf dicts.
+
+        Parametric families leave `pmf` empty, and instead tabulate their pmf here
+        from `support` and `pmf_ratio`, cutting off tails below
+        `lattice.TAIL_TOLERANCE` of the mode.
+        """
+        if self._node is not None:
+            return self._node.lattice
+        cache = self._lattice
+        if cache is None or cache[0] is not self.pmf or cache[1] != len(self.pmf):
+            table = Lattice.from_pmf(self.pmf) if self.pmf else self._tabulate()
+            cache = (self.pmf, len(self.pmf), table)
+            self._lattice = cache
+        return cache[2]
+
+    def _tabulate(self) -> Lattice | None:
+        try:
+            lower, upper = self.support()
+        except NotImplementedError:
+            return None
+        # Start from the value nearest the mean, which is close to the mode.
+        start = int(min(max(round(self.expectation()), lower), upper))
+        return tabulate(self.pmf_ratio, start, float(self.pdf(start)), (lower, upper))
+
+    def support(self) -> tuple[float, float]:
+        """
+        The smallest and largest values of a parametric family, which may be
+        infinite. Families that define it and `pmf_ratio` get a tabulated pmf.
+        """
+        raise NotImplementedError
+
+    def pmf_ratio(self, k: FloatArray) -> FloatArray:
+        """p(k + 1) / p(k) for each k, from which parametric pmfs are tabulated."""
+        raise NotImplementedError
+
+    def pmf_table(self) -> dict[Any, float]:
+        """
+        The pmf as a dict, which for parametric families is the dict view of their
+        tabulated `lattice` (cached), and otherwise is just `pmf`. Generic methods
+        and arithmetic use this so that they also work on parametric families.
+        """
+        if self.pmf or self._node is not None:
+            return self.pmf
+        lattice = self.lattice()
+        if lattice is None:
+            return self.pmf
+        if self._table is None or self._table[0] is not lattice:
+            self._table = (lattice, lattice.to_pmf())
+        return self._table[1]
+
+    def discarded_mass(self) -> float:
+        """
+        The probability dropped from the pmf of this random variable while
+        computing it, if it was built with truncation enabled (see
+        `probs.truncation`). This bounds how far any probability computed from the
+        pmf can be from its exact value.
+        """
+        if self._node is None:
+            return 0.0
+        return self._node.discarded_mass()
+
+    def _sorted_cdf(self) -> tuple[npt.NDArray[Any], FloatArray]:
+        """
+        The values of the pmf in order, and the cumulative probabilities before each
+        of them with the total appended. Like `lattice`, it is kept until the pmf is
+        replaced or resized.
+        """
+        pmf = self.pmf_table()
+        cache = self._cdf_index
+        if cache is None or cache[0] is not pmf or cache[1] != len(pmf):
+            keys = sorted(pmf)
+            cumulative = np.concatenate(
+                ([0.0], np.cumsum([pmf[k] for k in keys], dtype=float))
+            )
+            cache = (pmf, len(pmf), np.array(keys), cumulative)
+            self._cdf_index = cache
+        return cache[2], cache[3]
+
     @staticmethod
     def combine_pmf(
         first: dict[T, float], second: dict[T, float], op: Callable[[T, T], T]
     ) -> dict[T, float]:
+        stats = instrument.current()
+        if stats is not None:
+            stats.pmf_pairs += len(first) * len(second)
         pmf: dict[T, float] = {}
         for a, prob_a in first.items():
             for b, prob_b in second.items():
@@ -95,10 +269,16 @@ class DiscreteRV(RandomVariable):
         assert all(a >= 0 for a in self.pmf.values())
 
     def mode(self) -> Any:
-        return max(self.pmf.items(), key=operator.itemgetter(1))[0]
+        return max(self.pmf_table().items(), key=operator.itemgetter(1))[0]
 
     def median(self) -> float:
-        raise NotImplementedError
+        """
+        General implementation of the median as the smallest value x with
+        P(X <= x) >= 1/2, which may be overridden in child classes.
+        """
+        if not self.pmf_table():
+            raise NotImplementedError
+        return self.ppf(0.5)
 
     def expectation(self) -> float:
         raise NotImplementedError
@@ -106,7 +286,34 @@ class DiscreteRV(RandomVariable):
     def variance(self) -> float:
         raise NotImplementedError
 
-    def pdf(self, x: float) -> float:
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        """
+        General implementation of the characteristic function as a sum over the pmf,
+        which child classes with infinite support override with a closed form.
+        """
+        keys, probabilities = self._weights()
+        phases = np.exp(1j * np.multiply.outer(np.asarray(t, dtype=float), keys))
+        return match_complex(t, phases @ probabilities)
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        """General implementation of the cgf as a log-sum-exp over the pmf."""
+        keys, probabilities = self._weights()
+        with np.errstate(divide="ignore"):
+            exponents = np.multiply.outer(np.asarray(t, dtype=float), keys) + np.log(
+                probabilities
+            )
+        largest = exponents.max(axis=-1)
+        total = np.exp(exponents - largest[..., np.newaxis]).sum(axis=-1)
+        return match_input(t, largest + np.log(total))
+
+    def _weights(self) -> tuple[FloatArray, FloatArray]:
+        """The values of the pmf in order and their probabilities, as floats."""
+        keys, cumulative = self._sorted_cdf()
+        if not len(keys):
+            raise NotImplementedError
+        return keys.astype(float), np.diff(cumulative)
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
         """
         General implementation of the pdf function, which may be overridden
         in child classes to provide a clearer/more efficient implementation.
@@ -115,11 +322,51 @@ class DiscreteRV(RandomVariable):
         because this way allows us to access the pmf's keys internally without
         accidentally adding empty values.
         """
-        return self.pmf.get(x, 0)
+        if isinstance(x, np.ndarray):
+            lattice = self.lattice()
+            if lattice is not None:
+                return lattice.pdf(x)
+            pmf = self.pmf_table()
+            return np.array([pmf.get(k, 0) for k in x.tolist()], dtype=float)
+        return self.pmf_table().get(x, 0)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        """
+        General implementation of sampling from the pmf, which may be overridden
+        in child classes to provide a more efficient implementation.
+        """
+        pmf = self.pmf_table()
+        if not pmf:
+            raise ValueError("Cannot sample from an empty pmf.")
+        values = np.array(list(pmf))
+        weights = np.fromiter(pmf.values(), dtype=float, count=len(pmf))
+        return np.random.default_rng(rng).choice(values, n, p=weights / weights.sum())
 
-    def cdf(self, x: float) -> float:
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
         """
         General implementation of the cdf function, which may be overridden
         in child classes to provide a clearer/more efficient implementation.
+
+        The pmf is sorted and summed once (see `_sorted_cdf`), after which every
+        point is a binary search for the values up to and including it.
+        """
+        keys, cumulative = self._sorted_cdf()
+        if isinstance(x, np.ndarray):
+            return cumulative[np.searchsorted(keys, x, side="right")]
+        return float(cumulative[np.searchsorted(keys, x, side="right")])
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The quantile function: the smallest value x in the pmf with P(X <= x) >= q.
+        Since the cdf is a step function, this is only a left inverse of it.
         """
-        return sum(self.pdf(item) for item in sorted(self.pmf) if item < x)
+        keys, cumulative = self._sorted_cdf()
+        if not len(keys):
+            raise ValueError("Cannot compute quantiles of an empty pmf.")
+        indices = np.searchsorted(cumulative[1:], np.asarray(q) - _QUANTILE_TOL)
+        values = keys[np.minimum(indices, len(keys) - 1)]
+        if isinstance(q, np.ndarray):
+            return np.where((q >= 0) & (q <= 1), values, np.nan)
+        if not 0 <= q <= 1:
+            return math.nan
+        return values.item()  # type: ignore[no-any-return]
@@ -0,0 +1,1042 @@
+"""
+Arithmetic on random variables builds a lazy expression graph rather than
+evaluating anything. Each derived random variable is a carrier of its left
+operand's class whose methods are bound to a node of the graph, and nothing is
+integrated or convolved until one of those methods is called.
+
+Before a node is created, the expression is simplified:
+
+- constants are folded (`X + 0` and `X * 1` are `X`);
+- chains of shifts and scales are merged into one affine node;
+- sums are flattened into one n-ary node, with shifts pulled out of the terms;
+- closed-form rules (see `probs.algebra`) are applied, also between terms of a sum.
+
+Nodes are hash-consed on the identity of their operands, so building the same
+subexpression twice shares one node and its results.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import weakref
+from dataclasses import dataclass, field
+from functools import cached_property, reduce
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import numpy as np
+
+from probs import algebra, instrument, rv, truncation
+from probs.cache import cached
+from probs.quantile import QuantileSolver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    from probs.continuous.grid import GridRV, LogGridRV
+    from probs.discrete.lattice import Lattice
+    from probs.discrete.rv import DiscreteRV
+    from probs.rv import ArrayOrFloat, ComplexArray, RandomVariable, Seed
+    from probs.truncation import TruncationSettings
+
+T = TypeVar("T")
+
+_nodes: weakref.WeakValueDictionary[tuple[Any, ...], Node] = (
+    weakref.WeakValueDictionary()
+)
+
+
+@dataclass(eq=False)
+class Node:
+    """
+    An operation in the expression graph. The pdf/cdf of discrete nodes are looked
+    up in their pmf, which is computed once; continuous nodes evaluate their
+    operands, memoizing points through `probs.cache`.
+
+    :param discrete: Whether the result is a discrete random variable.
+    """
+
+    discrete: bool
+    # Captured from `probs.truncation` when a discrete node is built. Only nodes
+    # whose support can grow apply it.
+    truncation: TruncationSettings | None = field(default=None, init=False, repr=False)
+    # The probability discarded by truncating this node, excluding its operands.
+    discarded: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        raise NotImplementedError
+
+    @cached_property
+    def pmf(self) -> dict[Any, float]:
+        if self.combined_lattice is not None:
+            return self.combined_lattice.to_pmf()
+        return self.combine_pmf()
+
+    def combine_pmf(self) -> dict[Any, float]:
+        """Computes the pmf of a discrete node from the pmfs of its operands."""
+        raise NotImplementedError
+
+    @cached_property
+    def combined_lattice(self) -> Lattice | None:
+        """
+        The lattice of a discrete node computed from the lattices of its operands,
+        for nodes and operands that have one, in which case no pmf dicts are built.
+        """
+        return None
+
+    @cached_property
+    def lattice(self) -> Lattice | None:
+        """The pmf of a discrete node as a `Lattice`, if its support is integral."""
+        from probs.discrete.lattice import Lattice  # noqa: PLC0415
+
+        if self.combined_lattice is not None:
+            return self.combined_lattice
+        return Lattice.from_pmf(self.pmf)
+
+    def discarded_mass(self) -> float:
+        """
+        The probability discarded by truncating this node and its operands, which
+        bounds the total variation distance from the exact pmf.
+        """
+        from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+        _ = self.lattice
+        return self.discarded + math.fsum(
+            operand.discarded_mass()
+            for operand in self.operands
+            if isinstance(operand, DiscreteRV)
+        )
+
+    def _add_pmfs(
+        self, first: dict[Any, float], second: dict[Any, float]
+    ) -> dict[Any, float]:
+        from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+        return self._truncate_pmf(DiscreteRV.combine_pmf(first, second, operator.add))
+
+    def _add_lattices(self, first: Lattice, second: Lattice) -> Lattice:
+        return self._truncate_lattice(first.add(second))
+
+    def _truncate_pmf(self, pmf: dict[Any, float]) -> dict[Any, float]:
+        if self.truncation is None:
+            return pmf
+        pmf, discarded = truncation.truncate_pmf(pmf, self.truncation)
+        self.discarded += discarded
+        return pmf
+
+    def _truncate_lattice(self, lattice: Lattice) -> Lattice:
+        if self.truncation is None:
+            return lattice
+        lattice, discarded = truncation.truncate_lattice(lattice, self.truncation)
+        self.discarded += discarded
+        return lattice
+
+    @cached_property
+    def table(self) -> DiscreteRV:
+        from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+        table = DiscreteRV(self.pmf)
+        if "lattice" in self.__dict__:
+            table._lattice = (table.pmf, len(table.pmf), self.lattice)  # noqa: SLF001
+        return table
+
+    @cached_property
+    def _pdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.discrete:
+            return self.table.pdf
+        return rv.vectorize(cached("pdf", self.density))  # type: ignore[arg-type]
+
+    @cached_property
+    def _cdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.discrete:
+            return self.table.cdf
+        return rv.vectorize(
+            cached("cdf", lambda v: integrate_cdf(self.pdf, self.support(), v))  # type: ignore[arg-type]
+        )
+
+    def support(self) -> tuple[float, float]:
+        """
+        The interval holding every value of the node, found from the supports of
+        its operands (to which the integrals of continuous nodes are restricted),
+        or else from the pmf of discrete nodes.
+        """
+        if self.discrete:
+            return min(self.pmf), max(self.pmf)
+        return -math.inf, math.inf
+
+    def moment(self, s: float) -> float:
+        """E[X^s] of a positive continuous node (see `ContinuousRV.moment`)."""
+        raise NotImplementedError
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        """The characteristic function, computed from the pmf of discrete nodes."""
+        if self.discrete:
+            return self.table.cf(t)
+        raise NotImplementedError
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        if self.discrete:
+            return self.table.cgf(t)
+        raise NotImplementedError
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        raise NotImplementedError
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._pdf(x)
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        return self._cdf(x)
+
+    def density(self, z: float) -> float:
+        """The pdf at a single point, for continuous nodes."""
+        raise NotImplementedError
+
+    def expectation(self) -> float:
+        raise NotImplementedError
+
+    def variance(self) -> float:
+        raise NotImplementedError
+
+    def median(self) -> float:
+        if self.discrete:
+            return self.table.median()
+        return self.ppf(0.5)
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The quantile function, looked up in the pmf of discrete nodes and solved
+        from the cdf of continuous ones (see `probs.quantile`).
+        """
+        if self.discrete:
+            return self.table.ppf(q)
+        return self.quantiles.ppf(q)
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return self.ppf(1 - q)
+
+    @cached_property
+    def quantiles(self) -> QuantileSolver:
+        return QuantileSolver.of(self)  # type: ignore[arg-type]
+
+    def mode(self) -> float:
+        if self.discrete:
+            return self.table.mode()  # type: ignore[no-any-return]
+        raise NotImplementedError
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        raise NotImplementedError
+
+
+@dataclass(eq=False)
+class Affine(Node):
+    """`scale * base + shift`, with scale != 0."""
+
+    base: RandomVariable
+    scale: float
+    shift: float
+
+    def __repr__(self) -> str:
+        return f"Affine({self.base!r}, scale={self.scale}, shift={self.shift})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return (self.base,)
+
+    def combine_pmf(self) -> dict[Any, float]:
+        pmf: dict[Any, float] = self.base.pmf_table()  # type: ignore[attr-defined]
+        return {self.scale * k + self.shift: p for k, p in pmf.items()}
+
+    @cached_property
+    def combined_lattice(self) -> Lattice | None:
+        if not (float(self.scale).is_integer() and float(self.shift).is_integer()):
+            return None
+        base: Lattice | None = self.base.lattice()  # type: ignore[attr-defined]
+        if base is None:
+            return None
+        return base.scale(int(self.scale)).shift(int(self.shift))
+
+    @cached_property
+    def _pdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.discrete:
+            if self.base.pmf_table():  # type: ignore[attr-defined]
+                return self.table.pdf
+            # Families without a tabulated pmf are evaluated point by point.
+            return lambda z: self._family_pdf(self._inverse(z))
+        return cached(
+            "pdf", lambda z: self.base.pdf(self._inverse(z)) / abs(self.scale)
+        )
+
+    @cached_property
+    def _cdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.discrete and self.base.pmf_table():  # type: ignore[attr-defined]
+            return self.table.cdf
+        if self.scale > 0:
+            return cached("cdf", lambda z: self.base.cdf(self._inverse(z)))
+        return cached("cdf", lambda z: 1 - self.base.cdf(self._inverse(z)))
+
+    def _inverse(self, z: ArrayOrFloat) -> ArrayOrFloat:
+        return (z - self.shift) / self.scale
+
+    def _family_pdf(self, k: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The pmf of an untabulated base at k, which is 0 off its support and, for
+        families defining one (which take integer values), at non-integers, where
+        their pdf would truncate k instead.
+        """
+        try:
+            lower, upper = self.base.support()
+            integral = True
+        except NotImplementedError:
+            (lower, upper), integral = _support(self.base), False
+        k_arr = np.asarray(k, dtype=float)
+        within = (k_arr >= lower) & (k_arr <= upper)
+        if integral:
+            within &= k_arr == np.trunc(k_arr)
+        if not isinstance(k, np.ndarray):
+            return self.base.pdf(k) if within else 0.0
+        return np.where(within, self.base.pdf(k), 0.0)
+
+    def support(self) -> tuple[float, float]:
+        lower, upper = _scale(_support(self.base), self.scale)
+        return lower + self.shift, upper + self.shift
+
+    def moment(self, s: float) -> float:
+        if self.shift != 0 or self.scale < 0:
+            raise NotImplementedError
+        return math.pow(self.scale, s) * _moment(self.base, s)
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        t_arr = np.asarray(t, dtype=float)
+        phase = np.exp(1j * self.shift * t_arr)
+        return rv.match_complex(t, phase * self.base.cf(self.scale * t_arr))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        return rv.match_input(t, self.shift * t_arr + self.base.cgf(self.scale * t_arr))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        slope, curvature = self.base.cgf_derivatives(
+            self.scale * np.asarray(t, dtype=float)
+        )
+        return (
+            rv.match_input(t, self.shift + self.scale * np.asarray(slope)),
+            rv.match_input(t, self.scale**2 * np.asarray(curvature)),
+        )
+
+    def expectation(self) -> float:
+        return self.scale * self.base.expectation() + self.shift
+
+    def variance(self) -> float:
+        return self.scale**2 * self.base.variance()
+
+    def median(self) -> float:
+        # Flipping a step function moves the median, as for ppf.
+        if self.discrete:
+            return self.ppf(0.5)
+        return self.scale * self.base.median() + self.shift
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        # Flipping a step function also moves which end of each step is included.
+        if self.discrete and self.scale < 0:
+            return super().ppf(q)
+        base = self.base.ppf(q) if self.scale > 0 else self.base.isf(q)
+        return self.scale * base + self.shift
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        if self.discrete and self.scale < 0:
+            return super().isf(q)
+        base = self.base.isf(q) if self.scale > 0 else self.base.ppf(q)
+        return self.scale * base + self.shift
+
+    def mode(self) -> float:
+        return self.scale * self.base.mode() + self.shift
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        return self.scale * self.base.sample(n, rng) + self.shift
+
+
+@dataclass(eq=False)
+class Sum(Node):
+    """
+    The sum of two or more independent terms. Continuous sums of two terms are
+    integrated directly. Longer sums are computed on a grid, by inverting the
+    product of the terms' characteristic functions if they all have one (see
+    `invert`), or else by convolving their tabulated densities (see
+    `convolve_all`). Either way the cost grows linearly with the number of terms.
+    """
+
+    terms: tuple[RandomVariable, ...]
+
+    def __repr__(self) -> str:
+        return f"Sum({', '.join(map(repr, self.terms))})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return self.terms
+
+    def combine_pmf(self) -> dict[Any, float]:
+        pmfs = (term.pmf_table() for term in self.terms)  # type: ignore[attr-defined]
+        return reduce(self._add_pmfs, pmfs)
+
+    @cached_property
+    def combined_lattice(self) -> Lattice | None:
+        lattices: list[Lattice] = []
+        for term in self.terms:
+            lattice = term.lattice()  # type: ignore[attr-defined]
+            if lattice is None:
+                return None
+            lattices.append(lattice)
+        # Shortest first, so that intermediate results stay small.
+        return reduce(self._add_lattices, sorted(lattices, key=len))
+
+    @cached_property
+    def fourier(self) -> bool:
+        """Whether every term of a continuous sum has a characteristic function."""
+        return not self.discrete and all(map(_has_cf, self.terms))
+
+    @cached_property
+    def grid(self) -> GridRV:
+        if self.fourier:
+            from probs.continuous.grid import invert  # noqa: PLC0415
+
+            return invert(self.terms)
+        from probs.continuous.grid import convolve_all  # noqa: PLC0415
+
+        return convolve_all(self.terms)  # type: ignore[arg-type]
+
+    @cached_property
+    def _pdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if not self.discrete and len(self.terms) > 2:
+            return self.grid.pdf
+        return super()._pdf
+
+    @cached_property
+    def _cdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.discrete:
+            return super()._cdf
+        if len(self.terms) > 2:
+            return self.grid.cdf
+        # One integral over the cdf of the first term, rather than integrating
+        # the pdf, which is itself an integral. The cdf is 0 unless z - x is above
+        # the lower end of the first term's support.
+        first, second = self.terms
+        first_lower = _support(first)[0]
+        lower, upper = _support(second)
+        return rv.vectorize(
+            cached(
+                "cdf",
+                lambda z: _integrate(  # type: ignore[arg-type]
+                    lambda x: first.cdf(z - x) * second.pdf(x),
+                    (lower, min(upper, z - first_lower)),
+                ),
+            )
+        )
+
+    def support(self) -> tuple[float, float]:
+        supports = [_support(term) for term in self.terms]
+        return sum(lower for lower, _ in supports), sum(upper for _, upper in supports)
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        t_arr = np.asarray(t, dtype=float)
+        return rv.match_complex(t, math.prod(term.cf(t_arr) for term in self.terms))
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        t_arr = np.asarray(t, dtype=float)
+        return rv.match_input(t, sum(term.cgf(t_arr) for term in self.terms))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        t_arr = np.asarray(t, dtype=float)
+        slopes, curvatures = zip(
+            *(term.cgf_derivatives(t_arr) for term in self.terms), strict=True
+        )
+        return rv.match_input(t, sum(slopes)), rv.match_input(t, sum(curvatures))
+
+    def density(self, z: float) -> float:
+        first, second = self.terms
+        # Both x and z - x must be in the supports of the terms.
+        shifted = _scale(_support(second), -1)
+        return _integrate(
+            lambda x: first.pdf(x) * second.pdf(z - x),
+            _intersect(_support(first), (shifted[0] + z, shifted[1] + z)),
+        )
+
+    def expectation(self) -> float:
+        return math.fsum(term.expectation() for term in self.terms)
+
+    def variance(self) -> float:
+        # Assumes Independence of the terms, else add (+ 2 * Cov(X, Y)) terms
+        return math.fsum(term.variance() for term in self.terms)
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        generator = np.random.default_rng(rng)
+        total = self.terms[0].sample(n, generator)
+        for term in self.terms[1:]:
+            total = total + term.sample(n, generator)
+        return total
+
+
+@dataclass(eq=False)
+class IIDSum(Node):
+    """The sum of `count` independent copies of a discrete `base`."""
+
+    base: RandomVariable
+    count: int
+
+    def __repr__(self) -> str:
+        return f"IIDSum({self.base!r}, {self.count})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return (self.base,)
+
+    def combine_pmf(self) -> dict[Any, float]:
+        return self._sum_copies(self.base.pmf_table(), self._add_pmfs)  # type: ignore[attr-defined]
+
+    @cached_property
+    def combined_lattice(self) -> Lattice | None:
+        base: Lattice | None = self.base.lattice()  # type: ignore[attr-defined]
+        if base is None:
+            return None
+        return self._sum_copies(base, self._add_lattices)
+
+    def _sum_copies(self, base: T, add: Callable[[T, T], T]) -> T:
+        """
+        Adds count copies of base by repeated doubling. The probability discarded
+        from a partial sum is carried into each later sum it is added to, so it is
+        counted once for every time it is doubled.
+        """
+
+        def add_tracked(
+            first: tuple[T, float], second: tuple[T, float]
+        ) -> tuple[T, float]:
+            before = self.discarded
+            total = add(first[0], second[0])
+            return total, first[1] + second[1] + self.discarded - before
+
+        result, self.discarded = _repeated_sum((base, 0.0), self.count, add_tracked)
+        return result
+
+    def discarded_mass(self) -> float:
+        _ = self.lattice
+        base: float = self.base.discarded_mass()  # type: ignore[attr-defined]
+        return self.discarded + self.count * base
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        return rv.match_complex(
+            t, self.base.cf(np.asarray(t, dtype=float)) ** self.count
+        )
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        return rv.match_input(t, self.count * self.base.cgf(np.asarray(t, dtype=float)))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        slope, curvature = self.base.cgf_derivatives(np.asarray(t, dtype=float))
+        return (
+            rv.match_input(t, self.count * np.asarray(slope)),
+            rv.match_input(t, self.count * np.asarray(curvature)),
+        )
+
+    def expectation(self) -> float:
+        return self.count * self.base.expectation()
+
+    def variance(self) -> float:
+        return self.count * self.base.variance()
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        generator = np.random.default_rng(rng)
+        total = self.base.sample(n, generator)
+        for _ in range(self.count - 1):
+            total = total + self.base.sample(n, generator)
+        return total
+
+
+@dataclass(eq=False)
+class Product(Node):
+    left: RandomVariable
+    right: RandomVariable
+
+    def __repr__(self) -> str:
+        return f"Product({self.left!r}, {self.right!r})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return self.left, self.right
+
+    def combine_pmf(self) -> dict[Any, float]:
+        from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+        return self._truncate_pmf(
+            DiscreteRV.combine_pmf(
+                self.left.pmf_table(),  # type: ignore[attr-defined]
+                self.right.pmf_table(),  # type: ignore[attr-defined]
+                operator.mul,
+            )
+        )
+
+    @cached_property
+    def positive(self) -> bool:
+        """
+        Whether both operands are positive with a Mellin transform, in which case
+        the product is tabulated in log space (see `log_convolve`).
+        """
+        return not self.discrete and _positive(self.left) and _positive(self.right)
+
+    @cached_property
+    def grid(self) -> LogGridRV:
+        from probs.continuous.grid import log_convolve  # noqa: PLC0415
+
+        return log_convolve(self.left, self.right)  # type: ignore[arg-type]
+
+    @cached_property
+    def _pdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.positive:
+            return self.grid.pdf
+        return super()._pdf
+
+    @cached_property
+    def _cdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.positive:
+            return self.grid.cdf
+        return super()._cdf
+
+    def support(self) -> tuple[float, float]:
+        return _multiply(_support(self.left), _support(self.right))
+
+    def moment(self, s: float) -> float:
+        return _moment(self.left, s) * _moment(self.right, s)
+
+    def density(self, z: float) -> float:
+        # x must be in the support of the left operand, and z / x in that of the
+        # right, i.e. x in z / (right support).
+        return _integrate(
+            lambda x: (self.left.pdf(x) * self.right.pdf(z / x)) / abs(x),
+            _intersect(
+                _support(self.left), _scale(_reciprocal(_support(self.right)), z)
+            ),
+        )
+
+    def expectation(self) -> float:
+        # Assumes Independence of X and Y
+        return self.left.expectation() * self.right.expectation()
+
+    def variance(self) -> float:
+        # Var(XY) = E[X^2] E[Y^2] - E[X]^2 E[Y]^2 for independent X and Y.
+        left_mean, right_mean = self.left.expectation(), self.right.expectation()
+        return (self.left.variance() + left_mean**2) * (
+            self.right.variance() + right_mean**2
+        ) - (left_mean * right_mean) ** 2
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        if self.positive:
+            return self.grid.ppf(q)
+        return super().ppf(q)
+
+    def mode(self) -> float:
+        if self.positive:
+            return self.grid.mode()
+        return super().mode()
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        return rv.sample_both(operator.mul, self.left, self.right, n, rng)
+
+
+@dataclass(eq=False)
+class Quotient(Node):
+    left: RandomVariable
+    right: RandomVariable
+
+    def __repr__(self) -> str:
+        return f"Quotient({self.left!r}, {self.right!r})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return self.left, self.right
+
+    def combine_pmf(self) -> dict[Any, float]:
+        from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+        return self._truncate_pmf(
+            DiscreteRV.combine_pmf(
+                self.left.pmf_table(),  # type: ignore[attr-defined]
+                self.right.pmf_table(),  # type: ignore[attr-defined]
+                operator.truediv,
+            )
+        )
+
+    @cached_property
+    def positive(self) -> bool:
+        """
+        Whether both operands are positive with a Mellin transform, in which case
+        the quotient is tabulated in log space (see `log_convolve`).
+        """
+        return not self.discrete and _positive(self.left) and _positive(self.right)
+
+    @cached_property
+    def grid(self) -> LogGridRV:
+        from probs.continuous.grid import log_convolve  # noqa: PLC0415
+
+        return log_convolve(self.left, self.right, divide=True)  # type: ignore[arg-type]
+
+    @cached_property
+    def _pdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.positive:
+            return self.grid.pdf
+        return super()._pdf
+
+    @cached_property
+    def _cdf(self) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+        if self.positive:
+            return self.grid.cdf
+        return super()._cdf
+
+    def support(self) -> tuple[float, float]:
+        return _multiply(_support(self.left), _reciprocal(_support(self.right)))
+
+    def moment(self, s: float) -> float:
+        return _moment(self.left, s) * _moment(self.right, -s)
+
+    def density(self, z: float) -> float:
+        # Integrated over the denominator y, for which the numerator is z * y, so y
+        # must be in the support of the right operand and in (left support) / z.
+        within = _support(self.right)
+        if z != 0:
+            within = _intersect(within, _scale(_support(self.left), 1 / z))
+        return _integrate(
+            lambda y: self.left.pdf(z * y) * self.right.pdf(y) * abs(y), within
+        )
+
+    def expectation(self) -> float:
+        # E[X / Y] = E[X] E[1 / Y] for independent X and Y, which needs the Mellin
+        # transform of Y.
+        try:
+            return self.moment(1)
+        except NotImplementedError:
+            raise NotImplementedError(
+                "Expectation cannot be implemented for division."
+            ) from None
+
+    def variance(self) -> float:
+        try:
+            second = self.moment(2)
+        except NotImplementedError:
+            raise NotImplementedError(
+                "Variance cannot be implemented for division."
+            ) from None
+        if math.isinf(second):
+            return math.inf
+        return second - self.moment(1) ** 2
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        if self.positive:
+            return self.grid.ppf(q)
+        return super().ppf(q)
+
+    def mode(self) -> float:
+        if self.positive:
+            return self.grid.mode()
+        return super().mode()
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        return rv.sample_both(operator.truediv, self.left, self.right, n, rng)
+
+
+@dataclass(eq=False)
+class Power(Node):
+    base: RandomVariable
+    exponent: float
+
+    def __repr__(self) -> str:
+        return f"Power({self.base!r}, {self.exponent})"
+
+    @property
+    def operands(self) -> tuple[RandomVariable, ...]:
+        return (self.base,)
+
+    def combine_pmf(self) -> dict[Any, float]:
+        pmf: dict[Any, float] = {}
+        base: dict[Any, float] = self.base.pmf_table()  # type: ignore[attr-defined]
+        for k, p in base.items():
+            pmf[k**self.exponent] = pmf.get(k**self.exponent, 0) + p
+        return pmf
+
+    def density(self, z: float) -> float:
+        raise NotImplementedError("The pdf of a power can only be sampled.")
+
+    def expectation(self) -> float:
+        # exp(log(self) * other).expectation()
+        raise NotImplementedError("Expectation cannot be implemented for powers.")
+
+    def variance(self) -> float:
+        raise NotImplementedError("Variance cannot be implemented for powers.")
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        return np.asarray(self.base.sample(n, rng) ** self.exponent)
+
+
+def node(var: RandomVariable) -> Node | None:
+    """The expression node behind a derived random variable, or None for a leaf."""
+    return var._node  # noqa: SLF001
+
+
+def add(left: RandomVariable, right: RandomVariable | float) -> RandomVariable:
+    exact = algebra.closed_form(left, operator.add, right)
+    if exact is not None:
+        return exact
+    if isinstance(right, int | float):
+        return _affine(left, 1, right)
+
+    left_base, left_shift = _split_shift(left)
+    right_base, right_shift = _split_shift(right)
+    terms = list(_terms(left_base))
+    for term in _terms(right_base):
+        _merge_term(terms, term)
+    shift = left_shift + right_shift
+    result = terms[0] if len(terms) == 1 else _derive(left, Sum, tuple(terms))
+    return _affine(result, 1, shift)
+
+
+def subtract(left: RandomVariable, right: RandomVariable | float) -> RandomVariable:
+    exact = algebra.closed_form(left, operator.sub, right)
+    if exact is not None:
+        return exact
+    if isinstance(right, int | float):
+        return add(left, -right)
+    return add(left, multiply(right, -1))
+
+
+def multiply(left: RandomVariable, right: RandomVariable | float) -> RandomVariable:
+    exact = algebra.closed_form(left, operator.mul, right)
+    if exact is not None:
+        return exact
+    if isinstance(right, int | float):
+        return _affine(left, right, 0)
+    return _derive(left, Product, left, right)
+
+
+def divide(left: RandomVariable, right: RandomVariable | float) -> RandomVariable:
+    exact = algebra.closed_form(left, operator.truediv, right)
+    if exact is not None:
+        return exact
+    if isinstance(right, int | float):
+        return multiply(left, 1 / right)
+    return _derive(left, Quotient, left, right)
+
+
+def sum_iid(var: RandomVariable, n: int) -> RandomVariable:
+    """
+    The sum of n independent copies of a discrete `var`. Where a closed-form rule
+    adds two copies, sums of powers of two are built through the rules; otherwise
+    the pmf is computed by repeated squaring. Either way only O(log n) additions
+    are needed.
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1.")
+    if n == 1:
+        return var
+    if algebra.closed_form(var, operator.add, var) is None:
+        return _derive(var, IIDSum, var, n)
+    return _repeated_sum(var, n, add)
+
+
+def _repeated_sum(x: T, n: int, add: Callable[[T, T], T]) -> T:  # noqa: UP047
+    """Adds n copies of x by repeated squaring, in O(log n) additions."""
+    result: T | None = None
+    while True:
+        if n & 1:
+            result = x if result is None else add(result, x)
+        n >>= 1
+        if not n:
+            return cast("T", result)
+        x = add(x, x)
+
+
+def power(base: RandomVariable, exponent: float) -> RandomVariable:
+    if exponent == 1:
+        return base
+    return _derive(base, Power, base, exponent)
+
+
+def _affine(var: RandomVariable, scale: float, shift: float) -> RandomVariable:
+    """Merges `scale * var + shift` into any affine node `var` already is."""
+    inner = node(var)
+    if isinstance(inner, Affine):
+        var, scale, shift = inner.base, scale * inner.scale, scale * inner.shift + shift
+    if scale == 1 and shift == 0:
+        return var
+    if scale == 0:
+        raise ValueError("Cannot scale a random variable by 0.")
+    for op, constant in ((operator.mul, scale), (operator.add, shift)):
+        exact = algebra.closed_form(var, op, constant)
+        if exact is None:
+            return _derive(var, Affine, var, scale, shift)
+        var, scale = exact, 1
+    return var
+
+
+def _split_shift(var: RandomVariable) -> tuple[RandomVariable, float]:
+    inner = node(var)
+    if isinstance(inner, Affine) and inner.scale == 1:
+        return inner.base, inner.shift
+    return var, 0
+
+
+def _terms(var: RandomVariable) -> tuple[RandomVariable, ...]:
+    inner = node(var)
+    return inner.terms if isinstance(inner, Sum) else (var,)
+
+
+def _merge_term(terms: list[RandomVariable], term: RandomVariable) -> None:
+    """Appends `term` to a sum, first trying to combine it with an existing term."""
+    for i, existing in enumerate(terms):
+        exact = algebra.closed_form(existing, operator.add, term)
+        if exact is not None:
+            terms[i] = exact
+            return
+    terms.append(term)
+
+
+def _identity(arg: Any) -> Any:
+    if isinstance(arg, rv.RandomVariable):
+        return id(arg)
+    if isinstance(arg, tuple):
+        return tuple(map(_identity, arg))
+    return arg
+
+
+def integrate_cdf(
+    pdf: Callable[[float], float], support: tuple[float, float], x: float
+) -> float:
+    """The integral of pdf up to x, over the part of the support below x."""
+    lower, upper = support
+    return _integrate(pdf, (lower, min(upper, x)))
+
+
+def _integrate(func: Callable[[float], float], interval: tuple[float, float]) -> float:
+    lower, upper = interval
+    if not lower < upper:
+        return 0.0
+    return float(instrument.quad(func, lower, upper, full_output=True)[0])
+
+
+def _support(var: RandomVariable) -> tuple[float, float]:
+    from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+    try:
+        return var.support()
+    except NotImplementedError:
+        pass
+    # Discrete random variables given by their pmf, e.g. a die, have no `support`.
+    pmf = var.pmf_table() if isinstance(var, DiscreteRV) else None
+    if pmf:
+        return min(pmf), max(pmf)
+    return -math.inf, math.inf
+
+
+def _moment(var: RandomVariable, s: float) -> float:
+    from probs.continuous.rv import ContinuousRV  # noqa: PLC0415
+
+    if not isinstance(var, ContinuousRV):
+        raise NotImplementedError
+    return var.moment(s)
+
+
+def _has_cf(var: RandomVariable) -> bool:
+    try:
+        var.cf(0.0)
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _positive(var: RandomVariable) -> bool:
+    """Whether var is never negative and has a Mellin transform."""
+    if _support(var)[0] < 0:
+        return False
+    try:
+        _moment(var, 0)
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _intersect(
+    first: tuple[float, float], second: tuple[float, float]
+) -> tuple[float, float]:
+    return max(first[0], second[0]), min(first[1], second[1])
+
+
+def _scale(interval: tuple[float, float], factor: float) -> tuple[float, float]:
+    lower, upper = _times(interval[0], factor), _times(interval[1], factor)
+    return (lower, upper) if factor >= 0 else (upper, lower)
+
+
+def _times(x: float, y: float) -> float:
+    """x * y, taking 0 * inf to be 0 as it is for the ends of intervals."""
+    return 0.0 if x == 0 or y == 0 else x * y
+
+
+def _multiply(
+    first: tuple[float, float], second: tuple[float, float]
+) -> tuple[float, float]:
+    products = [_times(x, y) for x in first for y in second]
+    return min(products), max(products)
+
+
+def _reciprocal(interval: tuple[float, float]) -> tuple[float, float]:
+    """The interval holding 1 / y for every nonzero y in interval."""
+    lower, upper = interval
+    if lower > 0 or upper < 0:
+        return 1 / upper, 1 / lower
+    if lower == 0 < upper:
+        return 1 / upper, math.inf
+    if lower < 0 == upper:
+        return -math.inf, 1 / lower
+    return -math.inf, math.inf
+
+
+def _derive(template: RandomVariable, kind: type[Node], *args: Any) -> RandomVariable:
+    """
+    Creates a carrier of `template`'s class bound to the (shared) node for
+    `kind(*args)`. The carrier keeps the class so that e.g. `repr` and `isinstance`
+    still work, but its parameters do not describe it.
+    """
+    from probs.discrete.rv import DiscreteRV  # noqa: PLC0415
+
+    discrete = isinstance(template, DiscreteRV)
+    settings = truncation.current() if discrete else None
+    key = (kind, discrete, settings, *map(_identity, args))
+    shared = _nodes.get(key)
+    if shared is None:
+        shared = kind(discrete, *args)
+        shared.truncation = settings
+        _nodes[key] = shared
+
+    result = type(template)()
+    result._node = shared  # noqa: SLF001
+    result.pdf = instrument.timed(shared, "pdf", shared.pdf)  # type: ignore[method-assign, assignment]
+    result.cdf = instrument.timed(shared, "cdf", shared.cdf)  # type: ignore[method-assign, assignment]
+    result.expectation = shared.expectation  # type: ignore[method-assign]
+    result.variance = shared.variance  # type: ignore[method-assign]
+    result.median = shared.median  # type: ignore[method-assign]
+    result.mode = shared.mode  # type: ignore[method-assign]
+    result.sample = shared.sample  # type: ignore[method-assign]
+    result.ppf = shared.ppf  # type: ignore[method-assign]
+    result.support = shared.support  # type: ignore[method-assign]
+    if not discrete:
+        result.moment = shared.moment  # type: ignore[attr-defined]
+    result.isf = shared.isf  # type: ignore[method-assign]
+    result.cf = shared.cf  # type: ignore[method-assign]
+    result.cgf = shared.cgf  # type: ignore[method-assign]
+    result.cgf_derivatives = shared.cgf_derivatives  # type: ignore[method-assign]
+    # The log functions of the template's class may use its parameters, so the
+    # general ones (computed from the bound pdf and cdf) are used instead.
+    for name in ("logpdf", "logcdf", "logsf"):
+        setattr(result, name, getattr(rv.RandomVariable, name).__get__(result))
+    if discrete:
+        # Computed from the node on first access, see DiscreteRV.__getattr__.
+        delattr(result, "pmf")
+    return result
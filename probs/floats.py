@@ -1,16 +1,65 @@
 from __future__ import annotations
 
 import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def _bits(rtol: float) -> int:
+    """The mantissa bits kept in buckets for a relative tolerance."""
+    return max(int(math.log2(1 / (2 * rtol))), 0)
+
+
+# The relative tolerance of math.isclose, which ApproxFloat compares with.
+_DEFAULT_RTOL = 1e-9
+_DEFAULT_BITS = _bits(_DEFAULT_RTOL)
+
+
+def bucket(x: float, rtol: float = _DEFAULT_RTOL) -> tuple[int, int]:
+    """
+    Quantizes x into buckets at least 2 * rtol wide relative to x, so that
+    values within rtol of each other are in the same or adjacent buckets. The
+    bucket is the exponent of x and its mantissa rounded to that precision.
+    """
+    if x == 0 or not math.isfinite(x):
+        return 0, hash(float(x))
+    bits = _DEFAULT_BITS if rtol == _DEFAULT_RTOL else _bits(rtol)
+    mantissa, exponent = math.frexp(x)
+    quantized = round(mantissa * 2**bits)
+    if abs(quantized) == 2**bits:
+        # Rounded up to the next power of two.
+        return exponent + 1, quantized // 2
+    return exponent, quantized
+
+
+def neighbour_buckets(x: float, rtol: float = _DEFAULT_RTOL) -> set[tuple[int, int]]:
+    """
+    Every bucket that may hold a value within rtol of x. Since buckets are at
+    least twice that wide, these are the buckets of x and of either end of the
+    range of values close to it.
+    """
+    slack = 2 * rtol * abs(x)
+    return {bucket(x - slack, rtol), bucket(x, rtol), bucket(x + slack, rtol)}
 
 
 class ApproxFloat(float):
+    """
+    A float that compares equal to any number within a relative tolerance of
+    1e-9. Hashes are taken from the bucket of the value (see `bucket`), so dicts
+    and sets of ApproxFloats stay fast, but two values that are equal can still
+    fall either side of a bucket edge; use `approx_get` to also search the
+    neighbouring buckets.
+    """
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, int | float):
             return math.isclose(self, other)
         return super().__eq__(other)
 
     def __hash__(self) -> int:
-        return 0
+        return hash(bucket(self))
 
     def __repr__(self) -> str:
         """Removes trailing zeroes from float representation."""
@@ -18,6 +67,8 @@ class ApproxFloat(float):
 
 
 class ApproxFloatRtol(float):
+    """Like `ApproxFloat`, with a relative tolerance of rtol."""
+
     def __new__(cls, value: float, rtol: float = 1e-9) -> ApproxFloatRtol:  # noqa: PYI034
         del rtol
         return float.__new__(cls, value)
@@ -33,8 +84,41 @@ class ApproxFloatRtol(float):
         return super().__eq__(other)
 
     def __hash__(self) -> int:
-        return 0
+        return hash(bucket(self, self.rtol))
 
     def __repr__(self) -> str:
         """Removes trailing zeroes from float representation."""
         return str(float(f"{self:.8f}"))
+
+
+class _Probe(float):
+    """A key for looking up ApproxFloats close to a value in one given bucket."""
+
+    def __new__(cls, value: float, key_hash: int) -> _Probe:  # noqa: PYI034
+        del key_hash
+        return float.__new__(cls, value)
+
+    def __init__(self, value: float, key_hash: int) -> None:
+        del value
+        self.key_hash = key_hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, int | float):
+            return math.isclose(self, other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.key_hash
+
+
+def approx_get(mapping: Mapping[Any, Any], key: float, default: Any = None) -> Any:
+    """
+    Looks up `key` in a dict keyed by ApproxFloats, or by ApproxFloatRtols with the
+    default tolerance, including keys that are close to it but fall in a
+    neighbouring bucket.
+    """
+    for neighbour in neighbour_buckets(key):
+        probe = _Probe(key, hash(neighbour))
+        if probe in mapping:
+            return mapping[probe]
+    return default
@@ -0,0 +1,136 @@
+"""
+Opt-in counters for the numerical work behind evaluating random variables, to
+find out why a call such as `P(X < Y)` is slow:
+
+    with instrument() as stats:
+        P(X < Y)
+    print(stats)
+
+While a block is instrumented, every quad integral records its integrand
+evaluations and error estimate, every pairwise combination of pmfs or
+convolution of lattices records its number of products, and every pdf/cdf call
+of an operator node records its wall time. Outside of a block, each hook costs
+one check of a module-level variable.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from probs.cache import PointFunction
+    from probs.expression import Node
+    from probs.rv import ArrayOrFloat
+
+
+@dataclass
+class Stats:
+    """
+    Totals collected while instrumented. Times are inclusive: a node's time
+    includes the time of the nodes it evaluates.
+
+    :param quad_calls: Numerical integrals computed by scipy.integrate.quad.
+    :param integrand_evaluations: Evaluations of their integrands.
+    :param integration_errors: The absolute error estimated for each integral.
+    :param integration_warnings: Integrals that quad reported as inaccurate.
+    :param quad_seconds: Wall time spent in quad.
+    :param pmf_pairs: Pairs of values combined by `DiscreteRV.combine_pmf`.
+    :param convolution_products: Products of probabilities in lattice convolutions.
+    :param node_calls: pdf/cdf calls of each operator node, by method.
+    :param node_seconds: Wall time of those calls.
+    """
+
+    quad_calls: int = 0
+    integrand_evaluations: int = 0
+    integration_errors: list[float] = field(default_factory=list)
+    integration_warnings: int = 0
+    quad_seconds: float = 0.0
+    pmf_pairs: int = 0
+    convolution_products: int = 0
+    node_calls: Counter[tuple[Node, str]] = field(default_factory=Counter)
+    node_seconds: defaultdict[tuple[Node, str], float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    def __str__(self) -> str:
+        max_error = max(self.integration_errors, default=0.0)
+        quad = (
+            f"quad: {self.quad_calls} calls, {self.integrand_evaluations} "
+            f"integrand evaluations, {self.quad_seconds:.3f} s, max error "
+            f"{max_error:.2e}, {self.integration_warnings} warnings"
+        )
+        lines = [
+            quad,
+            f"pmf pairs: {self.pmf_pairs}",
+            f"convolution products: {self.convolution_products}",
+        ]
+        slowest = sorted(self.node_seconds.items(), key=lambda item: -item[1])
+        for (node, method), seconds in slowest:
+            calls = self.node_calls[node, method]
+            lines.append(f"{seconds:10.3f} s {calls:8} x {node!r}.{method}")
+        return "\n".join(lines)
+
+
+_stats: Stats | None = None
+
+
+def current() -> Stats | None:
+    """The statistics being collected, or None when not instrumented."""
+    return _stats
+
+
+@contextmanager
+def instrument() -> Iterator[Stats]:
+    """Collects `Stats` for the duration of a block, restoring the prior state."""
+    global _stats  # noqa: PLW0603
+    previous = _stats
+    _stats = Stats()
+    try:
+        yield _stats
+    finally:
+        _stats = previous
+
+
+def quad(func: Callable[[float], float], a: float, b: float, **kwargs: Any) -> Any:
+    """
+    scipy.integrate.quad, recording its work when instrumented. scipy.integrate is
+    slow to import, so it is only loaded once an integral is needed.
+    """
+    from scipy.integrate import quad as scipy_quad  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    stats = _stats
+    if stats is None:
+        return scipy_quad(func, a, b, **kwargs)
+    start = time.perf_counter()
+    result = scipy_quad(func, a, b, **{**kwargs, "full_output": True})
+    stats.quad_seconds += time.perf_counter() - start
+    stats.quad_calls += 1
+    stats.integrand_evaluations += result[2]["neval"]
+    stats.integration_errors.append(result[1])
+    # A message is only returned when the integral may be inaccurate.
+    if len(result) > 3:
+        stats.integration_warnings += 1
+    return result if kwargs.get("full_output") else result[:2]
+
+
+def timed(node: Node, method: str, func: PointFunction) -> PointFunction:
+    """Wraps one pdf/cdf of an operator node to record its calls and wall time."""
+
+    def wrapper(x: ArrayOrFloat) -> ArrayOrFloat:
+        stats = _stats
+        if stats is None:
+            return func(x)
+        start = time.perf_counter()
+        try:
+            return func(x)
+        finally:
+            stats.node_seconds[node, method] += time.perf_counter() - start
+            stats.node_calls[node, method] += 1
+
+    return wrapper
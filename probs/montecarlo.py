@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import math
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import numpy.typing as npt
+
+    from probs.rv import RandomVariable, Seed
+
+# The standard error is taken from the spread of independent batch estimates,
+# so a few batches are needed before it can be trusted.
+_MIN_BATCHES = 4
+
+
+class Estimate(float):
+    """
+    A Monte Carlo estimate, which behaves as its float value but also reports the
+    standard error achieved and the number of samples drawn.
+
+    Adding or subtracting constants shifts the estimate without changing its error;
+    combining two estimates treats them as independent.
+    """
+
+    def __new__(cls, value: float, stderr: float, n: int) -> Estimate:  # noqa: PYI034
+        del stderr, n
+        return float.__new__(cls, value)
+
+    def __init__(self, value: float, stderr: float, n: int) -> None:
+        del value
+        self.stderr = stderr
+        self.n = n
+
+    def __repr__(self) -> str:
+        return f"{float(self):.8g} ± {self.stderr:.2g}"
+
+    def __add__(self, other: object) -> Estimate:
+        if isinstance(other, Estimate):
+            return Estimate(
+                float(self) + float(other),
+                math.hypot(self.stderr, other.stderr),
+                min(self.n, other.n),
+            )
+        if isinstance(other, int | float):
+            return Estimate(float(self) + other, self.stderr, self.n)
+        return NotImplemented
+
+    def __radd__(self, other: object) -> Estimate:
+        return self + other
+
+    def __neg__(self) -> Estimate:
+        return Estimate(-float(self), self.stderr, self.n)
+
+    def __sub__(self, other: object) -> Estimate:
+        if isinstance(other, int | float):
+            return self + -other
+        return NotImplemented
+
+    def __rsub__(self, other: object) -> Estimate:
+        return -self + other
+
+
+@dataclass(frozen=True)
+class MonteCarloSettings:
+    """
+    :param stderr: Target standard error; sampling stops once it is reached.
+    :param qmc: Use scrambled Sobol points pushed through each `ppf` instead of
+        pseudo-random samples. Each batch is an independent scramble.
+    :param batch_size: Samples drawn per batch. Sobol batches are rounded up to a
+        power of two.
+    :param max_samples: Stop anyway after this many samples, reporting whatever
+        standard error was achieved.
+    :param rng: A numpy Generator or a seed; fresh entropy is used if None.
+    """
+
+    stderr: float = 1e-3
+    qmc: bool = False
+    batch_size: int = 2**14
+    max_samples: int = 2**24
+    rng: Seed = None
+
+    def __post_init__(self) -> None:
+        if self.stderr <= 0:
+            raise ValueError("stderr must be greater than 0.")
+        if self.batch_size <= 1:
+            raise ValueError("batch_size must be greater than 1.")
+
+
+_settings: MonteCarloSettings | None = None
+
+
+def enable_monte_carlo(
+    stderr: float = 1e-3,
+    *,
+    qmc: bool = False,
+    batch_size: int = 2**14,
+    max_samples: int = 2**24,
+    rng: Seed = None,
+) -> None:
+    """
+    Estimates event probabilities (e.g. `P(X < Y)`), `E` and `Var` by sampling
+    rather than by integration. Results are `Estimate`s carrying their standard
+    error. See `MonteCarloSettings` for the parameters.
+
+    Comparing two continuous random variables otherwise integrates the pdf of
+    their difference, which is itself an integral, and can be slow and inaccurate.
+    """
+    global _settings  # noqa: PLW0603
+    _settings = MonteCarloSettings(stderr, qmc, batch_size, max_samples, rng)
+
+
+def disable_monte_carlo() -> None:
+    """Returns to exact computation."""
+    global _settings  # noqa: PLW0603
+    _settings = None
+
+
+def is_enabled() -> bool:
+    return _settings is not None
+
+
+@contextmanager
+def monte_carlo(
+    stderr: float = 1e-3,
+    *,
+    qmc: bool = False,
+    batch_size: int = 2**14,
+    max_samples: int = 2**24,
+    rng: Seed = None,
+) -> Iterator[None]:
+    """Enables Monte Carlo estimation for the duration of a block."""
+    global _settings  # noqa: PLW0603
+    previous = _settings
+    _settings = MonteCarloSettings(stderr, qmc, batch_size, max_samples, rng)
+    try:
+        yield
+    finally:
+        _settings = previous
+
+
+def _draw(
+    settings: MonteCarloSettings,
+    variables: tuple[RandomVariable, ...],
+    generator: np.random.Generator,
+) -> list[npt.NDArray[Any]]:
+    if settings.qmc:
+        from scipy.stats import qmc  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        sobol = qmc.Sobol(len(variables), seed=generator)
+        points = sobol.random_base2(math.ceil(math.log2(settings.batch_size)))
+        return [rv.ppf(points[:, i]) for i, rv in enumerate(variables)]
+    return [rv.sample(settings.batch_size, generator) for rv in variables]
+
+
+def estimate(statistic: Callable[..., Any], *variables: RandomVariable) -> Estimate:
+    """
+    Evaluates `statistic` on independent batches of samples of `variables` until
+    the mean of the batch values reaches the target standard error.
+
+    :param statistic: Maps one array of samples per variable to a batch estimate.
+    """
+    if _settings is None:
+        raise RuntimeError("Monte Carlo estimation is not enabled.")
+    settings = _settings
+    generator = np.random.default_rng(settings.rng)
+    values: list[float] = []
+    n = 0
+    while True:
+        samples = _draw(settings, variables, generator)
+        values.append(float(statistic(*samples)))
+        n += len(samples[0])
+        if len(values) >= _MIN_BATCHES:
+            stderr = float(np.std(values, ddof=1)) / math.sqrt(len(values))
+            if stderr <= settings.stderr or n >= settings.max_samples:
+                return Estimate(float(np.mean(values)), stderr, n)
+
+
+def probability(
+    op: Callable[[Any, Any], Any], rv: RandomVariable, other: RandomVariable | float
+) -> Estimate:
+    """Estimates P(op(rv, other)), where other is a random variable or a constant."""
+    if isinstance(other, int | float):
+        return estimate(lambda x: np.mean(op(x, other)), rv)
+    return estimate(lambda x, y: np.mean(op(x, y)), rv, other)
+
+
+def expectation(rv: RandomVariable) -> Estimate:
+    return estimate(np.mean, rv)
+
+
+def variance(rv: RandomVariable) -> Estimate:
+    return estimate(lambda x: np.var(x, ddof=1), rv)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from probs import montecarlo
+
 if TYPE_CHECKING:
     from probs.rv import Event, RandomVariable
 
@@ -24,6 +26,8 @@ class Probability:
 class Expectation:
     @staticmethod
     def __call__(var: RandomVariable) -> float:
+        if montecarlo.is_enabled():
+            return montecarlo.expectation(var)
         return var.expectation()
 
     @staticmethod
@@ -34,6 +38,8 @@ class Expectation:
 class Variance:
     @staticmethod
     def __call__(var: RandomVariable) -> float:
+        if montecarlo.is_enabled():
+            return montecarlo.variance(var)
         return var.variance()
 
     @staticmethod
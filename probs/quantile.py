@@ -0,0 +1,180 @@
+"""
+Quantiles of random variables without a closed form ppf, found by solving
+cdf(x) = q numerically.
+
+Each quantile is first bracketed by points a < b with cdf(a) < q <= cdf(b),
+then narrowed with Newton steps on the pdf, falling back to bisection whenever a
+step would leave the bracket (or there is no pdf). All quantiles of an array are
+solved together, so each step is one vectorized cdf call.
+
+The points at which the cdf has been evaluated are kept, so later quantiles of
+the same random variable start from the tightest bracket already known instead
+of searching outward again.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from probs.rv import ArrayOrFloat, FloatArray, RandomVariable
+
+# The bracket is widened by doubling at most this many times on either side.
+_MAX_DOUBLINGS = 128
+_MAX_ITERATIONS = 100
+# Quantiles are solved to this relative tolerance in x.
+_XTOL = 1e-12
+# At most this many points are kept to bracket later quantiles.
+_MAX_POINTS = 4096
+
+
+class QuantileSolver:
+    """
+    Inverts the cdf of a random variable (see module docstring).
+
+    :param cdf: Accepts and returns arrays.
+    :param pdf: The derivative of cdf used for Newton steps, or None to bisect.
+    :param center: Where to start bracketing, usually the mean.
+    :param scale: The first width of the bracket, usually the standard deviation.
+    """
+
+    def __init__(
+        self,
+        cdf: Callable[[FloatArray], FloatArray],
+        pdf: Callable[[FloatArray], FloatArray] | None = None,
+        center: float = 0,
+        scale: float = 1,
+    ) -> None:
+        self.cdf = cdf
+        self.pdf = pdf
+        self.center = center
+        self.scale = scale
+        self.points = np.array([center])
+        self.values = np.asarray(cdf(self.points), dtype=float)
+
+    @classmethod
+    def of(cls, rv: RandomVariable) -> QuantileSolver:
+        """A solver for rv, centered on its mean and scaled by its deviation."""
+        try:
+            center, scale = rv.expectation(), math.sqrt(rv.variance())
+        except (ArithmeticError, NotImplementedError, RuntimeError, ValueError):
+            center, scale = 0, 1
+        if not math.isfinite(center):
+            center = 0
+        if not (math.isfinite(scale) and scale > 0):
+            scale = max(abs(center), 1)
+        return cls(rv.cdf, rv.pdf, center, scale)
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The smallest x with cdf(x) >= q: -inf for q = 0, inf for q = 1 and nan
+        outside [0, 1], as for the discrete quantile function.
+        """
+        qs = np.asarray(q, dtype=float).ravel()
+        result = np.full(qs.shape, np.nan)
+        result[qs == 0] = -np.inf
+        result[qs == 1] = np.inf
+        inner = (qs > 0) & (qs < 1)
+        if np.any(inner):
+            result[inner] = self._solve(qs[inner])
+        if isinstance(q, np.ndarray):
+            return result.reshape(q.shape)
+        return float(result[0])
+
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        return self.ppf(1 - q)
+
+    def _solve(self, qs: FloatArray) -> FloatArray:
+        lower, upper, f_lower, f_upper = self._bracket(qs)
+        bracketed = np.isfinite(lower) & np.isfinite(upper)
+        # Linear interpolation between the ends of the bracket to start with.
+        weight = np.divide(
+            qs - f_lower,
+            f_upper - f_lower,
+            out=np.full(qs.shape, 0.5),
+            where=f_upper > f_lower,
+        )
+        x = np.where(bracketed, lower + weight * (upper - lower), np.nan)
+        # The last point at which the cdf was evaluated for each q, and its value.
+        seen, seen_values = x.copy(), np.full(qs.shape, np.nan)
+        active = bracketed.copy()
+        pdf = self.pdf
+        for _ in range(_MAX_ITERATIONS):
+            if not np.any(active):
+                break
+            (i,) = np.nonzero(active)
+            fx = np.asarray(self.cdf(x[i]), dtype=float)
+            seen[i], seen_values[i] = x[i], fx
+            below = fx < qs[i]
+            lower[i] = np.where(below, x[i], lower[i])
+            upper[i] = np.where(below, upper[i], x[i])
+            midpoint = (lower[i] + upper[i]) / 2
+            step = np.zeros(len(i))
+            if pdf is not None:
+                try:
+                    slope = np.asarray(pdf(x[i]), dtype=float)
+                except NotImplementedError:
+                    pdf = self.pdf = None
+                else:
+                    np.divide(fx - qs[i], slope, out=step, where=slope > 0)
+            newton = x[i] - step
+            inside = (step != 0) & (newton > lower[i]) & (newton < upper[i])
+            exact = fx == qs[i]
+            x[i] = np.where(exact, x[i], np.where(inside, newton, midpoint))
+            tolerance = _XTOL * np.maximum(np.abs(x[i]), self.scale)
+            done = exact | (upper[i] - lower[i] <= tolerance)
+            done |= inside & (np.abs(step) <= tolerance)
+            active[i[done]] = False
+        evaluated = np.isfinite(seen_values)
+        self._remember(seen[evaluated], seen_values[evaluated])
+        return x
+
+    def _bracket(
+        self, qs: FloatArray
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """
+        The tightest known points a < b with cdf(a) < q <= cdf(b) for each q,
+        doubling the range of known points outward until it covers every q.
+        """
+        low, high = float(np.min(qs)), float(np.max(qs))
+        width = self.scale
+        for _ in range(_MAX_DOUBLINGS):
+            if self.values[0] < low:
+                break
+            self._add(np.array([self.points[0] - width]))
+            width *= 2
+        width = self.scale
+        for _ in range(_MAX_DOUBLINGS):
+            if self.values[-1] >= high:
+                break
+            self._add(np.array([self.points[-1] + width]))
+            width *= 2
+        # Rounding in numerical cdfs can make them slightly non-monotone.
+        values = np.maximum.accumulate(self.values)
+        i = np.searchsorted(values, qs, side="left")
+        found = (i > 0) & (i < len(values))
+        i = np.clip(i, 1, len(values) - 1)
+        return (
+            np.where(found, self.points[i - 1], np.nan),
+            np.where(found, self.points[i], np.nan),
+            np.where(found, values[i - 1], np.nan),
+            np.where(found, values[i], np.nan),
+        )
+
+    def _remember(self, points: FloatArray, values: FloatArray) -> None:
+        """Keeps solved quantiles as brackets for later ones, up to a limit."""
+        room = max(_MAX_POINTS - len(self.points), 0)
+        self._add(points[:room], values[:room])
+
+    def _add(self, points: FloatArray, values: FloatArray | None = None) -> None:
+        if values is None:
+            values = np.asarray(self.cdf(points), dtype=float)
+        all_points = np.concatenate((self.points, points))
+        all_values = np.concatenate((self.values, values))
+        order = np.argsort(all_points, kind="stable")
+        self.points, self.values = all_points[order], all_values[order]
@@ -1,9 +1,77 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+import numpy as np
+import numpy.typing as npt
+
+from probs import expression, montecarlo
 from probs.floats import ApproxFloat
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from probs.expression import Node
+
+FloatArray = npt.NDArray[np.float64]
+ComplexArray = npt.NDArray[np.complex128]
+# pdf/cdf accept either a single point or an array of points, and return the same.
+ArrayOrFloat = TypeVar("ArrayOrFloat", float, FloatArray)
+# Anything np.random.default_rng accepts: a Generator, a seed or None (fresh entropy).
+Seed = np.random.Generator | int | None
+
+
+def match_input(x: ArrayOrFloat, result: Any) -> ArrayOrFloat:  # noqa: UP047
+    """
+    Returns a result computed with numpy as an array if x is one, or as a float
+    if x is a single point, for methods that share one path for both.
+    """
+    if isinstance(x, np.ndarray):
+        return cast("FloatArray", np.asarray(result, dtype=float))
+    return float(result)
+
+
+def match_complex(t: ArrayOrFloat, result: Any) -> complex | ComplexArray:  # noqa: UP047
+    """Like `match_input`, for complex results such as characteristic functions."""
+    if isinstance(t, np.ndarray):
+        return cast("ComplexArray", np.asarray(result, dtype=complex))
+    return complex(result)
+
+
+def vectorize(
+    func: Callable[[float], float],
+) -> Callable[[ArrayOrFloat], ArrayOrFloat]:
+    """
+    Lifts a scalar-only function to also accept arrays by evaluating pointwise.
+    Scalars are passed straight through, so the scalar path stays as fast as before.
+    """
+
+    def wrapper(x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.fromiter(
+                (func(v) for v in x.ravel().tolist()), dtype=float, count=x.size
+            ).reshape(x.shape)
+        return func(x)
+
+    return wrapper
+
+
+def sample_both(
+    op: Callable[[Any, Any], Any],
+    first: RandomVariable,
+    second: RandomVariable,
+    n: int,
+    rng: Seed = None,
+) -> npt.NDArray[Any]:
+    """
+    Samples a derived random variable by combining independent samples of its
+    operands, drawn from one shared generator so that seeding stays reproducible.
+    """
+    generator = np.random.default_rng(rng)
+    return np.asarray(op(first.sample(n, generator), second.sample(n, generator)))
+
 
 @dataclass
 class Event:
@@ -13,12 +81,15 @@ class Event:
 
     Using the `probability` field is more clear than using the `p` field.
     `p` is only used for the __repr__()
+
+    Monte Carlo estimates keep their standard error (see `probs.montecarlo`).
     """
 
     p: float
 
     def __post_init__(self) -> None:
-        self.p = ApproxFloat(self.p)
+        if not isinstance(self.p, montecarlo.Estimate):
+            self.p = ApproxFloat(self.p)
         self.probabilty = self.p
 
     # TODO: these are probably incorrect
@@ -52,49 +123,31 @@ class RandomVariable:
     https://en.wikipedia.org/wiki/Algebra_of_random_variables
     """
 
+    _node: Node | None = field(default=None, init=False, repr=False)
+
     def __add__(self, other: object) -> RandomVariable:
         if isinstance(other, int | float):
-            result = type(self)()
-            result.pdf = lambda z: self.pdf(z + other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.cdf = lambda z: self.cdf(z + other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.expectation = lambda: self.expectation() + other  # type: ignore[method-assign,operator,unused-ignore]
-            result.variance = self.variance  # type: ignore[method-assign]
-            return result
+            return expression.add(self, other)
         return NotImplemented
 
     def __sub__(self, other: object) -> RandomVariable:
         if isinstance(other, int | float):
-            return self + (-other)
+            return expression.subtract(self, other)
         return NotImplemented
 
     def __mul__(self, other: object) -> RandomVariable:
         if isinstance(other, int | float):
-            result = type(self)()
-            result.pdf = lambda z: self.pdf(z * other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.cdf = lambda z: self.cdf(z * other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.expectation = lambda: self.expectation() * other  # type: ignore[method-assign,operator,unused-ignore]
-            result.variance = lambda: self.variance() * other**2  # type: ignore[method-assign,operator,unused-ignore]
-            return result
+            return expression.multiply(self, other)
         return NotImplemented
 
     def __truediv__(self, other: object) -> RandomVariable:
         if isinstance(other, int | float):
-            return self * (1 / other)
+            return expression.divide(self, other)
         return NotImplemented
 
     def __pow__(self, other: object) -> RandomVariable:
         if isinstance(other, int | float):
-            result = type(self)()
-            result.pdf = lambda z: self.pdf(z**other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.cdf = lambda z: self.cdf(z**other)  # type: ignore[assignment,method-assign,operator,unused-ignore]
-            result.expectation = lambda: (_ for _ in ()).throw(  # type: ignore[method-assign]
-                # lambda: exp(log(self) * other).expectation()
-                NotImplementedError("Expectation cannot be implemented for division.")
-            )
-            result.variance = lambda: (_ for _ in ()).throw(  # type: ignore[method-assign]
-                # lambda: exp(log(self) * other).variance()
-                NotImplementedError("Variance cannot be implemented for division.")
-            )
+            return expression.power(self, other)
         return NotImplemented
 
     def __radd__(self, other: object) -> RandomVariable:
@@ -112,6 +165,9 @@ class RandomVariable:
     def __rpow__(self, other: object) -> RandomVariable:
         return self**other
 
+    def __neg__(self) -> RandomVariable:
+        return self * -1
+
     def __eq__(self, other: object) -> Event:  # type: ignore[override]
         """By default, the probabilty of equality is 0."""
         if isinstance(other, int | float | RandomVariable):
@@ -125,6 +181,8 @@ class RandomVariable:
         return Event(1 - (self == other).probabilty)
 
     def __lt__(self, other: object) -> Event:
+        if montecarlo.is_enabled() and isinstance(other, int | float | RandomVariable):
+            return Event(montecarlo.probability(operator.lt, self, other))
         if isinstance(other, RandomVariable):
             return Event((self - other).cdf(0))
         if isinstance(other, int | float):
@@ -135,6 +193,8 @@ class RandomVariable:
         return Event((self < other).probabilty + (self == other).probabilty)
 
     def __ge__(self, other: object) -> Event:
+        if montecarlo.is_enabled() and isinstance(other, int | float | RandomVariable):
+            return Event(montecarlo.probability(operator.ge, self, other))
         if isinstance(other, RandomVariable):
             return Event(1 - (self - other).cdf(0))
         if isinstance(other, int | float):
@@ -157,8 +217,90 @@ class RandomVariable:
     def variance(self) -> float:
         raise NotImplementedError
 
-    def pdf(self, x: float) -> float:
+    def support(self) -> tuple[float, float]:
+        """The smallest and largest values it can take, which may be infinite."""
+        raise NotImplementedError
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        raise NotImplementedError
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        raise NotImplementedError
+
+    def cf(self, t: ArrayOrFloat) -> complex | ComplexArray:
+        """
+        The characteristic function E[exp(itX)], at a frequency t or an array of
+        them. It exists for every distribution, and that of a sum of independent
+        random variables is the product of theirs.
+        """
+        raise NotImplementedError
+
+    def cgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The cumulant generating function log E[exp(tX)], which is infinite where
+        the moment generating function does not exist, e.g. for every t > 0 if the
+        right tail is heavier than exponential.
+        """
+        raise NotImplementedError
+
+    def mgf(self, t: ArrayOrFloat) -> ArrayOrFloat:
+        """The moment generating function E[exp(tX)], i.e. exp(cgf(t))."""
+        with np.errstate(over="ignore"):
+            return match_input(t, np.exp(self.cgf(t)))
+
+    def cgf_derivatives(self, t: ArrayOrFloat) -> tuple[ArrayOrFloat, ArrayOrFloat]:
+        """
+        The first two derivatives of the cgf, i.e. the mean and variance of the
+        distribution exponentially tilted by t, which are infinite where the cgf
+        is. Saddlepoint approximations (see `probs.saddlepoint`) need them.
+        """
+        raise NotImplementedError
+
+    def ppf(self, q: ArrayOrFloat) -> ArrayOrFloat:
         raise NotImplementedError
 
-    def cdf(self, x: float) -> float:
+    def isf(self, q: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The inverse survival function: the value exceeded with probability q.
+        Child classes override this where ppf(1 - q) would lose the precision of
+        small q.
+        """
+        return self.ppf(1 - q)
+
+    def logpdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The log of the pdf (or pmf for discrete random variables). Child classes
+        override this with a direct formula where the pdf would under- or overflow.
+        """
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log(self.pdf(x)))
+
+    def logcdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        """The log of the cdf."""
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log(self.cdf(x)))
+
+    def logsf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        """
+        The log of the survival function, 1 - cdf(x). This general version is
+        computed from the cdf, so it is -inf once the cdf rounds to 1; only the
+        families that override it (e.g. Normal, Binomial, Poisson) stay accurate
+        deep in the right tail.
+        """
+        with np.errstate(divide="ignore"):
+            return match_input(x, np.log1p(-np.asarray(self.cdf(x), dtype=float)))
+
+    def log_likelihood(self, data: npt.ArrayLike) -> float:
+        """
+        The log of the probability (density) of independent observations, summed
+        in log space so that it does not underflow for large datasets.
+        """
+        return float(np.sum(self.logpdf(np.asarray(data, dtype=float))))
+
+    def sample(self, n: int, rng: Seed = None) -> npt.NDArray[Any]:
+        """
+        Draws n independent samples.
+
+        :param rng: A numpy Generator or a seed; fresh entropy is used if None.
+        """
         raise NotImplementedError
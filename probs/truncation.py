@@ -0,0 +1,151 @@
+"""
+Results of discrete arithmetic can have far larger supports than their operands:
+additively under `+`, and multiplicatively under `*` and `/`. Most of those
+values are usually so unlikely that they do not affect any result, but they
+still cost memory and time in every later operation.
+
+While truncation is enabled, each new discrete sum, product or quotient drops
+its least likely values (or moves their mass onto the nearest value that is
+kept) within a budget. The settings are captured when the expression is built,
+and the mass discarded along the way is reported by `DiscreteRV.discarded_mass`.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from probs.discrete.lattice import Lattice
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass(frozen=True)
+class TruncationSettings:
+    """
+    :param epsilon: Probability that may be discarded by each operation, taken
+        from the least likely values (from both tails, for integer supports).
+    :param max_support: Keep at most this many values, discarding the least
+        likely (for integer supports, the most likely window of values).
+    :param aggregate: Move discarded mass onto the nearest value that is kept
+        rather than dropping it, so that pmfs still sum to 1.
+    """
+
+    epsilon: float = 1e-15
+    max_support: int | None = None
+    aggregate: bool = False
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.epsilon < 1:
+            raise ValueError("epsilon must be in [0, 1).")
+        if self.max_support is not None and self.max_support < 1:
+            raise ValueError("max_support must be at least 1.")
+
+
+_settings: TruncationSettings | None = None
+
+
+def enable_truncation(
+    epsilon: float = 1e-15, *, max_support: int | None = None, aggregate: bool = False
+) -> None:
+    """Truncates the pmfs of discrete expressions built from now on."""
+    global _settings  # noqa: PLW0603
+    _settings = TruncationSettings(epsilon, max_support, aggregate)
+
+
+def disable_truncation() -> None:
+    """Returns to exact pmfs for expressions built from now on."""
+    global _settings  # noqa: PLW0603
+    _settings = None
+
+
+def current() -> TruncationSettings | None:
+    return _settings
+
+
+@contextmanager
+def truncation(
+    epsilon: float = 1e-15, *, max_support: int | None = None, aggregate: bool = False
+) -> Iterator[None]:
+    """Truncates the pmfs of discrete expressions built inside a block."""
+    global _settings  # noqa: PLW0603
+    previous = _settings
+    _settings = TruncationSettings(epsilon, max_support, aggregate)
+    try:
+        yield
+    finally:
+        _settings = previous
+
+
+def truncate_pmf(
+    pmf: dict[Any, float], settings: TruncationSettings
+) -> tuple[dict[Any, float], float]:
+    """Returns the truncated pmf and the probability discarded."""
+    if not pmf:
+        return pmf, 0
+    keys = list(pmf)
+    probs = np.fromiter(pmf.values(), dtype=float, count=len(pmf))
+    order = np.argsort(probs, kind="stable")
+    # The least likely values whose total probability is within epsilon.
+    dropped = int(np.searchsorted(np.cumsum(probs[order]), settings.epsilon, "right"))
+    if settings.max_support is not None:
+        dropped = max(dropped, len(keys) - settings.max_support)
+    dropped = min(dropped, len(keys) - 1)
+    if dropped == 0:
+        return pmf, 0
+    discarded = float(np.sum(probs[order[:dropped]]))
+    kept = np.sort(order[dropped:])
+    result = {keys[i]: pmf[keys[i]] for i in kept.tolist()}
+    if settings.aggregate:
+        kept_keys = sorted(result)
+        for i in order[:dropped].tolist():
+            nearest = _nearest(kept_keys, keys[i])
+            result[nearest] += pmf[keys[i]]
+    return result, discarded
+
+
+def truncate_lattice(
+    lattice: Lattice, settings: TruncationSettings
+) -> tuple[Lattice, float]:
+    """
+    Returns the truncated lattice and the probability discarded. Only the tails
+    are cut, so that the values kept are still consecutive.
+    """
+    cumulative = np.cumsum(lattice.probs)
+    total = float(cumulative[-1])
+    # Cut at most epsilon / 2 from each tail.
+    start = int(np.searchsorted(cumulative, settings.epsilon / 2, "right"))
+    # Mass of the last 0, 1, 2, ... values.
+    tail = (total - cumulative)[::-1]
+    stop = len(lattice) + 1 - int(np.searchsorted(tail, settings.epsilon / 2, "right"))
+    stop = max(stop, start + 1)
+    if settings.max_support is not None and stop - start > settings.max_support:
+        # The window of max_support values with the most mass.
+        padded = np.concatenate(([0.0], cumulative))
+        width = settings.max_support
+        masses = padded[width:] - padded[:-width]
+        start = int(np.argmax(masses))
+        stop = start + width
+    if start == 0 and stop == len(lattice):
+        return lattice, 0
+    probs = lattice.probs[start:stop].copy()
+    left = float(np.sum(lattice.probs[:start]))
+    right = float(np.sum(lattice.probs[stop:]))
+    if settings.aggregate:
+        probs[0] += left
+        probs[-1] += right
+    return Lattice(lattice.offset + start, probs), left + right
+
+
+def _nearest(sorted_keys: list[Any], key: Any) -> Any:
+    index = int(np.searchsorted(sorted_keys, key))
+    if index == 0:
+        return sorted_keys[0]
+    if index == len(sorted_keys):
+        return sorted_keys[-1]
+    before, after = sorted_keys[index - 1], sorted_keys[index]
+    return before if key - before <= after - key else after
@@ -0,0 +1,95 @@
+import math
+import operator
+from dataclasses import dataclass
+
+import numpy as np
+
+from probs import (
+    Bernoulli,
+    Binomial,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    Geometric,
+    Laplace,
+    NegativeBinomial,
+    Poisson,
+    Uniform,
+)
+from probs.algebra import register
+
+
+def test_discrete_sums() -> None:
+    a = Poisson(lambda_=2) + Poisson(lambda_=3)
+    b = Binomial(n=3, p=0.4) + Binomial(n=5, p=0.4)
+    c = Bernoulli(p=0.3) + Bernoulli(p=0.3) + Bernoulli(p=0.3)
+    d = NegativeBinomial(r=2, p=0.3) + NegativeBinomial(r=3, p=0.3)
+
+    assert repr(a) == "Poisson(pmf={}, lambda_=5)"
+    assert repr(b) == "Binomial(pmf={}, n=8, p=0.4)"
+    assert repr(c) == "Binomial(pmf={}, n=3, p=0.3)"
+    assert repr(d) == "NegativeBinomial(pmf={}, r=5, p=0.3)"
+
+
+def test_geometric_sum() -> None:
+    x = Geometric(p=0.3) + Geometric(p=0.3)
+    k = np.arange(2.0, 30.0)
+    # P(X + Y = k) = sum over i of P(X = i) P(Y = k - i).
+    convolved = [
+        sum(0.3 * 0.7 ** (i - 1) * 0.3 * 0.7 ** (j - i - 1) for i in range(1, int(j)))
+        for j in k
+    ]
+
+    assert np.allclose([x.pdf(v) for v in k], convolved)
+    assert x.pdf(1) == 0
+    assert math.isclose(x.expectation(), 2 / 0.3)
+    assert math.isclose(x.variance(), 2 * 0.7 / 0.3**2)
+
+
+def test_continuous_sums() -> None:
+    a = Gamma(2, 3) + Gamma(1.5, 3)
+    b = Exponential(2) + Exponential(2)
+    c = Exponential(2) + Gamma(3, 2)
+
+    assert str(a) == "Gamma(α=3.5, β=3)"
+    assert str(b) == "Gamma(α=2, β=2)"
+    assert str(c) == "Gamma(α=4, β=2)"
+
+
+def test_constants() -> None:
+    assert str(Exponential(2) * 4) == "Exponential(λ=0.5)"
+    assert str(3 * Gamma(2, 3)) == "Gamma(α=2, β=1.0)"
+    assert repr(Uniform(1, 3) - 1) == "Uniform(a=0, b=2)"
+    assert repr(-2 * Uniform(1, 3)) == "Uniform(a=-6, b=-2)"
+    assert str(Laplace(1, 2) / -2) == "Laplace(μ=-0.5, b=1.0)"
+
+
+def test_falls_back() -> None:
+    a = Binomial(n=2, p=0.5) + Binomial(n=2, p=0.3)
+    b = Exponential(2) * -1
+    c = (Uniform() + Uniform()) + 1
+
+    assert "n=4" not in repr(a)
+    assert math.isclose(a.variance(), 0.5 + 0.42)
+    assert b.expectation() == -0.5
+    assert isinstance(c, Uniform)
+    assert c.expectation() == 2
+    assert math.isclose(c.pdf(1.5), 0.5)
+
+
+@dataclass(eq=False)
+class Shifted(ContinuousRV):
+    loc: float = 0
+
+    def pdf(self, x: float) -> float:  # type: ignore[override]
+        return math.exp(-(x - self.loc)) if x >= self.loc else 0
+
+
+@register(Shifted, operator.add, float)
+def _shift(x: Shifted, c: float) -> Shifted:
+    return Shifted(x.loc + c)
+
+
+def test_third_party_rule() -> None:
+    assert repr(Shifted(1) + 2) == "Shifted(loc=3)"
+    assert repr(Shifted(1) - 2) == "Shifted(loc=-1)"
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from probs import Beta, Uniform
+from probs.cache import (
+    CacheInfo,
+    cache_clear,
+    cache_info,
+    disable_cache,
+    enable_cache,
+    memoize,
+)
+
+
+def test_cache_disabled_by_default() -> None:
+    z = Uniform() + Uniform()
+
+    assert z.pdf(0.5) == z.pdf(0.5)
+    assert cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_memoize_hits() -> None:
+    z = Uniform() + Uniform()
+
+    with memoize():
+        first = z.pdf(0.5)
+        assert z.pdf(0.5) == first
+        assert cache_info() == CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+    assert cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_memoize_shared_across_expression() -> None:
+    z = Uniform() + Uniform()
+    w = z + 1
+
+    with memoize():
+        z.pdf(0.5)
+        w.pdf(1.5)
+
+        # w's own point is new, but the inner z.pdf(0.5) it needs is reused.
+        assert cache_info().hits == 1
+        assert cache_info().misses == 2
+
+
+def test_memoize_arrays_cache_each_point() -> None:
+    z = Uniform() + Uniform()
+
+    with memoize():
+        result = z.pdf(np.array([0.5, 0.5, 1.5]))
+
+        assert np.allclose(result, [0.5, 0.5, 0.5])
+        assert cache_info() == CacheInfo(hits=1, misses=2, maxsize=4096, currsize=2)
+
+
+def test_memoize_bounded() -> None:
+    z = Beta(2, 3) * 2
+
+    with memoize(maxsize=2):
+        for x in (0.1, 0.2, 0.3, 0.1):
+            z.pdf(x)
+
+        # 0.1 was the least recently used point when 0.3 was added.
+        assert cache_info() == CacheInfo(hits=0, misses=4, maxsize=2, currsize=2)
+
+
+def test_enable_resize_clear() -> None:
+    z = Beta(2, 3) * 2
+    enable_cache(maxsize=10)
+    try:
+        for x in (0.1, 0.2, 0.3):
+            z.pdf(x)
+        enable_cache(maxsize=1)
+        assert cache_info().currsize == 1
+
+        cache_clear()
+        assert cache_info() == CacheInfo(0, 0, 1, 0)
+
+        with pytest.raises(ValueError, match="maxsize"):
+            enable_cache(maxsize=0)
+    finally:
+        disable_cache()
+    assert cache_info() == CacheInfo(0, 0, 0, 0)
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pytest
+from scipy.integrate import quad  # type: ignore[import-untyped]
+
+from probs import (
+    ContinuousRV,
+    Exponential,
+    InverseGamma,
+    Laplace,
+    Lomax,
+    Normal,
+    StudentsT,
+)
+from tests.continuous.vectorized_test import DISTRIBUTIONS
+
+# Lomax has no closed form characteristic function.
+WITH_CF = tuple(rv for rv in DISTRIBUTIONS if not isinstance(rv, Lomax))
+# Their moment generating functions are infinite for every t > 0.
+HEAVY_TAILED = (InverseGamma, Lomax, StudentsT)
+
+
+def expect(
+    rv: ContinuousRV, func: np.ufunc, t: float, width: float = math.inf
+) -> float:
+    """E[func(tX)], integrated over the support within width standard deviations."""
+    lower, upper = rv.support()
+    if math.isfinite(width):
+        mean, std = rv.expectation(), math.sqrt(rv.variance())
+        lower, upper = max(lower, mean - width * std), min(upper, mean + width * std)
+    return float(quad(lambda x: func(t * x) * rv.pdf(x), lower, upper, limit=500)[0])
+
+
+@pytest.mark.parametrize("rv", WITH_CF, ids=str)
+def test_cf(rv: ContinuousRV) -> None:
+    t = np.array([-2.0, -0.5, 0.0, 0.3, 1.5])
+
+    cf = rv.cf(t)
+
+    exact = [expect(rv, np.cos, v) + 1j * expect(rv, np.sin, v) for v in t]
+    np.testing.assert_allclose(cf, exact, atol=1e-8)
+    assert rv.cf(0.3) == pytest.approx(exact[3], abs=1e-8)
+    assert isinstance(rv.cf(0.3), complex)
+
+
+@pytest.mark.parametrize(
+    "rv", [rv for rv in DISTRIBUTIONS if not isinstance(rv, HEAVY_TAILED)], ids=str
+)
+def test_cgf(rv: ContinuousRV) -> None:
+    t = np.array([-0.3, -0.1, 0.0, 0.2])
+
+    cgf = rv.cgf(t)
+
+    # Cut off where exp(tx) would overflow.
+    exact = [math.log(expect(rv, np.exp, v, width=40)) for v in t]
+    np.testing.assert_allclose(cgf, exact, rtol=1e-7, atol=1e-10)
+    assert rv.mgf(0.0) == pytest.approx(1)
+
+
+def test_cgf_outside_domain() -> None:
+    assert Exponential(2).cgf(2) == math.inf
+    assert Laplace(0, 1).cgf(np.array([-1.0, 0.5, 1.0])).tolist() == [
+        math.inf,
+        pytest.approx(-math.log(0.75)),
+        math.inf,
+    ]
+    assert StudentsT(4).cgf(0.1) == math.inf
+    assert StudentsT(4).mgf(0.1) == math.inf
+    # Heavy tails only rule out t > 0.
+    assert InverseGamma(3, 2).cgf(-1) == pytest.approx(
+        math.log(expect(InverseGamma(3, 2), np.exp, -1))
+    )
+    assert Normal(0, 1).cgf(40) == pytest.approx(800)
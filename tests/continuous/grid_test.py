@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+from scipy.stats import beta  # type: ignore[import-untyped]
+
+from probs import (
+    Beta,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    GridRV,
+    Laplace,
+    LogGridRV,
+    Lomax,
+    Normal,
+    Uniform,
+)
+from probs.continuous.grid import convolve, log_convolve
+from probs.rv import ArrayOrFloat
+
+
+def test_convolve_normal() -> None:
+    z = convolve(Normal(1, 2), Normal(3, 1))
+    expected = Normal(4, np.sqrt(5))
+    x = np.linspace(-5, 12, 50)
+
+    assert isinstance(z, GridRV)
+    assert np.allclose(z.pdf(x), expected.pdf(x), atol=1e-5)
+    assert np.max(np.abs(z.cdf(x) - expected.cdf(x))) <= z.error_bound
+    assert z.expectation() == 4
+    assert z.variance() == 5
+
+
+def test_convolve_uniform() -> None:
+    z = convolve(Uniform(), Uniform())
+
+    assert np.allclose(z.pdf(np.array([0.5, 1, 1.5])), [0.5, 1, 0.5], atol=1e-2)
+    assert z.pdf(-1) == 0
+    assert z.cdf(-1) == 0
+    assert z.cdf(3) == 1
+    assert abs(z.cdf(1) - 0.5) <= z.error_bound
+
+
+def test_convolve_subtract() -> None:
+    # The difference of two iid exponentials is Laplace distributed.
+    z = convolve(Exponential(2), Exponential(2), subtract=True)
+    x = np.linspace(-3, 3, 25)
+
+    assert np.max(np.abs(z.cdf(x) - Laplace(0, 0.5).cdf(x))) <= z.error_bound
+    assert z.expectation() == 0
+
+
+def test_convolve_nested() -> None:
+    z = convolve(convolve(Gamma(2, 3), Gamma(2, 3)), Gamma(2, 3))
+    x = np.linspace(0, 6, 25)
+
+    assert np.max(np.abs(z.cdf(x) - Gamma(6, 3).cdf(x))) <= z.error_bound
+    assert z.error_bound < 1e-3
+
+
+def test_log_convolve_singular() -> None:
+    # Beta(a, b) * Beta(a + b, c) is Beta(a, b + c), whose pdf is singular at 0.
+    z = log_convolve(Beta(0.5, 0.5), Beta(1, 2))
+    expected = Beta(0.5, 2.5)
+    x = np.linspace(0.01, 1, 50)
+
+    assert isinstance(z, LogGridRV)
+    assert np.allclose(z.pdf(x), expected.pdf(x), atol=1e-3)
+    assert np.max(np.abs(z.cdf(x) - expected.cdf(x))) <= z.error_bound
+    assert z.error_bound < 1e-4
+    assert z.pdf(0) == 0
+    assert z.cdf(-1) == 0
+    assert z.moment(1) == pytest.approx(expected.expectation(), rel=1e-3)
+    assert z.ppf(0.5) == pytest.approx(expected.ppf(0.5), rel=1e-3)
+
+
+def test_log_convolve_divide() -> None:
+    # P(X / Y <= t) = t / (t + 2) for X ~ Exponential(1) and Y ~ Exponential(2).
+    z = log_convolve(Exponential(1), Exponential(2), divide=True)
+    t = np.geomspace(1e-3, 1e3, 25)
+
+    assert np.max(np.abs(z.cdf(t) - t / (t + 2))) <= z.error_bound
+    assert z.median() == pytest.approx(2, rel=1e-4)
+
+
+def test_log_convolve_nested() -> None:
+    z = log_convolve(log_convolve(Gamma(2, 3), Lomax(2, 3)), Beta(2, 3))
+    mean = Gamma(2, 3).moment(1) * Lomax(2, 3).moment(1) * Beta(2, 3).moment(1)
+
+    assert z.expectation() == pytest.approx(mean, rel=1e-3)
+    assert z.error_bound < 1e-3
+
+
+def test_grid_rv_table_moments() -> None:
+    grid = np.linspace(-15, 17, 3201)
+    z = GridRV(grid, Normal(1, 2).pdf(grid))
+
+    assert np.isclose(z.expectation(), 1)
+    assert np.isclose(z.variance(), 4)
+    assert np.isclose(z.median(), 1)
+    assert np.isclose(z.mode(), 1)
+
+
+def test_convolve_requires_finite_variance() -> None:
+    with pytest.raises(ValueError, match="finite mean and variance"):
+        convolve(Normal(), Lomax(alpha=1.5))
+
+
+def test_tabulate_beta() -> None:
+    b = Beta(2, 3)
+    x = np.linspace(-0.5, 1.5, 41)
+    q = np.linspace(0, 1, 21)
+
+    assert b.ppf(0.5) == pytest.approx(beta.ppf(0.5, 2, 3))
+    assert b.tabulate(0, 1) is b
+
+    assert np.allclose(b.cdf(x), beta.cdf(x, 2, 3), atol=1e-9)
+    assert np.allclose(b.ppf(q), beta.ppf(q, 2, 3), atol=1e-8)
+    assert np.isclose(b.cdf(0.3), beta.cdf(0.3, 2, 3), atol=1e-9)
+    assert np.isclose(b.ppf(0.3), beta.ppf(0.3, 2, 3), atol=1e-8)
+    assert np.all(np.diff(b.cdf(np.linspace(0, 1, 1001))) >= 0)
+
+
+def test_tabulate_default_bounds() -> None:
+    n = Normal(1, 2).tabulate()
+
+    assert np.isclose(n.ppf(0.5), 1)
+    assert np.isclose(n.ppf(0.975), 1 + 2 * 1.959963984540054)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        n.ppf(1.5)
+
+
+class Triangular(ContinuousRV):
+    """The sum of two standard uniforms, with only a pdf implemented."""
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.where(np.abs(x - 1) < 1, 1 - np.abs(x - 1), 0.0)
+        return max(1 - abs(x - 1), 0)
+
+
+def test_tabulate_pdf_only() -> None:
+    z = Triangular().tabulate(0, 2)
+    x = np.linspace(0, 2, 41)
+    exact = np.where(x < 1, x**2 / 2, 1 - (2 - x) ** 2 / 2)
+
+    assert np.allclose(z.cdf(x), exact, atol=1e-9)
+    assert np.isclose(z.cdf(1), 0.5)
+    assert np.isclose(z.ppf(0.125), 0.5)
+    assert np.allclose(z.ppf(exact[1:-1]), x[1:-1])
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import ContinuousRV, Exponential, Laplace, Lomax, Normal
+from tests.continuous.vectorized_test import DISTRIBUTIONS
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_logs_match(rv: ContinuousRV) -> None:
+    x = np.linspace(0.05, 0.95, 19)
+
+    np.testing.assert_allclose(rv.logpdf(x), np.log(rv.pdf(x)))
+    # Beta's cdf is integrated numerically, whereas its logs come from scipy.
+    np.testing.assert_allclose(rv.logcdf(x), np.log(rv.cdf(x)), rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(rv.logsf(x), np.log1p(-rv.cdf(x)), rtol=1e-6, atol=1e-9)
+    assert rv.logpdf(0.5) == pytest.approx(math.log(rv.pdf(0.5)))
+    assert isinstance(rv.logcdf(0.5), float)
+
+
+def test_tails() -> None:
+    # The pdf and cdf underflow or round to 1 here, but their logs do not.
+    assert Normal(0, 1).logpdf(100) == pytest.approx(stats.norm.logpdf(100))
+    assert Normal(0, 1).logcdf(-100) == pytest.approx(stats.norm.logcdf(-100))
+    assert Normal(0, 1).logsf(100) == pytest.approx(stats.norm.logsf(100))
+    assert Exponential(2).logsf(1000) == -2000
+    assert Exponential(2).logpdf(-1) == -math.inf
+    assert Laplace(0, 1).logcdf(-1000) == pytest.approx(-math.log(2) - 1000)
+    assert Laplace(0, 1).logsf(1000) == pytest.approx(-math.log(2) - 1000)
+    assert Lomax(2, 3).logsf(1e300) == pytest.approx(
+        stats.lomax.logsf(1e300, 3, scale=2)
+    )
+
+
+def test_log_likelihood() -> None:
+    data = np.random.default_rng(0).normal(size=10**5)
+
+    # The product of these densities underflows to 0.
+    assert np.prod(Normal().pdf(data)) == 0
+    assert Normal().log_likelihood(data) == pytest.approx(
+        np.sum(stats.norm.logpdf(data))
+    )
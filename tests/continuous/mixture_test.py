@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import Exponential, Lomax, Mixture, Normal
+
+LATENCY = Mixture((Normal(10, 2), Lomax(20, 3), Exponential(0.5)), (2, 1, 1))
+
+
+def test_matches_components() -> None:
+    x = np.linspace(-5, 100, 22)
+    pdf = (
+        0.5 * stats.norm.pdf(x, 10, 2)
+        + 0.25 * stats.lomax.pdf(x, 3, scale=20)
+        + 0.25 * stats.expon.pdf(x, scale=2)
+    )
+    cdf = (
+        0.5 * stats.norm.cdf(x, 10, 2)
+        + 0.25 * stats.lomax.cdf(x, 3, scale=20)
+        + 0.25 * stats.expon.cdf(x, scale=2)
+    )
+
+    assert LATENCY.weights == (0.5, 0.25, 0.25)
+    np.testing.assert_allclose(LATENCY.pdf(x), pdf)
+    np.testing.assert_allclose(LATENCY.cdf(x), cdf)
+    np.testing.assert_allclose(LATENCY.logpdf(x), np.log(pdf))
+    assert LATENCY.cdf(12.0) == pytest.approx(float(LATENCY.cdf(np.array([12.0]))[0]))
+    assert LATENCY.support() == (-math.inf, math.inf)
+
+
+def test_log_tails() -> None:
+    # Far in the tails the pdf and sf underflow, but their logs do not.
+    x = np.array([-1e3, 1e100])
+
+    np.testing.assert_allclose(
+        LATENCY.logpdf(x),
+        [
+            math.log(0.5) + stats.norm.logpdf(-1e3, 10, 2),
+            math.log(0.25) + stats.lomax.logpdf(1e100, 3, scale=20),
+        ],
+    )
+    assert LATENCY.logsf(1e100) == pytest.approx(
+        math.log(0.25) + stats.lomax.logsf(1e100, 3, scale=20)
+    )
+    assert LATENCY.logcdf(-1e3) == pytest.approx(
+        math.log(0.5) + stats.norm.logcdf(-1e3, 10, 2)
+    )
+
+
+def test_moments() -> None:
+    means = np.array([10, 10, 2])
+    variances = np.array([4, 300, 4])
+    weights = np.array([0.5, 0.25, 0.25])
+
+    assert LATENCY.expectation() == pytest.approx(weights @ means)
+    assert LATENCY.variance() == pytest.approx(
+        weights @ (variances + means**2) - (weights @ means) ** 2
+    )
+    assert LATENCY.median() == pytest.approx(
+        float(np.median(LATENCY.sample(10**6, rng=0))), rel=0.01
+    )
+
+
+def test_sample_chooses_components() -> None:
+    mixture = Mixture((Normal(-100, 1), Normal(100, 1)), (0.2, 0.8))
+
+    samples = mixture.sample(10**5, rng=0)
+
+    assert np.mean(samples > 0) == pytest.approx(0.8, abs=0.01)
+    assert np.array_equal(samples, mixture.sample(10**5, rng=0))
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        Mixture((Normal(),), (0.5, 0.5))
+    with pytest.raises(ValueError, match="non-negative"):
+        Mixture((Normal(), Normal()), (1, -1))
+    with pytest.raises(ValueError, match="continuous"):
+        Mixture((Normal(), 1.0), (0.5, 0.5))  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from probs import (
+    Beta,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    InverseGamma,
+    Laplace,
+    Lomax,
+    Mixture,
+    Normal,
+    StudentsT,
+    Uniform,
+)
+from probs.continuous.grid import convolve
+
+DISTRIBUTIONS = (
+    Beta(2, 3),
+    Exponential(1.5),
+    Gamma(2, 3),
+    InverseGamma(5, 2),
+    Laplace(1, 2),
+    Lomax(2, 5),
+    Mixture((Normal(-2, 1), Lomax(2, 5), Exponential(1.5)), (0.5, 0.3, 0.2)),
+    Normal(1, 2),
+    StudentsT(5),
+    Uniform(-1, 2),
+)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_sample_moments(rv: ContinuousRV) -> None:
+    samples = rv.sample(200_000, rng=0)
+
+    assert samples.shape == (200_000,)
+    assert np.isclose(samples.mean(), rv.expectation(), rtol=0.02, atol=0.01)
+    assert np.isclose(samples.var(), rv.variance(), rtol=0.05)
+
+
+# Beta has no closed-form cdf, and integrating it point by point is too slow here.
+@pytest.mark.parametrize("rv", DISTRIBUTIONS[1:], ids=str)
+def test_sample_matches_cdf(rv: ContinuousRV) -> None:
+    samples = np.sort(rv.sample(2000, rng=1))
+    empirical = np.arange(1, len(samples) + 1) / len(samples)
+
+    # Kolmogorov-Smirnov distance, above the 1% critical value of ~0.036.
+    assert np.max(np.abs(rv.cdf(samples) - empirical)) < 0.05
+
+
+def test_sample_reproducible() -> None:
+    n = Normal()
+    rng = np.random.default_rng(5)
+
+    assert np.array_equal(n.sample(10, rng=3), n.sample(10, rng=3))
+    assert not np.array_equal(n.sample(10, rng=rng), n.sample(10, rng=rng))
+
+
+def test_sample_derived() -> None:
+    u, v = Uniform(), Exponential(2)
+    z = u + v
+    w = u * v - 1
+
+    assert np.isclose(z.sample(100_000, rng=0).mean(), 1, atol=0.01)
+    assert np.isclose(z.sample(100_000, rng=0).var(), 1 / 12 + 1 / 4, rtol=0.02)
+    assert np.isclose(w.sample(100_000, rng=0).mean(), -0.75, atol=0.01)
+
+
+def test_sample_by_inversion() -> None:
+    with pytest.raises(NotImplementedError):
+        ContinuousRV().sample(10)
+
+    samples = convolve(Normal(), Normal()).sample(100_000, rng=0)
+    assert np.isclose(samples.var(), 2, rtol=0.02)
+    beta = Beta(2, 3).tabulate(0, 1)
+    assert np.isclose(ContinuousRV.sample(beta, 100_000, rng=0).mean(), 0.4, atol=0.01)
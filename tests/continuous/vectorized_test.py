@@ -0,0 +1,96 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import (
+    Beta,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    InverseGamma,
+    Laplace,
+    Lomax,
+    Mixture,
+    Normal,
+    StudentsT,
+    Uniform,
+)
+
+DISTRIBUTIONS = (
+    Beta(2, 3),
+    Exponential(1.5),
+    Gamma(2, 3),
+    InverseGamma(3, 2),
+    Laplace(1, 2),
+    Lomax(2, 3),
+    Mixture((Normal(0, 1), Gamma(2, 3)), (0.3, 0.7)),
+    Normal(1, 2),
+    StudentsT(4),
+    Uniform(-1, 2),
+)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_array_matches_scalar(rv: ContinuousRV) -> None:
+    x = np.linspace(0.05, 0.95, 19)
+
+    pdf = rv.pdf(x)
+    cdf = rv.cdf(x)
+
+    assert isinstance(pdf, np.ndarray)
+    assert isinstance(cdf, np.ndarray)
+    assert np.allclose(pdf, [rv.pdf(v) for v in x.tolist()])
+    assert np.allclose(cdf, [rv.cdf(v) for v in x.tolist()])
+
+
+def test_array_keeps_shape() -> None:
+    x = np.linspace(-3, 3, 12).reshape(3, 4)
+
+    assert Normal().pdf(x).shape == (3, 4)
+    assert Uniform().cdf(x).shape == (3, 4)
+
+
+def test_normal_cdf_uses_parameters() -> None:
+    n = Normal(3, 2)
+
+    assert n.cdf(3) == 0.5
+    assert np.isclose(n.cdf(5), 0.8413447460685429)
+    assert np.allclose(n.cdf(np.array([3.0, 5.0])), [0.5, 0.8413447460685429])
+
+
+def test_gamma_uses_rate() -> None:
+    g = Gamma(2, 4)
+
+    assert np.isclose(g.pdf(0.5), 16 * 0.5 * np.exp(-2))
+    assert np.isclose(g.cdf(0.5), 1 - 3 * np.exp(-2))
+
+
+def test_derived_rv_accepts_arrays() -> None:
+    z = Uniform() + Uniform()
+    x = np.array([0.5, 1.0, 1.5])
+
+    assert np.allclose(z.pdf(x), [0.5, 1, 0.5])
+    assert np.allclose(Beta(2, 2).cdf(x[:1]), [0.5])
+
+
+@pytest.mark.parametrize(
+    ("rv", "exact"),
+    [
+        (Beta(0.5, 3), stats.beta(0.5, 3)),
+        (Gamma(0.7, 2), stats.gamma(0.7, scale=0.5)),
+        (InverseGamma(3, 2), stats.invgamma(3, scale=2)),
+        (StudentsT(1.5), stats.t(1.5)),
+    ],
+    ids=str,
+)
+def test_matches_scipy(rv: ContinuousRV, exact: Any) -> None:
+    x = np.array([-1, 0, 1e-3, 0.2, 0.5, 0.9, 1, 3, 50])
+
+    np.testing.assert_allclose(rv.pdf(x), exact.pdf(x), rtol=1e-12)
+    np.testing.assert_allclose(rv.cdf(x), exact.cdf(x), rtol=1e-12)
+    np.testing.assert_allclose(rv.logpdf(x), exact.logpdf(x), rtol=1e-12)
+    np.testing.assert_allclose(
+        [rv.pdf(v) for v in x.tolist()], exact.pdf(x), rtol=1e-12
+    )
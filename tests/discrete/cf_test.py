@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+import pytest
+
+from probs import DiscreteRV, Geometric, NegativeBinomial, Poisson
+from probs.discrete.dice_roll import DiceRoll
+from tests.discrete.vectorized_test import DISTRIBUTIONS
+
+
+def pmf(rv: DiscreteRV) -> tuple[np.ndarray, np.ndarray]:
+    """The pmf as arrays of values and probabilities, cut off at 1000."""
+    try:
+        lower, upper = rv.support()
+    except NotImplementedError:
+        lower, upper = min(rv.pmf_table()), max(rv.pmf_table())
+    k = np.arange(lower, min(upper, 1000) + 1, dtype=float)
+    return k, rv.pdf(k)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_cf(rv: DiscreteRV) -> None:
+    t = np.array([-2.0, -0.5, 0.0, 0.3, 1.5])
+    k, p = pmf(rv)
+
+    np.testing.assert_allclose(rv.cf(t), np.exp(1j * np.outer(t, k)) @ p, atol=1e-12)
+    assert isinstance(rv.cf(0.3), complex)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_cgf(rv: DiscreteRV) -> None:
+    t = np.array([-1.0, -0.1, 0.0, 0.2])
+    k, p = pmf(rv)
+
+    exact = np.log(np.exp(np.outer(t, k)) @ p)
+    np.testing.assert_allclose(rv.cgf(t), exact, rtol=1e-10, atol=1e-12)
+    assert rv.mgf(0.2) == pytest.approx(math.exp(exact[3]))
+
+
+def test_cgf_outside_domain() -> None:
+    assert Geometric(p=0.25).cgf(-math.log(0.75)) == math.inf
+    assert NegativeBinomial(r=3, p=0.4).cgf(1) == math.inf
+    # The moment generating function overflows, but its log does not.
+    assert Poisson(lambda_=2).cgf(10) == pytest.approx(2 * math.expm1(10))
+    assert Poisson(lambda_=2).mgf(1000) == math.inf
+
+
+def test_derived() -> None:
+    die = DiceRoll(sides=6)
+    t = np.array([-0.5, 0.0, 0.7])
+    total = die.sum_iid(3)
+    shifted = 2 * die + 1
+
+    np.testing.assert_allclose(total.cf(t), die.cf(t) ** 3)
+    np.testing.assert_allclose(total.cgf(t), 3 * die.cgf(t))
+    np.testing.assert_allclose(shifted.cf(t), np.exp(1j * t) * die.cf(2 * t))
+    product = die * DiceRoll(sides=4)
+    k, p = pmf(product)
+    np.testing.assert_allclose(product.cf(t), np.exp(1j * np.outer(t, k)) @ p)
@@ -0,0 +1,81 @@
+import operator
+
+import numpy as np
+import pytest
+
+from probs import DiscreteRV
+from probs.discrete.dice_roll import DiceRoll
+from probs.discrete.lattice import Lattice
+from probs.expression import node
+
+
+def random_rv(size: int, seed: int) -> DiscreteRV:
+    weights = np.random.default_rng(seed).random(size)
+    rv = DiscreteRV()
+    rv.pmf = dict(enumerate((weights / weights.sum()).tolist()))
+    return rv
+
+
+def test_from_pmf() -> None:
+    lattice = Lattice.from_pmf({3: 0.5, 5: 0.25, 4: 0.25})
+
+    assert lattice is not None
+    assert lattice.offset == 3
+    np.testing.assert_array_equal(lattice.probs, [0.5, 0.25, 0.25])
+    assert lattice.to_pmf() == {3: 0.5, 4: 0.25, 5: 0.25}
+    assert Lattice.from_pmf({}) is None
+    assert Lattice.from_pmf({0.5: 1}) is None
+    assert Lattice.from_pmf({0: 0.5, 10**9: 0.5}) is None
+
+
+def test_matches_combine_pmf() -> None:
+    a = random_rv(300, 0)
+    b = random_rv(200, 1)
+    b.pmf = {k - 50: p for k, p in b.pmf.items()}
+
+    expected_sum = DiscreteRV.combine_pmf(a.pmf, b.pmf, operator.add)
+    expected_difference = DiscreteRV.combine_pmf(a.pmf, b.pmf, operator.sub)
+
+    assert (a + b).pmf == pytest.approx(expected_sum)
+    assert (a - b).pmf == pytest.approx(expected_difference)
+
+
+def test_large_convolution() -> None:
+    a = random_rv(10**4, 2)
+    b = random_rv(10**4, 3)
+    total = a + b
+
+    assert len(total.pmf) == 2 * 10**4 - 1
+    assert sum(total.pmf.values()) == pytest.approx(1)
+    assert total.pdf(0) == pytest.approx(a.pmf[0] * b.pmf[0])
+    assert min(total.pmf.values()) >= 0
+
+
+def test_gaps() -> None:
+    a = DiscreteRV()
+    a.pmf = {0: 0.5, 2: 0.5}
+
+    assert (a + a).pmf == {0: 0.25, 2: 0.5, 4: 0.25}
+    assert (a * 3 + a).pmf == {0: 0.25, 2: 0.25, 6: 0.25, 8: 0.25}
+
+
+def test_lattice_reuse() -> None:
+    d = DiceRoll() + DiceRoll()
+    inner = node(d)
+
+    assert inner is not None
+    assert d.lattice() is inner.lattice
+    np.testing.assert_allclose(
+        d.pdf(np.array([1.0, 2.0, 7.0, 7.5])), [0, 1 / 36, 1 / 6, 0]
+    )
+
+
+def test_lattice_invalidation() -> None:
+    a = DiscreteRV()
+    a.pmf = {0: 1.0}
+    first = a.lattice()
+    a.pmf = {1: 1.0}
+
+    assert first is not None
+    assert first.offset == 0
+    assert a.lattice() is not first
@@ -0,0 +1,43 @@
+import math
+import time
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import Binomial, DiscreteRV, Geometric, Poisson
+from tests.discrete.vectorized_test import DISTRIBUTIONS
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_logs_match(rv: DiscreteRV) -> None:
+    x = np.arange(1, 10, dtype=float)
+
+    with np.errstate(divide="ignore"):
+        np.testing.assert_allclose(rv.logpdf(x), np.log(rv.pdf(x)))
+        np.testing.assert_allclose(rv.logcdf(x), np.log(rv.cdf(x)), rtol=1e-9)
+        np.testing.assert_allclose(rv.logsf(x), np.log1p(-rv.cdf(x)), rtol=1e-9)
+
+
+def test_large_parameters() -> None:
+    start = time.perf_counter()
+    binomial = Binomial(n=10**9, p=0.3)
+    poisson = Poisson(lambda_=1e6)
+
+    assert binomial.logpdf(3 * 10**8) == pytest.approx(
+        stats.binom.logpmf(3 * 10**8, 10**9, 0.3)
+    )
+    assert binomial.pdf(3 * 10**8) == pytest.approx(
+        stats.binom.pmf(3 * 10**8, 10**9, 0.3)
+    )
+    assert poisson.logpdf(10**6) == pytest.approx(stats.poisson.logpmf(10**6, 1e6))
+    assert poisson.pdf(10**6) == pytest.approx(stats.poisson.pmf(10**6, 1e6))
+    assert time.perf_counter() - start < 1
+
+
+def test_outside_support() -> None:
+    assert Binomial(n=5, p=0.5).logpdf(6) == -math.inf
+    assert Binomial(n=5, p=0.5).pdf(-1) == 0
+    assert Poisson(lambda_=2).logpdf(-1) == -math.inf
+    assert Geometric(p=0.5).logpdf(0) == -math.inf
+    assert Geometric(p=0.5).logsf(3) == pytest.approx(3 * math.log(0.5))
@@ -1,4 +1,22 @@
-from probs import DiscreteRV, Event, P
+import math
+import operator
+
+import numpy as np
+import pytest
+
+from probs import (
+    Bernoulli,
+    BetaBinomial,
+    Binomial,
+    DiscreteRV,
+    Event,
+    Geometric,
+    NegativeBinomial,
+    P,
+    Poisson,
+)
+from probs.discrete.dice_roll import DiceRoll
+from probs.rv import ArrayOrFloat
 
 
 def test_random_variable() -> None:
@@ -15,3 +33,176 @@ def test_random_variable() -> None:
 
     assert P(a == 0) == 0.4
     assert P(a != 2) == 0.9
+
+
+def test_cdf_and_quantiles() -> None:
+    a = DiscreteRV()
+    a.pmf = {2: 0.1, 0: 0.4, 1: 0.5}
+
+    assert a.cdf(-1) == 0
+    assert a.cdf(0) == pytest.approx(0.4)
+    assert a.cdf(1) == pytest.approx(0.9)
+    assert a.cdf(1.5) == pytest.approx(0.9)
+    np.testing.assert_allclose(a.cdf(np.array([-1, 0.5, 2, 3])), [0, 0.4, 1, 1])
+    assert a.ppf(0) == 0
+    assert a.ppf(0.4) == 0
+    assert a.ppf(0.41) == 1
+    assert a.ppf(1) == 2
+    assert math.isnan(a.ppf(1.5))
+    np.testing.assert_array_equal(a.ppf(np.array([0.2, 0.5, 0.95])), [0, 1, 2])
+    assert a.median() == 1
+    assert a.cdf(a.median()) >= 0.5
+    assert P(a < 1) == pytest.approx(0.4)
+    assert P(a <= 1) == pytest.approx(0.9)
+    assert P(a >= 1) == pytest.approx(0.6)
+    assert P(a > 1) == pytest.approx(0.1)
+
+    # The index is rebuilt when the pmf is replaced.
+    a.pmf = {5: 1.0}
+    assert a.cdf(6) == 1
+    assert a.median() == 5
+
+
+def test_derived_median() -> None:
+    a = DiscreteRV()
+    a.pmf = {0: 0.5, 1: 0.5}
+    b = a + a + a
+
+    assert b.median() == 1
+    assert b.ppf(0.75) == 2
+    # Negating moves which end of each step is included.
+    assert (-DiceRoll()).median() == (-DiceRoll()).ppf(0.5) == -4
+    assert (2 * DiceRoll() + 1).median() == 7
+
+
+class Untabulated(DiscreteRV):
+    """P(X = k) = 2^-(k + 1), with a truncating pdf like the families, but no pmf."""
+
+    def support(self) -> tuple[float, float]:
+        return 0, math.inf
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        pmf: ArrayOrFloat = 0.5 ** (np.trunc(x) + 1)
+        return pmf
+
+    def lattice(self) -> None:
+        return None
+
+
+def test_affine_without_pmf() -> None:
+    doubled = 2 * Untabulated()
+
+    assert doubled.pdf(4) == 0.125
+    assert doubled.pdf(3) == 0
+    assert doubled.pdf(-2) == 0
+    np.testing.assert_array_equal(
+        doubled.pdf(np.array([-2.0, 0.0, 1.0, 2.0])), [0, 0.5, 0, 0.25]
+    )
+
+
+def test_sum_iid() -> None:
+    d = DiceRoll()
+    manual = d + d + d + d + d
+    total = d.sum_iid(5)
+
+    assert isinstance(manual, DiscreteRV)
+    assert total.pmf == pytest.approx(manual.pmf)
+    assert total.expectation() == 17.5
+    assert total.variance() == pytest.approx(5 * 35 / 12)
+    assert d.sum_iid(1) is d
+    with pytest.raises(ValueError, match="at least 1"):
+        d.sum_iid(0)
+
+
+def test_sum_iid_without_lattice() -> None:
+    a = DiscreteRV()
+    a.pmf = {0.5: 0.5, 1.5: 0.5}
+
+    assert a.sum_iid(3).pmf == pytest.approx((a + a + a).pmf)
+
+
+def test_sum_iid_closed_form() -> None:
+    assert repr(Poisson(lambda_=0.5).sum_iid(7)) == "Poisson(pmf={}, lambda_=3.5)"
+    assert repr(Binomial(n=3, p=0.2).sum_iid(6)) == "Binomial(pmf={}, n=18, p=0.2)"
+
+
+@pytest.mark.parametrize(
+    "rv",
+    [
+        Binomial(n=40, p=0.3),
+        Binomial(n=10, p=1),
+        Poisson(lambda_=7.5),
+        Geometric(p=0.2),
+        NegativeBinomial(r=3.5, p=0.4),
+        BetaBinomial(n=30, alpha=0.5, beta=0.7),
+    ],
+)
+def test_parametric_pmf_table(rv: DiscreteRV) -> None:
+    table = rv.pmf_table()
+    keys = np.array(list(table), dtype=float)
+
+    assert rv.pmf == {}
+    assert rv.pmf_table() is table
+    assert sum(table.values()) == pytest.approx(1, abs=1e-12)
+    np.testing.assert_allclose(list(table.values()), rv.pdf(keys), rtol=1e-12)
+    assert rv.mode() == max(table, key=table.__getitem__)
+
+
+def test_parametric_arithmetic() -> None:
+    total = Binomial(n=10, p=0.5) + Binomial(n=5, p=0.3)
+    expected = DiscreteRV.combine_pmf(
+        {k: Binomial(n=10, p=0.5).pdf(k) for k in range(11)},
+        {k: Binomial(n=5, p=0.3).pdf(k) for k in range(6)},
+        operator.add,
+    )
+
+    assert total.pmf == pytest.approx(expected)
+    assert P(Poisson(lambda_=2) * Geometric(p=0.5) == 0) == pytest.approx(math.exp(-2))
+    assert Poisson(lambda_=4).median() == 4
+    assert NegativeBinomial(r=2, p=0.5).median() == 1
+
+
+def test_derived_cdf_matches_family() -> None:
+    b = Binomial(n=4, p=0.5)
+    k = np.arange(-1.0, 6.0)
+    die = DiceRoll()
+
+    np.testing.assert_allclose((b + 1).cdf(k + 1), b.cdf(k))
+    assert (b + 1).cdf(3) == pytest.approx(0.6875)
+    assert die.cdf(die.ppf(0.5)) >= 0.5
+    # Strict comparisons exclude the value itself, also for parametric families.
+    assert P(b < 2) == pytest.approx(0.3125)
+    assert P(b + 1 < 3) == pytest.approx(0.3125)
+    assert P(b >= 2) == pytest.approx(0.6875)
+    assert P(b > 2) == pytest.approx(0.3125)
+    assert P(b < 2.5) == pytest.approx(0.6875)
+    assert P(b >= 2.5) == pytest.approx(0.3125)
+    assert P(Geometric(p=0.3) < 1) == 0
+    assert P(Bernoulli(p=0.3) < 2) == 1
+    assert P(die < DiceRoll()) == pytest.approx(15 / 36)
+    assert P(die >= DiceRoll()) == pytest.approx(21 / 36)
+
+
+@pytest.mark.parametrize(
+    "rv",
+    [
+        Bernoulli(p=0.3),
+        Binomial(n=4, p=0.5),
+        Poisson(lambda_=2),
+        Geometric(p=0.3),
+        NegativeBinomial(r=2, p=0.5),
+        BetaBinomial(n=5, alpha=1, beta=2),
+    ],
+    ids=str,
+)
+@pytest.mark.parametrize("x", [-1.5, -1, 0.5, 2.5, 2, 7, 7.5])
+def test_comparisons_off_support(rv: DiscreteRV, x: float) -> None:
+    below = rv.cdf(math.ceil(x) - 1)
+    at = rv.cdf(x) - below
+
+    assert P(rv == x) == pytest.approx(at, abs=1e-12)
+    assert P(rv < x) == pytest.approx(below)
+    assert P(rv <= x) == pytest.approx(rv.cdf(x))
+    assert P(rv > x) == pytest.approx(1 - rv.cdf(x))
+    assert P(rv >= x) == pytest.approx(1 - below)
+    assert P(rv != x) == pytest.approx(1 - at, abs=1e-12)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from probs import (
+    Bernoulli,
+    BetaBinomial,
+    Binomial,
+    DiscreteRV,
+    Geometric,
+    NegativeBinomial,
+    Poisson,
+)
+from probs.discrete.dice_roll import DiceRoll
+
+DISTRIBUTIONS = (
+    Bernoulli(p=0.3),
+    BetaBinomial(n=10, alpha=2, beta=3),
+    Binomial(n=10, p=0.4),
+    DiceRoll(sides=6),
+    Geometric(p=0.25),
+    NegativeBinomial(r=3, p=0.4),
+    Poisson(lambda_=3.5),
+)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_sample_matches_pmf(rv: DiscreteRV) -> None:
+    samples = rv.sample(200_000, rng=0)
+    values, counts = np.unique(samples, return_counts=True)
+
+    assert samples.shape == (200_000,)
+    assert np.allclose(counts / len(samples), rv.pdf(values.astype(float)), atol=0.005)
+    assert np.isclose(samples.mean(), rv.expectation(), rtol=0.02)
+
+
+def test_sample_from_pmf() -> None:
+    a = DiscreteRV({0: 0.4, 1: 0.5, 2: 0.1})
+    samples = a.sample(100_000, rng=0)
+
+    assert set(np.unique(samples)) == {0, 1, 2}
+    assert np.isclose(np.mean(samples == 1), 0.5, atol=0.01)
+    with pytest.raises(ValueError, match="empty pmf"):
+        DiscreteRV().sample(1)
+
+
+def test_sample_derived() -> None:
+    d = DiceRoll() + DiceRoll()
+    samples = d.sample(100_000, rng=0)
+
+    assert samples.min() == 2
+    assert samples.max() == 12
+    assert np.isclose(samples.mean(), 7, atol=0.05)
+    assert np.isclose(np.mean(samples == 7), 1 / 6, atol=0.01)
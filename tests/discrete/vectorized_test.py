@@ -0,0 +1,86 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import (
+    Bernoulli,
+    BetaBinomial,
+    Binomial,
+    DiscreteRV,
+    Geometric,
+    NegativeBinomial,
+    Poisson,
+)
+from probs.discrete.dice_roll import DiceRoll
+
+DISTRIBUTIONS = (
+    Bernoulli(p=0.3),
+    BetaBinomial(n=10, alpha=2, beta=3),
+    Binomial(n=10, p=0.4),
+    DiceRoll(sides=6),
+    Geometric(p=0.25),
+    NegativeBinomial(r=3, p=0.4),
+    Poisson(lambda_=3.5),
+)
+
+
+@pytest.mark.parametrize("rv", DISTRIBUTIONS, ids=str)
+def test_pdf_array_matches_scalar(rv: DiscreteRV) -> None:
+    x = np.arange(1, 10, dtype=float)
+
+    pdf = rv.pdf(x)
+
+    assert isinstance(pdf, np.ndarray)
+    assert np.allclose(pdf, [rv.pdf(v) for v in x.tolist()])
+
+
+@pytest.mark.parametrize(
+    "rv",
+    [
+        Bernoulli(p=0.3),
+        BetaBinomial(n=10, alpha=2, beta=3),
+        DiceRoll(sides=6),
+        Geometric(p=0.25),
+    ],
+    ids=str,
+)
+def test_cdf_array_matches_scalar(rv: DiscreteRV) -> None:
+    x = np.arange(-1, 10, dtype=float)
+
+    cdf = rv.cdf(x)
+
+    assert isinstance(cdf, np.ndarray)
+    assert np.allclose(cdf, [rv.cdf(v) for v in x.tolist()])
+
+
+def test_poisson_array_large_k() -> None:
+    x = np.array([1000.0, 2000.0])
+
+    assert np.allclose(Poisson(lambda_=1000).pdf(x), [0.01261461134870819, 0])
+
+
+@pytest.mark.parametrize(
+    ("rv", "exact"),
+    [
+        (BetaBinomial(n=30, alpha=0.5, beta=4), stats.betabinom(30, 0.5, 4)),
+        (NegativeBinomial(r=2.5, p=0.3), stats.nbinom(2.5, 0.3)),
+        (Binomial(n=30, p=0.3), stats.binom(30, 0.3)),
+        # Large enough for the scalar pmf to be computed by a series.
+        (Binomial(n=300, p=0.05), stats.binom(300, 0.05)),
+        (Poisson(lambda_=12), stats.poisson(12)),
+    ],
+    ids=str,
+)
+def test_matches_scipy(rv: DiscreteRV, exact: Any) -> None:
+    x = np.arange(-2, 40, dtype=float)
+
+    np.testing.assert_allclose(rv.pdf(x), exact.pmf(x), rtol=1e-11)
+    np.testing.assert_allclose(
+        [rv.pdf(v) for v in x.tolist()], exact.pmf(x), rtol=1e-11
+    )
+    np.testing.assert_allclose(rv.cdf(x), exact.cdf(x), rtol=1e-11)
+    np.testing.assert_allclose(
+        [rv.cdf(v) for v in x.tolist()], exact.cdf(x), rtol=1e-11
+    )
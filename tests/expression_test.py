@@ -0,0 +1,242 @@
+import math
+import time
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+from scipy.integrate import quad  # type: ignore[import-untyped]
+
+from probs import (
+    Beta,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    InverseGamma,
+    Laplace,
+    LogGridRV,
+    Lomax,
+    Normal,
+    Uniform,
+)
+from probs.continuous.grid import convolve_all, gil_pelaez, invert
+from probs.discrete.dice_roll import DiceRoll
+from probs.discrete.rv import DiscreteRV
+from probs.expression import Affine, Product, Quotient, Sum, node
+from probs.instrument import instrument
+
+
+def test_long_sum() -> None:
+    start = time.perf_counter()
+    total = Uniform(0, 1)
+    for _ in range(199):
+        total += Uniform(0, 1)
+    assert time.perf_counter() - start < 1
+
+    inner = node(total)
+    assert isinstance(inner, Sum)
+    assert len(inner.terms) == 200
+    assert total.expectation() == pytest.approx(100)
+    assert total.variance() == pytest.approx(200 / 12)
+    # By the central limit theorem, this is nearly normal.
+    assert total.cdf(100) == pytest.approx(0.5, abs=1e-6)
+    assert total.cdf(102) == pytest.approx(
+        stats.norm.cdf(2, scale=math.sqrt(200 / 12)), abs=1e-3
+    )
+
+
+def test_common_subexpressions() -> None:
+    u = Uniform(0, 1)
+    v = Exponential(1)
+
+    assert node(u + v) is node(u + v)
+    assert node(u + v) is not node(v + u)
+
+
+def test_simplification() -> None:
+    z = Uniform(0, 1) + Exponential(1)
+
+    assert z + 0 is z
+    assert z * 1 is z
+    assert (z + 1) - 1 is z
+    assert repr(node(2 * (z + 1) - 3)) == f"Affine({z!r}, scale=2, shift=-1)"
+    # Shifts are pulled out of sums.
+    shifted = node((z + 1) + (Exponential(2) + 2))
+    assert isinstance(shifted, Affine)
+    assert shifted.shift == 3
+    assert isinstance(node(shifted.base), Sum)
+
+
+def test_negation() -> None:
+    x = -(DiceRoll() + DiceRoll())
+    z = -(Uniform(0, 1) + Exponential(1))
+
+    assert isinstance(x, DiscreteRV)
+    assert x.pmf[-7] == pytest.approx(6 / 36)
+    assert z.expectation() == pytest.approx(-1.5)
+
+
+def test_laziness() -> None:
+    x = DiceRoll() + DiceRoll()
+
+    assert "pmf" not in x.__dict__
+    assert x.pmf[7] == pytest.approx(6 / 36)
+    assert "pmf" in x.__dict__
+
+
+def test_discrete_operations() -> None:
+    difference = DiceRoll() - DiceRoll()
+    square = DiceRoll() ** 2
+    assert isinstance(square, DiscreteRV)
+
+    assert difference.pmf[0] == pytest.approx(6 / 36)
+    assert difference.pmf[-5] == pytest.approx(1 / 36)
+    assert difference.expectation() == pytest.approx(0)
+    assert square.pmf == pytest.approx({k**2: 1 / 6 for k in range(1, 7)})
+
+
+def test_convolve_all() -> None:
+    uniforms = convolve_all([Uniform(0, 1)] * 3)
+    # Hypoexponential distribution with rates 1, 2 and 3.
+    exponentials = convolve_all([Exponential(1), Exponential(2), Exponential(3)])
+    x = 1
+    exact = 1 - 3 * math.exp(-x) + 3 * math.exp(-2 * x) - math.exp(-3 * x)
+
+    assert uniforms.cdf(1) == pytest.approx(1 / 6, abs=uniforms.error_bound)
+    assert exponentials.cdf(x) == pytest.approx(exact, abs=exponentials.error_bound)
+
+
+def test_invert() -> None:
+    uniforms = invert([Uniform(0, 1)] * 3)
+    exponentials = invert([Exponential(1), Exponential(2), Exponential(3)])
+    x = 1
+    exact = 1 - 3 * math.exp(-x) + 3 * math.exp(-2 * x) - math.exp(-3 * x)
+
+    assert uniforms.error_bound < 1e-6
+    assert uniforms.cdf(1) == pytest.approx(1 / 6, abs=uniforms.error_bound)
+    assert uniforms.pdf(1.5) == pytest.approx(0.75, abs=1e-4)
+    assert exponentials.cdf(x) == pytest.approx(exact, abs=exponentials.error_bound)
+
+
+def test_heterogeneous_sum() -> None:
+    rng = np.random.default_rng(0)
+    terms: list[ContinuousRV] = [
+        family
+        for _ in range(10)
+        for family in (
+            Normal(rng.uniform(-1, 1), rng.uniform(0.1, 2)),
+            Uniform(0, rng.uniform(0.5, 3)),
+            Exponential(rng.uniform(0.5, 3)),
+            Gamma(rng.uniform(1, 4), rng.uniform(0.5, 3)),
+            Laplace(0, rng.uniform(0.2, 1)),
+        )
+    ]
+    start = time.perf_counter()
+    total = terms[0]
+    for term in terms[1:]:
+        total += term
+
+    inner = node(total)
+    assert isinstance(inner, Sum)
+    assert inner.fourier
+    mean, std = total.expectation(), math.sqrt(total.variance())
+    x = mean + std * np.array([-3.0, -1.0, 0.0, 2.0])
+    cdf = total.cdf(x)
+    assert time.perf_counter() - start < 1
+    # Checked against the integral of the characteristic function at each point.
+    exact = [gil_pelaez(total.cf, v, std) for v in x]
+    np.testing.assert_allclose(cdf, exact, atol=max(inner.grid.error_bound, 1e-7))
+    assert total.cdf(float(x[1])) == pytest.approx(cdf[1])
+
+
+def test_sum_without_cf() -> None:
+    lomax = Lomax(2, 5)
+    rest = Uniform(0, 1) + Exponential(1)
+    total = lomax + Uniform(0, 1) + Exponential(1)
+
+    inner = node(total)
+    assert isinstance(inner, Sum)
+    assert not inner.fourier
+    exact = quad(lambda x: lomax.pdf(x) * rest.cdf(1 - x), 0, 1)[0]
+    assert total.cdf(1) == pytest.approx(exact, abs=inner.grid.error_bound)
+
+
+def test_normal_sum() -> None:
+    z = Normal(0, 1) + Normal(1, 2) + Normal(2, 3)
+
+    assert z.expectation() == pytest.approx(3)
+    assert z.cdf(3) == pytest.approx(0.5, abs=1e-6)
+
+
+def test_carrier_log_functions() -> None:
+    # The carrier is a Normal, but its log functions must not use Normal's
+    # formulas with the carrier's (default) parameters.
+    z = Normal(0, 1) * Normal(0, 1)
+
+    assert isinstance(z, Normal)
+    assert z.logpdf(1.5) == pytest.approx(math.log(z.pdf(1.5)))
+
+
+def test_support() -> None:
+    assert (Uniform(1, 2) + Uniform(0, 3)).support() == (1, 5)
+    assert (-2 * Exponential(1) + 1).support() == (-math.inf, 1)
+    assert (Gamma(2, 1) * Beta(2, 3)).support() == (0, math.inf)
+    assert (Uniform(-1, 2) / Uniform(1, 2)).support() == (-1, 2)
+    assert (Uniform(0, 1) / Uniform(-1, 1)).support() == (-math.inf, math.inf)
+    assert (Normal(0, 1) + Uniform(0, 1)).support() == (-math.inf, math.inf)
+
+
+def test_integrals_within_support() -> None:
+    # Integrating over the whole line, quad used to miss the mass entirely.
+    far = Uniform(1000, 1001) + Uniform(0, 1)
+    assert far.pdf(1001) == pytest.approx(1)
+    assert far.pdf(999) == 0
+    assert far.cdf(1001) == pytest.approx(0.5)
+
+    z = Uniform(0, 1) + Exponential(1)
+    with instrument() as counts:
+        assert z.pdf(0.5) == pytest.approx(1 - math.exp(-0.5))
+    assert counts.integrand_evaluations < 100
+
+
+def test_positive_product() -> None:
+    x, y = Gamma(2, 3), Beta(0.5, 0.5)
+    z = x * y
+    product = node(z)
+
+    assert isinstance(product, Product)
+    assert product.positive
+    assert isinstance(product.grid, LogGridRV)
+    # The pdf of Beta(0.5, 0.5) is singular at 0.
+    exact = stats.gamma(2, scale=1 / 3).expect(
+        lambda v: stats.beta(0.5, 0.5).cdf(0.2 / v), lb=0.2
+    ) + stats.gamma(2, scale=1 / 3).cdf(0.2)
+    assert z.cdf(0.2) == pytest.approx(exact, abs=product.grid.error_bound)
+    # Moments come from the Mellin transforms of the operands, not the table.
+    assert z.expectation() == pytest.approx(x.moment(1) * y.moment(1), rel=1e-12)
+    assert z.variance() == pytest.approx(
+        x.moment(2) * y.moment(2) - z.expectation() ** 2, rel=1e-12
+    )
+    assert z.moment(-0.25) == pytest.approx(x.moment(-0.25) * y.moment(-0.25))
+    assert (z * Exponential(1)).expectation() == pytest.approx(z.expectation())
+
+
+def test_positive_quotient() -> None:
+    z = Exponential(1) / Exponential(2)
+    quotient = node(z)
+
+    assert isinstance(quotient, Quotient)
+    assert quotient.positive
+    assert z.cdf(1.5) == pytest.approx(1.5 / 3.5, abs=quotient.grid.error_bound)
+    assert z.median() == pytest.approx(2, rel=1e-4)
+    # E[1 / Y] is infinite for an exponential Y.
+    assert z.expectation() == math.inf
+
+    # 1 / InverseGamma(4, 2) is Gamma(4, 2).
+    w = Gamma(3, 1) / InverseGamma(4, 2)
+    assert w.expectation() == pytest.approx(3 * 2)
+    assert w.variance() == pytest.approx(12 * 5 - 6**2)
+
+
+def test_products_of_other_variables_are_integrated() -> None:
+    assert not node(Uniform(0, 1) * Uniform(0, 1)).positive  # type: ignore[union-attr]
+    assert not node(Normal(0, 1) * Exponential(1)).positive  # type: ignore[union-attr]
@@ -1,4 +1,10 @@
-from probs.floats import ApproxFloat, ApproxFloatRtol
+from probs.floats import (
+    ApproxFloat,
+    ApproxFloatRtol,
+    approx_get,
+    bucket,
+    neighbour_buckets,
+)
 
 
 def test_floats() -> None:
@@ -9,3 +15,32 @@ def test_floats() -> None:
     y = ApproxFloatRtol(5.01, rtol=1e-2)
     assert isinstance(y, float)
     assert y == 5.03
+
+
+def test_hashing() -> None:
+    keys = [ApproxFloat(k / 7) for k in range(1, 1000)]
+
+    # Distinct values get distinct buckets, so dicts of them stay fast.
+    assert len({bucket(key) for key in keys}) == len(keys)
+    assert len({hash(key) for key in keys}) > 0.99 * len(keys)
+    assert hash(ApproxFloat(2.0)) == hash(ApproxFloat(2.0 + 1e-15))
+    assert hash(ApproxFloat(0.0)) == hash(ApproxFloat(-0.0))
+
+
+def test_neighbouring_buckets() -> None:
+    # Values close to each other but either side of a bucket edge.
+    x = next(
+        k / 1000
+        for k in range(1000, 2000)
+        if bucket(k / 1000) != bucket(k / 1000 * (1 + 5e-10))
+    )
+    y = x * (1 + 5e-10)
+    pmf = {ApproxFloat(x): 0.5, ApproxFloat(3.0): 0.5}
+
+    assert ApproxFloat(x) == y
+    assert y not in pmf
+    assert bucket(y) in neighbour_buckets(x)
+    assert approx_get(pmf, y) == 0.5
+    assert approx_get(pmf, 3.0) == 0.5
+    assert approx_get(pmf, 3.1) is None
+    assert approx_get(pmf, -x, 0) == 0
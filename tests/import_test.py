@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import probs
+
+
+def run(code: str) -> str:
+    """Runs code in a fresh interpreter, so that no modules are already loaded."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+
+def test_import_loads_nothing() -> None:
+    # Checked by module rather than by time, which varies with the machine's load.
+    output = run(
+        "import sys\n"
+        "import probs\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in"
+        " ('numpy', 'scipy', 'probs')))"
+    )
+
+    assert output == "['probs']\n"
+
+
+def test_discrete_does_not_load_scipy() -> None:
+    output = run(
+        "import sys\n"
+        "from probs import Binomial, P\n"
+        "from probs.discrete.dice_roll import DiceRoll\n"
+        "P(DiceRoll() + DiceRoll() + DiceRoll(4) == 9)\n"
+        "print('scipy' in sys.modules)"
+    )
+
+    assert output == "False\n"
+
+
+def test_lazy_names() -> None:
+    assert set(probs.__all__) <= set(dir(probs))
+    assert probs.Normal is probs.continuous.normal.Normal
+    assert run("from probs import *; print(Gamma(2, 1).expectation())") == "2.0\n"
+
+
+def test_rules_do_not_depend_on_import_order() -> None:
+    # Adding Bernoullis must not wait for probs.discrete.binomial to be imported.
+    output = run(
+        "from probs import Bernoulli\nprint(repr(Bernoulli(p=0.3) + Bernoulli(p=0.3)))"
+    )
+
+    assert output == "Binomial(pmf={}, n=2, p=0.3)\n"
@@ -0,0 +1,62 @@
+import operator
+
+import pytest
+
+from probs import ContinuousRV, DiscreteRV, Exponential, Normal, Uniform
+from probs.discrete.dice_roll import DiceRoll
+from probs.expression import node
+from probs.instrument import current, instrument
+
+
+def test_disabled_by_default() -> None:
+    assert current() is None
+
+    with instrument() as stats:
+        assert current() is stats
+        with instrument() as inner:
+            assert current() is inner
+        assert current() is stats
+
+    assert current() is None
+
+
+def test_quad() -> None:
+    z = Uniform(0, 1) + Exponential(1)
+
+    with instrument() as stats:
+        assert z.cdf(1) == pytest.approx(0.36787944)
+        assert ContinuousRV.cdf(Normal(0, 1), 0) == pytest.approx(0.5)
+
+    assert stats.quad_calls == 2
+    assert stats.integrand_evaluations > 2
+    assert len(stats.integration_errors) == 2
+    assert max(stats.integration_errors) < 1e-8
+    assert stats.integration_warnings == 0
+    sum_node = node(z)
+    assert sum_node is not None
+    assert stats.node_calls == {(sum_node, "cdf"): 1}
+    assert stats.node_seconds[sum_node, "cdf"] > 0
+
+
+def test_discrete() -> None:
+    first = {0: 0.5, 1: 0.5}
+    second = {0: 0.25, 1: 0.25, 2: 0.5}
+
+    with instrument() as stats:
+        DiscreteRV.combine_pmf(first, second, operator.mul)
+        _ = (DiceRoll() + DiceRoll(sides=4)).pmf
+
+    assert stats.pmf_pairs == 6
+    assert stats.convolution_products == 24
+    assert "convolution products: 24" in str(stats)
+
+
+def test_nothing_recorded_outside_block() -> None:
+    z = Uniform(0, 1) + Exponential(1)
+
+    with instrument() as stats:
+        pass
+    z.cdf(2)
+
+    assert stats.quad_calls == 0
+    assert not stats.node_calls
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from probs import Bernoulli, E, Gamma, Normal, P, Uniform, Var
+from probs.montecarlo import Estimate, enable_monte_carlo, is_enabled, monte_carlo
+
+
+def test_event_probability() -> None:
+    # X / (X + Y) ~ Beta(2, 3) for equal rates, so P(X < Y) = I_0.5(2, 3) = 11 / 16.
+    x, y = Gamma(2, 1), Gamma(3, 1)
+
+    with monte_carlo(stderr=2e-3, rng=0):
+        p = P(x < y)
+        q = P(x >= y)
+
+    assert isinstance(p, Estimate)
+    assert isinstance(q, Estimate)
+    assert p.stderr <= 2e-3
+    assert p.n >= 4 * 2**14
+    assert abs(p - 11 / 16) < 4 * p.stderr
+    assert abs(q - 5 / 16) < 4 * q.stderr
+    assert not is_enabled()
+
+
+def test_event_against_constant() -> None:
+    with monte_carlo(stderr=1e-3, rng=0):
+        p = P(Normal() < 1)
+        q = P(Normal() > 1)
+        r = P(Bernoulli(p=0.3) < 1)
+
+    assert isinstance(p, Estimate)
+    assert isinstance(q, Estimate)
+    assert isinstance(r, Estimate)
+    assert abs(p - 0.8413447460685429) < 4 * p.stderr
+    assert abs(q - 0.15865525393145707) < 4 * q.stderr
+    assert abs(r - 0.7) < 4 * r.stderr
+
+
+def test_expectation_and_variance() -> None:
+    z = Uniform() + Gamma(2, 4)
+
+    with monte_carlo(stderr=1e-3, rng=1):
+        mean = E(z)
+        var = Var(z)
+
+    assert isinstance(mean, Estimate)
+    assert isinstance(var, Estimate)
+    assert abs(mean - 1) < 4 * mean.stderr
+    assert abs(var - (1 / 12 + 1 / 8)) < 4 * var.stderr
+    assert E(z) == 1
+
+
+def test_reproducible() -> None:
+    x, y = Gamma(2, 1), Gamma(3, 1)
+
+    with monte_carlo(rng=3):
+        first = P(x < y)
+    with monte_carlo(rng=3):
+        second = P(x < y)
+
+    assert isinstance(first, Estimate)
+    assert isinstance(second, Estimate)
+    assert first == second
+    assert first.n == second.n
+
+
+def test_max_samples() -> None:
+    with monte_carlo(stderr=1e-9, batch_size=1000, max_samples=10_000, rng=0):
+        p = P(Normal() < 0)
+
+    assert isinstance(p, Estimate)
+    assert p.n == 10_000
+    assert p.stderr > 1e-9
+
+
+def test_quasi_monte_carlo() -> None:
+    x, y = Gamma(2, 1).tabulate(), Gamma(3, 1).tabulate()
+
+    with monte_carlo(stderr=1e-4, qmc=True, batch_size=2**12, rng=0):
+        p = P(x < y)
+    with monte_carlo(stderr=1e-4, batch_size=2**12, rng=0):
+        q = P(x < y)
+
+    assert isinstance(p, Estimate)
+    assert isinstance(q, Estimate)
+    assert abs(p - 11 / 16) < 4 * p.stderr + 1e-6
+    # Sobol points converge faster, so far fewer samples reach the same error.
+    assert p.n < q.n
+
+
+def test_estimate_arithmetic() -> None:
+    p = Estimate(0.25, 0.01, 100)
+
+    assert 1 - p == 0.75
+    assert (1 - p).stderr == 0.01
+    assert (p + Estimate(0.5, 0.01, 50)).stderr == pytest.approx(np.sqrt(2) * 0.01)
+    assert repr(p) == "0.25 ± 0.01"
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="stderr"):
+        enable_monte_carlo(stderr=0)
+    assert not is_enabled()
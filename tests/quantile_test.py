@@ -0,0 +1,119 @@
+import math
+from typing import Any
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import (
+    Beta,
+    Binomial,
+    ContinuousRV,
+    Exponential,
+    Gamma,
+    InverseGamma,
+    Laplace,
+    Lomax,
+    NegativeBinomial,
+    Normal,
+    Poisson,
+    RandomVariable,
+    StudentsT,
+    Uniform,
+)
+from probs.rv import ArrayOrFloat
+
+Q = np.array([1e-10, 0.01, 0.25, 0.5, 0.9, 0.999])
+
+CLOSED_FORMS = (
+    (Normal(1, 2), stats.norm(1, 2)),
+    (Exponential(2), stats.expon(scale=0.5)),
+    (Uniform(1, 3), stats.uniform(1, 2)),
+    (Laplace(1, 2), stats.laplace(1, 2)),
+    (Lomax(2, 3), stats.lomax(3, scale=2)),
+    (StudentsT(3), stats.t(3)),
+    (Beta(2, 3), stats.beta(2, 3)),
+    (Gamma(2, 3), stats.gamma(2, scale=1 / 3)),
+    (InverseGamma(3, 2), stats.invgamma(3, scale=2)),
+    (Binomial(n=10, p=0.3), stats.binom(10, 0.3)),
+    (Poisson(lambda_=3), stats.poisson(3)),
+    (NegativeBinomial(r=2, p=0.3), stats.nbinom(2, 0.3)),
+)
+
+
+@pytest.mark.parametrize(("rv", "exact"), CLOSED_FORMS)
+def test_closed_forms(rv: RandomVariable, exact: Any) -> None:
+    np.testing.assert_allclose(rv.ppf(Q), exact.ppf(Q), rtol=1e-9)
+    np.testing.assert_allclose(rv.isf(Q), exact.isf(Q), rtol=1e-9)
+    assert rv.ppf(0.3) == pytest.approx(exact.ppf(0.3), rel=1e-9)
+    assert math.isnan(rv.ppf(1.5))
+
+
+class Triangular(ContinuousRV):
+    """The sum of two standard uniforms, with only a pdf implemented."""
+
+    cdf_calls = 0
+
+    def pdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        if isinstance(x, np.ndarray):
+            return np.where(np.abs(x - 1) < 1, 1 - np.abs(x - 1), 0.0)
+        return max(1 - abs(x - 1), 0)
+
+    def cdf(self, x: ArrayOrFloat) -> ArrayOrFloat:
+        self.cdf_calls += 1
+        return super().cdf(x)
+
+
+def test_root_finding() -> None:
+    z = Triangular()
+    q = np.array([0.02, 0.125, 0.5, 0.875])
+
+    np.testing.assert_allclose(z.ppf(q), [0.2, 0.5, 1, 1.5])
+    assert z.median() == pytest.approx(1)
+    assert z.isf(0.125) == pytest.approx(1.5)
+    assert z.ppf(0) == -math.inf
+    assert z.ppf(1) == math.inf
+    assert math.isnan(z.ppf(-0.1))
+
+
+def test_brackets_are_reused() -> None:
+    z = Triangular()
+    z.ppf(np.linspace(0.05, 0.95, 19))
+    calls = z.cdf_calls
+    z.ppf(np.linspace(0.1, 0.9, 9))
+
+    # Already bracketed by earlier quantiles, so no search outward is needed.
+    assert z.cdf_calls - calls < calls / 2
+
+
+def test_derived() -> None:
+    u = Uniform(0, 1) + Uniform(0, 1)
+    z = Normal(0, 1) + Uniform(0, 1) + Exponential(1)
+    q = np.linspace(0.01, 0.99, 25)
+
+    assert u.ppf(0.125) == pytest.approx(0.5)
+    np.testing.assert_allclose(z.cdf(z.ppf(q)), q, atol=1e-9)
+    assert (-Exponential(1)).ppf(0.25) == pytest.approx(-math.log(4))
+    assert (-Exponential(1)).isf(0.25) == pytest.approx(-math.log(4 / 3))
+
+
+def test_median() -> None:
+    assert Gamma(2, 1).median() == pytest.approx(stats.gamma.median(2))
+    assert InverseGamma(3, 2).median() == pytest.approx(stats.invgamma.median(3, 0, 2))
+
+
+def test_derived_median() -> None:
+    # Not the sum or product of the medians, unlike for symmetric operands.
+    total = Exponential(1) + Exponential(2)
+    product = Uniform(0, 1) * Uniform(0, 1)
+
+    assert total.cdf(total.median()) == pytest.approx(0.5)
+    assert total.median() == pytest.approx(1.2279471773)
+    assert product.cdf(product.median()) == pytest.approx(0.5)
+    # P(UV <= m) = m (1 - log m).
+    assert product.median() == pytest.approx(0.1866823088, rel=1e-6)
+
+
+def test_tail_precision() -> None:
+    assert Normal(0, 1).isf(1e-300) == pytest.approx(-stats.norm.ppf(1e-300))
+    assert Exponential(1).ppf(1e-20) == pytest.approx(1e-20)
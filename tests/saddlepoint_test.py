@@ -0,0 +1,85 @@
+import math
+from typing import Any
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore[import-untyped]
+
+from probs import (
+    Binomial,
+    Exponential,
+    Gamma,
+    Normal,
+    Poisson,
+    RandomVariable,
+    Uniform,
+    saddlepoint,
+)
+
+N = 2000
+# Each family with the exact distribution of the sum of N copies.
+SUMS = (
+    (Exponential(2), stats.gamma(N, scale=1 / 2)),
+    (Gamma(2.5, 1.5), stats.gamma(2.5 * N, scale=1 / 1.5)),
+    (Poisson(lambda_=3), stats.poisson(3 * N)),
+    (Binomial(n=10, p=0.3), stats.binom(10 * N, 0.3)),
+)
+
+
+@pytest.mark.parametrize(
+    ("rv", "exact"), SUMS, ids=[type(rv).__name__ for rv, _ in SUMS]
+)
+def test_tails(rv: RandomVariable, exact: Any) -> None:
+    mean, std = exact.mean(), exact.std()
+    x = np.floor(mean + std * np.array([-8.0, -3.0, -1.0, 0.0, 1e-4, 1.0, 3.0, 15.0]))
+
+    cdf = saddlepoint.cdf(rv, x, n=N)
+    sf = saddlepoint.sf(rv, x, n=N)
+
+    # Down to probabilities of about 1e-50, where the normal approximation is off
+    # by more than a factor of 10.
+    np.testing.assert_allclose(cdf, exact.cdf(x), rtol=1e-6)
+    np.testing.assert_allclose(sf, exact.sf(x), rtol=1e-6)
+    assert stats.norm.sf(x[-1], mean, std) < exact.sf(x[-1]) / 10
+    assert saddlepoint.sf(rv, float(x[-2]), n=N) == pytest.approx(sf[-2])
+
+
+def test_derived() -> None:
+    shifted = Poisson(lambda_=3) + 1
+    x = np.array([2500.0, 4100.0, 4500.0])
+
+    np.testing.assert_allclose(
+        saddlepoint.sf(shifted, x, n=1000),
+        stats.poisson(3000).sf(x - 1000),
+        rtol=1e-6,
+    )
+    # The sum of 1000 copies of each term.
+    total = Poisson(lambda_=3) + Binomial(n=10, p=0.3)
+    k = np.arange(10000)
+    exact = stats.poisson.pmf(k, 3000) @ stats.binom.sf(6500 - k, 10000, 0.3)
+    assert saddlepoint.sf(total, 6500.0, n=1000) == pytest.approx(exact, rel=1e-5)
+
+
+def test_outside_support() -> None:
+    assert saddlepoint.cdf(Exponential(1), -1) == 0
+    assert saddlepoint.sf(Exponential(1), 0, n=5) == 1
+    sf = saddlepoint.sf(Binomial(n=5, p=0.5), np.array([-1.0, 0.0, 9.5, 10.0]), n=2)
+    assert sf[0] == 1
+    assert sf[1] == pytest.approx(1 - 2**-10, rel=1e-3)
+    assert sf[2] == pytest.approx(2**-10, rel=0.1)
+    assert sf[3] == 0
+
+
+def test_small_n() -> None:
+    # The relative error is O(1/n), and already small for a single term.
+    assert saddlepoint.sf(Exponential(1), 5) == pytest.approx(math.exp(-5), rel=0.02)
+    assert saddlepoint.cdf(Poisson(lambda_=4), 1) == pytest.approx(
+        stats.poisson.cdf(1, 4), rel=0.02
+    )
+
+
+def test_unsupported() -> None:
+    with pytest.raises(NotImplementedError):
+        saddlepoint.sf(Uniform(0, 1), 0.9, n=10)
+    with pytest.raises(ValueError, match="n must be at least 1"):
+        saddlepoint.cdf(Normal(0, 1), 0, n=0)
@@ -0,0 +1,74 @@
+import pytest
+
+from probs import DiscreteRV
+from probs.discrete.dice_roll import DiceRoll
+from probs.expression import node
+from probs.truncation import TruncationSettings, truncation
+
+
+def geometric_tail() -> DiscreteRV:
+    x = DiscreteRV()
+    x.pmf = {k: 0.5 ** (k + 1) for k in range(60)}
+    x.pmf[60] = 0.5**60
+    return x
+
+
+def test_drop_tail_mass() -> None:
+    x = geometric_tail()
+    exact = x * x * x
+    with truncation(1e-9):
+        truncated = x * x * x
+        total = x + x + x
+
+    assert len(truncated.pmf) < len(exact.pmf) / 10
+    assert 0 < truncated.discarded_mass() <= 2e-9
+    assert sum(truncated.pmf.values()) == pytest.approx(
+        1 - truncated.discarded_mass(), abs=1e-12
+    )
+    assert truncated.cdf(100) == pytest.approx(exact.cdf(100), abs=2e-9)
+    assert 0 < total.discarded_mass() <= 1e-9
+    assert exact.discarded_mass() == 0
+    assert x.discarded_mass() == 0
+
+
+@pytest.mark.parametrize("base", [DiceRoll(), geometric_tail()], ids=["die", "tail"])
+def test_repeated_doubling_bound(base: DiscreteRV) -> None:
+    # Mass discarded from a partial sum is lost again each time it is doubled.
+    exact = base.sum_iid(200).pmf_table()
+    with truncation(1e-6):
+        truncated = base.sum_iid(200)
+    pmf = truncated.pmf_table()
+    distance = sum(abs(p - pmf.get(k, 0)) for k, p in exact.items())
+
+    assert distance > 1e-6
+    assert truncated.discarded_mass() >= distance - 1e-12
+    assert truncated.discarded_mass() < 2 * distance
+
+
+def test_aggregate() -> None:
+    with truncation(0, max_support=20, aggregate=True):
+        total = DiceRoll().sum_iid(10)
+
+    assert len(total.pmf) == 20
+    assert total.discarded_mass() > 0
+    assert sum(total.pmf.values()) == pytest.approx(1)
+    # The most likely values are kept.
+    assert min(total.pmf) < 35 < max(total.pmf)
+
+
+def test_settings_are_captured_when_built() -> None:
+    x = geometric_tail()
+    with truncation(1e-6):
+        truncated = x * x
+    exact = x * x
+
+    assert node(truncated) is not node(exact)
+    assert truncated.discarded_mass() > 0
+    assert exact.discarded_mass() == 0
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="epsilon"):
+        TruncationSettings(epsilon=1)
+    with pytest.raises(ValueError, match="max_support"):
+        TruncationSettings(max_support=0)